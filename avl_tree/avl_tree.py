@@ -40,13 +40,28 @@ class AVLTree:
     in the tree
     """
     def update_height(self):
-        pass
+        if self.node is None:
+            self.height = -1
+            return
+        heights = []
+        for child in (self.node.left, self.node.right):
+            if child is None:
+                heights.append(-1)
+            else:
+                child.update_height()
+                heights.append(child.height)
+        self.height = 1 + max(heights)
 
     """
     Updates the balance factor on the AVLTree class
     """
     def update_balance(self):
-        pass
+        if self.node is None:
+            self.balance = 0
+            return
+        left, right = self.node.left, self.node.right
+        self.balance = ((left.height if left is not None else -1) -
+                        (right.height if right is not None else -1))
 
     """
     Perform a left rotation, making the right child of this
@@ -54,7 +69,16 @@ class AVLTree:
     of the new parent. 
     """
     def left_rotate(self):
-        pass
+        old_root = self.node
+        wrapper = old_root.right
+        new_root = wrapper.node
+        old_root.right = new_root.left
+        # reuse the right child's wrapper for the old root
+        wrapper.node = old_root
+        new_root.left = wrapper
+        self.node = new_root
+        self.update_height()
+        self.update_balance()
 
     """
     Perform a right rotation, making the left child of this
@@ -62,7 +86,16 @@ class AVLTree:
     of the new parent. 
     """
     def right_rotate(self):
-        pass
+        old_root = self.node
+        wrapper = old_root.left
+        new_root = wrapper.node
+        old_root.left = new_root.right
+        # reuse the left child's wrapper for the old root
+        wrapper.node = old_root
+        new_root.right = wrapper
+        self.node = new_root
+        self.update_height()
+        self.update_balance()
 
     """
     Sets in motion the rebalancing logic to ensure the
@@ -70,7 +103,20 @@ class AVLTree:
     1 or -1
     """
     def rebalance(self):
-        pass
+        self.update_height()
+        self.update_balance()
+        if self.balance > 1:
+            left = self.node.left
+            left.update_balance()
+            if left.balance < 0:
+                left.left_rotate()
+            self.right_rotate()
+        elif self.balance < -1:
+            right = self.node.right
+            right.update_balance()
+            if right.balance > 0:
+                right.right_rotate()
+            self.left_rotate()
         
     """
     Uses the same insertion logic as a binary search tree
@@ -78,4 +124,267 @@ class AVLTree:
     if we need to rebalance
     """
     def insert(self, key):
-        pass
+        if self.node is None:
+            self.node = Node(key)
+        elif key < self.node.key:
+            if self.node.left is None:
+                self.node.left = AVLTree(Node(key))
+            else:
+                self.node.left.insert(key)
+        else:
+            if self.node.right is None:
+                self.node.right = AVLTree(Node(key))
+            else:
+                self.node.right.insert(key)
+        self.rebalance()
+
+
+"""
+The AVLTree above recomputes heights by walking whole subtrees,
+which makes every insert O(n). The classes below are the production
+version: one AVLNode per key, each caching the height of its own
+subtree. `insert` and `delete` walk down once, remembering the
+path, and then fix heights and rotate on the way back up only
+along that path, stopping as soon as a subtree's height comes out
+unchanged. Every operation is O(log n) and none of them recurse
+more than log n deep. AVLNode declares `__slots__`, so each key
+costs a single fixed-size object with no `__dict__`.
+"""
+class AVLNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        # height of the subtree rooted here; a leaf is 0
+        self.height = 0
+
+
+def _height(node):
+    return node.height if node is not None else -1
+
+
+def _update_height(node):
+    left = node.left.height if node.left is not None else -1
+    right = node.right.height if node.right is not None else -1
+    node.height = 1 + (left if left > right else right)
+
+
+def _rotate_left(node):
+    root = node.right
+    node.right = root.left
+    root.left = node
+    _update_height(node)
+    _update_height(root)
+    return root
+
+
+def _rotate_right(node):
+    root = node.left
+    node.left = root.right
+    root.right = node
+    _update_height(node)
+    _update_height(root)
+    return root
+
+
+"""Restores the AVL property at `node`, whose children are
+balanced, and returns the root of the resulting subtree."""
+def _rebalance(node):
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+"""
+A set of keys kept in an AVL tree of AVLNodes.
+"""
+class AVLSet:
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    """
+    Builds a tree from keys in ascending order in O(n), without any
+    comparisons or rotations. Repeated keys are kept once.
+    """
+    @classmethod
+    def from_sorted(cls, iterable):
+        keys = []
+        for key in iterable:
+            if keys and not keys[-1] < key:
+                if keys[-1] == key:
+                    continue
+                raise ValueError("keys are not in ascending order")
+            keys.append(key)
+        tree = cls()
+        tree.root = tree._build(keys, 0, len(keys))
+        tree.size = len(keys)
+        return tree
+
+    def _build(self, keys, start, end):
+        if start >= end:
+            return None
+        middle = (start + end) // 2
+        node = AVLNode(keys[middle])
+        node.left = self._build(keys, start, middle)
+        node.right = self._build(keys, middle + 1, end)
+        # splitting at the middle makes a subtree of m keys exactly
+        # floor(log2(m)) tall
+        node.height = (end - start).bit_length() - 1
+        return node
+
+    """
+    Adds the key. Returns False, changing nothing, if the key was
+    already in the set.
+    """
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                path.append(node)
+                node = node.left
+            elif node.key < key:
+                path.append(node)
+                node = node.right
+            else:
+                return False
+        node = AVLNode(key)
+        if not path:
+            self.root = node
+        elif key < path[-1].key:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self.size += 1
+        self._fix_path(path)
+        return True
+
+    """Removes the key, raising KeyError if it is missing."""
+    def delete(self, key):
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise KeyError(key)
+        if node.left is not None and node.right is not None:
+            # move the in-order successor's key here and remove that node
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.size -= 1
+        self._fix_path(path)
+
+    """
+    Rebalances the nodes on `path` (root first) from the bottom up,
+    reattaching each rebuilt subtree to its parent. Stops once a
+    subtree ends up as tall as it was, since nothing above it can
+    have changed.
+    """
+    def _fix_path(self, path):
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            left = node.left.height if node.left is not None else -1
+            right = node.right.height if node.right is not None else -1
+            if -1 <= left - right <= 1:
+                # still balanced: only the cached height can change
+                height = 1 + (left if left > right else right)
+                if height == node.height:
+                    return
+                node.height = height
+                continue
+            old_height = node.height
+            subtree = _rebalance(node)
+            if index == 0:
+                self.root = subtree
+            elif path[index - 1].left is node:
+                path[index - 1].left = subtree
+            else:
+                path[index - 1].right = subtree
+            if subtree.height == old_height:
+                return
+
+    def contains(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def get_max(self):
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+    def for_each(self, fn):
+        for key in self:
+            fn(key)
+
+    """
+    Yields the keys k with lo <= k < hi in ascending order, skipping
+    the subtrees that lie entirely outside the range.
+    """
+    def range(self, lo, hi):
+        stack = []
+        node = self.root
+        while True:
+            while node is not None:
+                if node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.key < hi:
+                return
+            yield node.key
+            node = node.right
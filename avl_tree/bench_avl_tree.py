@@ -0,0 +1,61 @@
+"""
+Times AVLSet on N random keys: inserting them one at a time,
+looking each up, deleting half of them, and bulk-loading the same
+keys in sorted order with `from_sorted`. The wrapper-based AVLTree
+is timed on a much smaller input for comparison, since every insert
+there recomputes heights across whole subtrees.
+
+    python bench_avl_tree.py 1000000
+"""
+import random
+import sys
+import time
+
+from avl_tree import AVLSet, AVLTree
+
+
+def timed(name, n, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {elapsed:>8.2f}s   {n / elapsed:>12,.0f} ops/sec")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+    keys = rng.sample(range(10 * n), n)
+    tree = AVLSet()
+    print(f"n = {n:,}")
+
+    def insert_all():
+        for key in keys:
+            tree.insert(key)
+
+    def contains_all():
+        for key in keys:
+            tree.contains(key)
+
+    def delete_half():
+        for key in keys[::2]:
+            tree.delete(key)
+
+    timed("AVLSet insert", n, insert_all)
+    print(f"{'':<28} height {tree.root.height}")
+    timed("AVLSet contains", n, contains_all)
+    timed("AVLSet delete half", n // 2, delete_half)
+    ordered = sorted(keys)
+    timed("AVLSet.from_sorted", n, lambda: AVLSet.from_sorted(ordered))
+
+    small = keys[:min(n, 2000)]
+
+    def wrapper_insert():
+        wrapper = AVLTree()
+        for key in small:
+            wrapper.insert(key)
+
+    timed(f"AVLTree insert (n={len(small):,})", len(small), wrapper_insert)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Runs reader threads against a single writer thread on an index of
+N keys, once per design:
+
+* persistent: the writer publishes each new PersistentAVLSet by
+  assigning it to a shared attribute; readers take whatever version
+  is published and search it with no lock.
+* locked: one mutable AVLSet guarded by a lock that both the
+  readers and the writer take for every operation.
+
+The writer alternates inserting and deleting random keys. Each
+reader looks up random keys. The benchmark reports lookups/sec
+summed over the readers, updates/sec for the writer, and the 99th
+percentile lookup latency, which includes any time spent waiting
+for the lock.
+
+    python bench_persistent_avl_tree.py --keys 1000000 --readers 4
+"""
+import argparse
+import random
+import threading
+import time
+
+from avl_tree import AVLSet
+from persistent_avl_tree import PersistentAVLSet
+
+
+class Persistent:
+    def __init__(self, keys):
+        self.tree = PersistentAVLSet.from_sorted(keys)
+
+    def lookup(self, key):
+        return key in self.tree
+
+    def update(self, key):
+        tree = self.tree
+        self.tree = tree.delete(key) if key in tree else tree.insert(key)
+
+
+class Locked:
+    def __init__(self, keys):
+        self.tree = AVLSet.from_sorted(keys)
+        self.lock = threading.Lock()
+
+    def lookup(self, key):
+        with self.lock:
+            return key in self.tree
+
+    def update(self, key):
+        with self.lock:
+            if key in self.tree:
+                self.tree.delete(key)
+            else:
+                self.tree.insert(key)
+
+
+def run(index, n, readers, seconds):
+    stop = threading.Event()
+    counts = [0] * (readers + 1)
+    latencies = [[] for _ in range(readers)]
+
+    def reader(slot):
+        rng = random.Random(slot)
+        lookup = index.lookup
+        sample = latencies[slot]
+        count = 0
+        while not stop.is_set():
+            key = rng.randrange(2 * n)
+            start = time.perf_counter_ns()
+            lookup(key)
+            if count % 16 == 0:
+                sample.append(time.perf_counter_ns() - start)
+            count += 1
+        counts[slot] = count
+
+    def writer():
+        rng = random.Random(-1)
+        count = 0
+        while not stop.is_set():
+            index.update(rng.randrange(2 * n))
+            count += 1
+        counts[readers] = count
+
+    threads = [threading.Thread(target=reader, args=(slot,))
+               for slot in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    samples = sorted(sample for slot in latencies for sample in slot)
+    p99 = samples[int(len(samples) * 0.99)] if samples else 0
+    return sum(counts[:readers]) / seconds, counts[readers] / seconds, p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--keys', type=int, default=100000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+
+    keys = range(0, 2 * args.keys, 2)
+    print(f"keys = {args.keys:,}, readers = {args.readers}, "
+          f"{args.seconds:g}s per design")
+    print(f"{'design':<12}{'lookups/sec':>14}{'updates/sec':>14}"
+          f"{'p99 lookup':>14}")
+    for name, design in [('persistent', Persistent), ('locked', Locked)]:
+        lookups, updates, p99 = run(design(keys), args.keys, args.readers,
+                                    args.seconds)
+        print(f"{name:<12}{lookups:>14,.0f}{updates:>14,.0f}"
+              f"{p99 / 1000:>11,.1f} us")
+
+
+if __name__ == '__main__':
+    main()
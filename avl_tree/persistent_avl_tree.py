@@ -0,0 +1,179 @@
+"""
+A persistent AVL tree: a PersistentAVLSet is never modified once it
+has been built. `insert` and `delete` return a new set and leave the
+old one as it was.
+
+They do that by path copying. Only the O(log n) nodes on the path
+from the root to the changed key are rebuilt, along with any nodes
+a rotation touches on the way back up. Every subtree off that path
+is shared between the old version and the new one. The nodes are
+the slotted AVLNodes from avl_tree.py, but here a node is never
+changed after it is created.
+
+That makes a version a consistent snapshot: a reader holding one
+can search or iterate it without locks while a writer builds newer
+versions. The writer publishes a version by assigning it to a
+shared attribute. The assignment is a single reference store, so
+readers see either the old version or the new one, never a mix.
+Concurrent writers still have to serialize among themselves.
+"""
+from avl_tree import AVLNode
+
+
+def _node(key, left, right):
+    node = AVLNode(key)
+    node.left = left
+    node.right = right
+    left_height = left.height if left is not None else -1
+    right_height = right.height if right is not None else -1
+    node.height = 1 + max(left_height, right_height)
+    return node
+
+
+def _height(node):
+    return node.height if node is not None else -1
+
+
+"""
+Returns a new balanced node with the given key and subtrees, whose
+heights differ by at most two, rotating (by building new nodes) if
+needed.
+"""
+def _balance(key, left, right):
+    balance = _height(left) - _height(right)
+    if balance > 1:
+        if _height(left.left) < _height(left.right):
+            pivot = left.right
+            return _node(pivot.key, _node(left.key, left.left, pivot.left),
+                         _node(key, pivot.right, right))
+        return _node(left.key, left.left, _node(key, left.right, right))
+    if balance < -1:
+        if _height(right.right) < _height(right.left):
+            pivot = right.left
+            return _node(pivot.key, _node(key, left, pivot.left),
+                         _node(right.key, pivot.right, right.right))
+        return _node(right.key, _node(key, left, right.left), right.right)
+    return _node(key, left, right)
+
+
+def _insert(node, key):
+    if node is None:
+        return _node(key, None, None)
+    if key < node.key:
+        left = _insert(node.left, key)
+        if left is node.left:
+            return node
+        return _balance(node.key, left, node.right)
+    if node.key < key:
+        right = _insert(node.right, key)
+        if right is node.right:
+            return node
+        return _balance(node.key, node.left, right)
+    return node
+
+
+def _delete(node, key):
+    if node is None:
+        raise KeyError(key)
+    if key < node.key:
+        return _balance(node.key, _delete(node.left, key), node.right)
+    if node.key < key:
+        return _balance(node.key, node.left, _delete(node.right, key))
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor = node.right
+    while successor.left is not None:
+        successor = successor.left
+    return _balance(successor.key, node.left,
+                    _delete(node.right, successor.key))
+
+
+class PersistentAVLSet:
+    __slots__ = ('root', 'size')
+
+    def __init__(self, root=None, size=0):
+        self.root = root
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    """
+    Builds a set from keys in ascending order in O(n). Repeated keys
+    are kept once.
+    """
+    @classmethod
+    def from_sorted(cls, iterable):
+        keys = []
+        for key in iterable:
+            if keys and not keys[-1] < key:
+                if keys[-1] == key:
+                    continue
+                raise ValueError("keys are not in ascending order")
+            keys.append(key)
+
+        def build(start, end):
+            if start >= end:
+                return None
+            middle = (start + end) // 2
+            return _node(keys[middle], build(start, middle),
+                         build(middle + 1, end))
+
+        return cls(build(0, len(keys)), len(keys))
+
+    """
+    Returns a set that also holds the key, sharing every unchanged
+    subtree with this one. Returns this set if the key is already
+    in it.
+    """
+    def insert(self, key):
+        root = _insert(self.root, key)
+        if root is self.root:
+            return self
+        return PersistentAVLSet(root, self.size + 1)
+
+    """
+    Returns a set without the key, sharing every unchanged subtree
+    with this one. Raises KeyError if the key is missing.
+    """
+    def delete(self, key):
+        return PersistentAVLSet(_delete(self.root, key), self.size - 1)
+
+    def contains(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def get_max(self):
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+    def for_each(self, fn):
+        for key in self:
+            fn(key)
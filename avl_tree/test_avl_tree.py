@@ -1,6 +1,8 @@
 import unittest
 from avl_tree import AVLTree
 from avl_tree import Node
+from avl_tree import AVLSet
+import random
 
 class AVLTreeTests(unittest.TestCase):
   def setUp(self):
@@ -100,5 +102,60 @@ class AVLTreeTests(unittest.TestCase):
     self.assertEqual(self.tree.node.right.node.left.node.key, 6)
     self.assertEqual(self.tree.node.right.node.right.node.key, 8) 
 
+class AVLSetTests(unittest.TestCase):
+  def check(self, tree):
+    stack = [tree.root] if tree.root is not None else []
+    while stack:
+      node = stack.pop()
+      left = node.left.height if node.left is not None else -1
+      right = node.right.height if node.right is not None else -1
+      self.assertEqual(node.height, 1 + max(left, right))
+      self.assertLessEqual(abs(left - right), 1)
+      stack.extend(child for child in (node.left, node.right) if child)
+    keys = list(tree)
+    self.assertEqual(keys, sorted(set(keys)))
+    self.assertEqual(len(tree), len(keys))
+
+  def test_insert_delete_and_search_stay_balanced(self):
+    rng = random.Random(0)
+    tree = AVLSet()
+    contents = set()
+    for _ in range(3000):
+      key = rng.randrange(500)
+      if rng.random() < 0.6:
+        self.assertEqual(tree.insert(key), key not in contents)
+        contents.add(key)
+      elif key in contents:
+        tree.delete(key)
+        contents.remove(key)
+      else:
+        with self.assertRaises(KeyError):
+          tree.delete(key)
+      self.assertEqual(key in tree, key in contents)
+    self.check(tree)
+    self.assertEqual(list(tree), sorted(contents))
+    self.assertEqual(tree.get_max(), max(contents))
+    self.assertEqual(list(tree.range(100, 200)),
+                     sorted(k for k in contents if 100 <= k < 200))
+    self.assertEqual(list(tree.range(600, 700)), [])
+
+  def test_sorted_inserts_keep_log_height(self):
+    tree = AVLSet()
+    for key in range(1 << 12):
+      tree.insert(key)
+    self.check(tree)
+    self.assertLessEqual(tree.root.height, 13)
+
+  def test_from_sorted(self):
+    tree = AVLSet.from_sorted(iter([1, 2, 2, 3, 5, 8, 13]))
+    self.check(tree)
+    self.assertEqual(list(tree), [1, 2, 3, 5, 8, 13])
+    tree.insert(4)
+    tree.delete(8)
+    self.check(tree)
+    self.assertEqual(AVLSet.from_sorted([]).get_max(), None)
+    with self.assertRaises(ValueError):
+      AVLSet.from_sorted([2, 1])
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+import unittest
+import random
+from persistent_avl_tree import PersistentAVLSet
+
+class PersistentAVLSetTests(unittest.TestCase):
+  def check(self, tree):
+    stack = [tree.root] if tree.root is not None else []
+    while stack:
+      node = stack.pop()
+      left = node.left.height if node.left is not None else -1
+      right = node.right.height if node.right is not None else -1
+      self.assertEqual(node.height, 1 + max(left, right))
+      self.assertLessEqual(abs(left - right), 1)
+      stack.extend(child for child in (node.left, node.right) if child)
+    self.assertEqual(len(tree), len(list(tree)))
+
+  def test_old_versions_are_unchanged(self):
+    rng = random.Random(0)
+    versions = [(PersistentAVLSet(), [])]
+    for _ in range(1500):
+      tree, contents = versions[-1]
+      key = rng.randrange(300)
+      if rng.random() < 0.6 or key not in contents:
+        tree = tree.insert(key)
+        contents = sorted(set(contents) | {key})
+      else:
+        tree = tree.delete(key)
+        contents = [k for k in contents if k != key]
+      versions.append((tree, contents))
+    for tree, contents in versions[::50]:
+      self.check(tree)
+      self.assertEqual(list(tree), contents)
+
+  def test_unchanged_subtrees_are_shared(self):
+    tree = PersistentAVLSet.from_sorted(range(1023))
+    newer = tree.insert(2000)
+    self.assertIs(newer.root.left, tree.root.left)
+    self.assertIs(tree.insert(5), tree)
+    self.assertNotIn(2000, tree)
+    self.assertIn(2000, newer)
+    self.assertEqual(newer.get_max(), 2000)
+    self.assertEqual(tree.get_max(), 1022)
+
+  def test_delete_missing_key(self):
+    tree = PersistentAVLSet().insert(1)
+    with self.assertRaises(KeyError):
+      tree.delete(2)
+    self.assertEqual(len(tree.delete(1)), 0)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,133 @@
+"""
+Compares the project's ordered containers at several sizes:
+BSTNode, AVLSet and the chunked SortedList.
+
+For each size N the benchmark inserts N distinct random keys one at
+a time. It then times:
+
+* contains: `--lookups` random keys, half of them present.
+* for_each: one pass over every key.
+* range: `--ranges` range queries of about 100 keys each.
+
+It reports the time of each phase. The trees need minutes per
+phase at 10^7 keys, so that size is left out of the defaults and
+has to be passed explicitly:
+
+    python benchmarks/bench_ordered_index.py --sizes 10000 1000000 10000000
+"""
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(directory, module):
+    path = os.path.join(ROOT, directory, module + '.py')
+    spec = importlib.util.spec_from_file_location(
+        f'{directory}_{module}', path)
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+binary_search_tree = load('binary_search_tree', 'binary_search_tree')
+avl_tree = load('avl_tree', 'avl_tree')
+sorted_list = load('sorted_list', 'sorted_list')
+
+
+class BSTIndex:
+    """Adapts BSTNode, which needs a first value to exist."""
+    def __init__(self):
+        self.root = None
+
+    def insert(self, key):
+        if self.root is None:
+            self.root = binary_search_tree.BSTNode(key)
+        else:
+            self.root.insert(key)
+
+    def contains(self, key):
+        return self.root.contains(key)
+
+    def for_each(self, fn):
+        self.root.for_each(fn)
+
+    def range(self, lo, hi):
+        return self.root.range(lo, hi)
+
+
+CONTAINERS = {
+    'BSTNode': BSTIndex,
+    'AVLSet': avl_tree.AVLSet,
+    'SortedList': sorted_list.SortedList,
+}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(make, keys, probes, ranges):
+    index = make()
+    insert = index.insert
+    contains = index.contains
+    results = {}
+
+    def insert_all():
+        for key in keys:
+            insert(key)
+
+    def lookup_all():
+        for key in probes:
+            contains(key)
+
+    def scan():
+        count = [0]
+
+        def visit(_):
+            count[0] += 1
+
+        index.for_each(visit)
+
+    def range_all():
+        for lo in ranges:
+            for _ in index.range(lo, lo + 200):
+                pass
+
+    results['insert'] = timed(insert_all)
+    results['contains'] = timed(lookup_all)
+    results['for_each'] = timed(scan)
+    results['range'] = timed(range_all)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 1000000])
+    parser.add_argument('--lookups', type=int, default=100000)
+    parser.add_argument('--ranges', type=int, default=1000)
+    args = parser.parse_args()
+
+    phases = ('insert', 'contains', 'for_each', 'range')
+    print(f"{'n':>12} {'container':<12}" +
+          ''.join(f"{phase:>11}" for phase in phases) + "   (seconds)")
+    for n in args.sizes:
+        rng = random.Random(n)
+        # keys are even, so odd probes miss
+        keys = [2 * key for key in rng.sample(range(n), n)]
+        probes = [rng.randrange(2 * n) for _ in range(args.lookups)]
+        ranges = [rng.randrange(2 * n) for _ in range(args.ranges)]
+        for name, make in CONTAINERS.items():
+            results = run(make, keys, probes, ranges)
+            print(f"{n:>12,} {name:<12}" +
+                  ''.join(f"{results[phase]:>11.3f}" for phase in phases))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+"""
+Measures every Queue and Stack backing in the project under
+threaded producer/consumer workloads and writes the results as
+JSON, so runs from different versions can be compared.
+
+Workloads:
+
+* spsc: one producer thread and one consumer thread.
+* mpmc: `--threads` producer threads and as many consumer threads.
+
+Each producer adds its share of N integers and each consumer
+removes values until its share has been consumed, polling when a
+non-blocking backing is empty. Backings that are not thread-safe
+are wrapped in a lock; `deque` is the GIL-atomic baseline that
+needs none. For every run the harness records:
+
+* ops_per_sec: 2 * N (one add and one remove per value) divided
+  by the wall-clock time of the run.
+* p99_latency_ns: the 99th percentile latency of a single add or
+  remove, sampled on up to `--samples` operations per thread.
+* tracemalloc_peak_bytes: the peak traced memory while filling a
+  fresh instance with N values from a single thread.
+* max_rss_kb: the process's peak resident set size after the run
+  (cumulative over the whole benchmark, Unix only).
+
+    python benchmarks/bench_queue_stack.py --sizes 1000 100000 \\
+        --output results.json
+"""
+import argparse
+import collections
+import importlib.util
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Appended rather than prepended so that `import queue` keeps meaning
+# the standard library; the exercise's queue.py is loaded by path.
+for directory in ('queue', 'stack', 'doubly_linked_list'):
+    sys.path.append(os.path.join(ROOT, directory))
+
+
+def load(directory, module):
+    path = os.path.join(ROOT, directory, module + '.py')
+    spec = importlib.util.spec_from_file_location(
+        f'{directory}_{module}', path)
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+exercise_queue = load('queue', 'queue')
+exercise_stack = load('stack', 'stack')
+from blocking_queue import BlockingQueue  # noqa: E402
+from doubly_linked_list import DoublyLinkedList  # noqa: E402
+from ring_buffer_queue import RingBufferQueue  # noqa: E402
+from typed_queue import TypedQueue  # noqa: E402
+from typed_stack import TypedStack  # noqa: E402
+from unrolled_stack import UnrolledStack  # noqa: E402
+
+
+"""
+The linked-list backings the exercise READMEs ask about, built on
+the project's DoublyLinkedList.
+"""
+class LinkedListQueue:
+    def __init__(self):
+        self.storage = DoublyLinkedList()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def enqueue(self, value):
+        self.storage.add_to_tail(value)
+
+    def dequeue(self):
+        return self.storage.remove_from_head()
+
+
+class LinkedListStack:
+    def __init__(self):
+        self.storage = DoublyLinkedList()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value):
+        self.storage.add_to_tail(value)
+
+    def pop(self):
+        return self.storage.remove_from_tail()
+
+
+class Backing:
+    def __init__(self, kind, factory, add, remove, thread_safe=False,
+                 blocking=False, max_size=None):
+        self.kind = kind
+        self.factory = factory
+        self.add = add
+        self.remove = remove
+        self.thread_safe = thread_safe
+        self.blocking = blocking
+        # sizes above this would take quadratic time
+        self.max_size = max_size
+
+    """
+    Returns add/remove callables for a new instance that are safe
+    to call from several threads.
+    """
+    def operations(self):
+        instance = self.factory()
+        add = getattr(instance, self.add)
+        remove = getattr(instance, self.remove)
+        if self.thread_safe:
+            return instance, add, remove
+        lock = threading.Lock()
+
+        def locked_add(value):
+            with lock:
+                add(value)
+
+        def locked_remove():
+            with lock:
+                return remove()
+
+        return instance, locked_add, locked_remove
+
+
+def _deque_pop(instance):
+    try:
+        return instance.pop()
+    except IndexError:
+        return None
+
+
+def _deque_popleft(instance):
+    try:
+        return instance.popleft()
+    except IndexError:
+        return None
+
+
+class DequeQueue(collections.deque):
+    dequeue = _deque_popleft
+
+
+class DequeStack(collections.deque):
+    pop_or_none = _deque_pop
+
+
+BACKINGS = {
+    'queue/list': Backing('queue', exercise_queue.Queue, 'enqueue',
+                          'dequeue', max_size=10 ** 5),
+    'queue/linked_list': Backing('queue', LinkedListQueue, 'enqueue',
+                                 'dequeue'),
+    'queue/ring_buffer': Backing('queue', RingBufferQueue, 'enqueue',
+                                 'dequeue'),
+    'queue/blocking': Backing('queue', BlockingQueue, 'enqueue', 'dequeue',
+                              thread_safe=True, blocking=True),
+    'queue/typed': Backing('queue', lambda: TypedQueue('q'), 'enqueue',
+                           'dequeue'),
+    'queue/deque': Backing('queue', DequeQueue, 'append', 'dequeue',
+                           thread_safe=True),
+    'stack/list': Backing('stack', exercise_stack.Stack, 'push', 'pop'),
+    'stack/linked_list': Backing('stack', LinkedListStack, 'push', 'pop'),
+    'stack/unrolled': Backing('stack', UnrolledStack, 'push', 'pop'),
+    'stack/typed': Backing('stack', lambda: TypedStack('q'), 'push', 'pop'),
+    'stack/deque': Backing('stack', DequeStack, 'append', 'pop_or_none',
+                           thread_safe=True),
+}
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return None
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def _shares(total, parts):
+    share, extra = divmod(total, parts)
+    return [share + (1 if i < extra else 0) for i in range(parts)]
+
+
+def run_workload(backing, n, threads, samples):
+    _, add, remove = backing.operations()
+    sample_every = max(1, (n // threads) // samples)
+    latencies = []
+    latencies_lock = threading.Lock()
+    clock = time.perf_counter_ns
+
+    def producer(count):
+        local = []
+        for i in range(count):
+            if i % sample_every:
+                add(i)
+            else:
+                start = clock()
+                add(i)
+                local.append(clock() - start)
+        with latencies_lock:
+            latencies.extend(local)
+
+    def consumer(count):
+        local = []
+        i = 0
+        while i < count:
+            if i % sample_every:
+                value = remove()
+            else:
+                start = clock()
+                value = remove()
+                elapsed = clock() - start
+                # only successful removes count; empty polls are
+                # cheaper and would pull the percentiles down
+                if value is not None:
+                    local.append(elapsed)
+            if value is None:
+                time.sleep(0)
+                continue
+            i += 1
+        with latencies_lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=producer, args=(count,))
+               for count in _shares(n, threads)]
+    workers += [threading.Thread(target=consumer, args=(count,))
+                for count in _shares(n, threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return 2 * n / elapsed, percentile(latencies, 0.99)
+
+
+def measure_memory(backing, n):
+    tracemalloc.start()
+    instance = backing.factory()
+    add = getattr(instance, backing.add)
+    for i in range(n):
+        add(i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def max_rss_kb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument('--backings', nargs='+', default=list(BACKINGS),
+                        choices=list(BACKINGS))
+    parser.add_argument('--threads', type=int, default=4,
+                        help='producers (and consumers) in the mpmc workload')
+    parser.add_argument('--samples', type=int, default=10000,
+                        help='latency samples per thread')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the tracemalloc fill pass')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        for name in args.backings:
+            backing = BACKINGS[name]
+            if backing.max_size is not None and n > backing.max_size:
+                print(f"skipping {name} at n={n:,}", file=sys.stderr)
+                continue
+            memory = None if args.no_memory else measure_memory(backing, n)
+            for workload, threads in (('spsc', 1), ('mpmc', args.threads)):
+                ops, p99 = run_workload(backing, n, threads, args.samples)
+                results.append({
+                    'backing': name,
+                    'structure': backing.kind,
+                    'workload': workload,
+                    'n': n,
+                    'threads': threads,
+                    'ops_per_sec': round(ops),
+                    'p99_latency_ns': p99,
+                    'tracemalloc_peak_bytes': memory,
+                    'max_rss_kb': max_rss_kb(),
+                })
+                print(f"{name:<18} {workload:<5} n={n:<10,} "
+                      f"{ops:>12,.0f} ops/sec  p99={p99}ns", file=sys.stderr)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
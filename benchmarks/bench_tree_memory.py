@@ -0,0 +1,85 @@
+"""
+Reports the memory footprint of the project's trees in bytes per
+key, measured with tracemalloc while each tree is built.
+
+* BSTNode: one slotted node per key, filled by inserting the keys
+  in random order.
+* AVLSet: one slotted AVLNode per key, bulk-loaded with
+  `from_sorted`.
+* AVLTree: the wrapper design, a Node plus an AVLTree object (each
+  with a `__dict__`) per key. Its inserts are O(n), so it is built
+  from at most `--wrapper-keys` keys; its cost per key does not
+  depend on the tree's size.
+
+The keys are created before tracing starts, so only the tree
+structure is counted.
+
+    python benchmarks/bench_tree_memory.py --keys 1000000
+"""
+import argparse
+import importlib.util
+import os
+import random
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(directory, module):
+    path = os.path.join(ROOT, directory, module + '.py')
+    spec = importlib.util.spec_from_file_location(
+        f'{directory}_{module}', path)
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+binary_search_tree = load('binary_search_tree', 'binary_search_tree')
+avl_tree = load('avl_tree', 'avl_tree')
+
+
+def build_bst(keys):
+    root = binary_search_tree.BSTNode(keys[0])
+    for key in keys[1:]:
+        root.insert(key)
+    return root
+
+
+def build_avl_set(keys):
+    return avl_tree.AVLSet.from_sorted(sorted(keys))
+
+
+def build_wrapper(keys):
+    tree = avl_tree.AVLTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def measure(build, keys):
+    tracemalloc.start()
+    tree = build(keys)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--keys', type=int, default=100000)
+    parser.add_argument('--wrapper-keys', type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = rng.sample(range(10 * args.keys), args.keys)
+    print(f"{'tree':<10}{'keys':>12}{'bytes/key':>12}")
+    for name, build, count in [
+            ('BSTNode', build_bst, args.keys),
+            ('AVLSet', build_avl_set, args.keys),
+            ('AVLTree', build_wrapper, min(args.keys, args.wrapper_keys))]:
+        print(f"{name:<10}{count:>12,}{measure(build, keys[:count]):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,61 +1,283 @@
 """
-Binary search trees are a data structure that enforce an ordering over 
-the data they store. That ordering in turn makes it a lot more efficient 
-at searching for a particular piece of data in the tree. 
+Binary search trees are a data structure that enforce an ordering over
+the data they store. That ordering in turn makes it a lot more efficient
+at searching for a particular piece of data in the tree.
 
 This part of the project comprises two days:
 1. Implement the methods `insert`, `contains`, `get_max`, and `for_each`
    on the BSTNode class.
 2. Implement the `in_order_print`, `bft_print`, and `dft_print` methods
    on the BSTNode class.
+
+Every operation here walks the tree with a loop and, where it has
+to come back up, an explicit stack, so a degenerate tree (for
+example one built from sorted input) of any depth never hits the
+recursion limit. The traversals are generators: `in_order`,
+`pre_order`, `post_order` and `bfs` yield values one at a time, and
+the print methods just print what they yield.
+
+Each node also keeps `size`, the number of nodes in its subtree.
+`insert` and `delete` adjust it along the path they walk, which
+lets `rank`, `select`, `floor`, `ceiling` and `range` find their
+answer by descending a single path (plus, for `range`, the values
+it yields) rather than by traversing the whole tree.
+
+BSTNode declares `__slots__`, so a node is a fixed-size object with
+no per-instance `__dict__`: one small object per key.
 """
+from collections import deque
+
+
 class BSTNode:
+    __slots__ = ('value', 'left', 'right', 'size')
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
+        # number of nodes in the subtree rooted here
+        self.size = 1
+
+    def __len__(self):
+        return self.size
 
     # Insert the given value into the tree
+    # Duplicates go to the right
+    # Sizes along the path only change once the new leaf is
+    # attached, so a comparison that raises leaves them intact
     def insert(self, value):
-        pass
+        path = []
+        node = self
+        while True:
+            path.append(node)
+            if value < node.value:
+                if node.left is None:
+                    node.left = BSTNode(value)
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = BSTNode(value)
+                    break
+                node = node.right
+        for node in path:
+            node.size += 1
+
+    # Remove one occurrence of the value from the tree
+    # Raises ValueError if the value is missing, or if it is the
+    # only value left, since the root node itself cannot go away
+    def delete(self, value):
+        path = []
+        node = self
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            raise ValueError(f"{value!r} is not in the tree")
+        if node is self and self.size == 1:
+            raise ValueError("cannot delete the last value of a tree")
+        if node.left is not None and node.right is not None:
+            # take the in-order successor's value and delete that node
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+        for ancestor in path:
+            ancestor.size -= 1
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.value = child.value
+            self.left = child.left
+            self.right = child.right
+            self.size = child.size
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
 
     # Return True if the tree contains the value
     # False if it does not
     def contains(self, target):
-        pass
+        node = self
+        while node is not None:
+            if target == node.value:
+                return True
+            node = node.left if target < node.value else node.right
+        return False
 
     # Return the maximum value found in the tree
     def get_max(self):
-        pass
+        node = self
+        while node.right is not None:
+            node = node.right
+        return node.value
 
     # Call the function `fn` on the value of each node
     def for_each(self, fn):
-        pass
+        for value in self.pre_order():
+            fn(value)
+
+    # Order statistics ------------------
+
+    # Return the number of values less than x
+    def rank(self, x):
+        rank = 0
+        node = self
+        while node is not None:
+            if x <= node.value:
+                node = node.left
+            else:
+                rank += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+        return rank
+
+    # Return the value at index k (from 0) of the sorted values
+    def select(self, k):
+        if not 0 <= k < self.size:
+            raise IndexError("select index out of range")
+        node = self
+        while True:
+            left_size = node.left.size if node.left is not None else 0
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    # Return the largest value <= x, or None if there is none
+    def floor(self, x):
+        best = None
+        node = self
+        while node is not None:
+            if node.value <= x:
+                best = node.value
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    # Return the smallest value >= x, or None if there is none
+    def ceiling(self, x):
+        best = None
+        node = self
+        while node is not None:
+            if node.value >= x:
+                best = node.value
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    # Yield the values v with lo <= v < hi, from low to high,
+    # skipping the subtrees that lie entirely outside the range
+    def range(self, lo, hi):
+        stack = []
+        node = self
+        while True:
+            while node is not None:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
+
+    # Traversals ------------------------
+
+    # Yield all the values in order from low to high
+    def in_order(self):
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    # Yield each node's value before the values of its subtrees,
+    # left subtree first
+    def pre_order(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    # Yield each node's value after the values of its subtrees,
+    # left subtree first
+    def post_order(self):
+        stack = []
+        node = self
+        last = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.value
+                last = stack.pop()
+
+    # Yield the values level by level, left to right
+    def bfs(self):
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
 
     # Part 2 -----------------------
 
     # Print all the values in order from low to high
-    # Hint:  Use a recursive, depth first traversal
     def in_order_print(self, node):
-        pass
+        for value in node.in_order():
+            print(value)
 
     # Print the value of every node, starting with the given node,
     # in an iterative breadth first traversal
     def bft_print(self, node):
-        pass
+        for value in node.bfs():
+            print(value)
 
     # Print the value of every node, starting with the given node,
     # in an iterative depth first traversal
     def dft_print(self, node):
-        pass
+        for value in node.pre_order():
+            print(value)
 
     # Stretch Goals -------------------------
     # Note: Research may be required
 
-    # Print Pre-order recursive DFT
+    # Print Pre-order DFT
     def pre_order_dft(self, node):
-        pass
+        for value in node.pre_order():
+            print(value)
 
-    # Print Post-order recursive DFT
+    # Print Post-order DFT
     def post_order_dft(self, node):
-        pass
+        for value in node.post_order():
+            print(value)
+
+
+BinarySearchTree = BSTNode
@@ -107,5 +107,99 @@ class BinarySearchTreeTests(unittest.TestCase):
 
         sys.stdout = stdout_  # Restore stdout
 
+    def test_traversal_generators(self):
+        self.bst = BinarySearchTree(1)
+        for value in [8, 5, 7, 6, 3, 4, 2]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst.in_order()), [1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(list(self.bst.pre_order()), [1, 8, 5, 3, 2, 4, 7, 6])
+        self.assertEqual(list(self.bst.post_order()), [2, 4, 3, 6, 7, 5, 8, 1])
+        self.assertEqual(list(self.bst.bfs()), [1, 8, 5, 3, 7, 2, 4, 6])
+
+        traversal = self.bst.in_order()
+        self.assertEqual(next(traversal), 1)
+        self.assertEqual(next(traversal), 2)
+
+    def test_delete(self):
+        for value in [2, 3, 7, 6, 8]:
+            self.bst.insert(value)
+        self.bst.delete(7)
+        self.assertEqual(list(self.bst.in_order()), [2, 3, 5, 6, 8])
+        self.bst.delete(5)
+        self.assertEqual(list(self.bst.in_order()), [2, 3, 6, 8])
+        self.assertEqual(self.bst.value, 6)
+        with self.assertRaises(ValueError):
+            self.bst.delete(5)
+
+        self.bst = BinarySearchTree(1)
+        self.bst.insert(0)
+        self.bst.delete(1)
+        self.assertEqual(list(self.bst.in_order()), [0])
+        with self.assertRaises(ValueError):
+            self.bst.delete(0)
+
+    def test_order_statistics_track_inserts_and_deletes(self):
+        rng = random.Random(0)
+        self.bst = BinarySearchTree(50)
+        contents = [50]
+        for _ in range(2000):
+            if rng.random() < 0.6 or len(contents) == 1:
+                value = rng.randrange(100)
+                self.bst.insert(value)
+                contents.append(value)
+            else:
+                value = rng.choice(contents)
+                self.bst.delete(value)
+                contents.remove(value)
+            contents.sort()
+            self.assertEqual(len(self.bst), len(contents))
+            x = rng.randrange(-5, 105)
+            self.assertEqual(self.bst.rank(x), sum(v < x for v in contents))
+            k = rng.randrange(len(contents))
+            self.assertEqual(self.bst.select(k), contents[k])
+            below = [v for v in contents if v <= x]
+            above = [v for v in contents if v >= x]
+            self.assertEqual(self.bst.floor(x), below[-1] if below else None)
+            self.assertEqual(self.bst.ceiling(x), above[0] if above else None)
+            lo, hi = sorted(rng.randrange(-5, 105) for _ in range(2))
+            self.assertEqual(list(self.bst.range(lo, hi)),
+                             [v for v in contents if lo <= v < hi])
+        with self.assertRaises(IndexError):
+            self.bst.select(len(contents))
+
+    def test_failed_insert_leaves_sizes_unchanged(self):
+        for value in [3, 8]:
+            self.bst.insert(value)
+        with self.assertRaises(TypeError):
+            self.bst.insert(None)
+        self.assertEqual(len(self.bst), 3)
+        self.assertEqual(self.bst.select(2), 8)
+        with self.assertRaises(IndexError):
+            self.bst.select(3)
+
+    def test_deep_tree_does_not_recurse(self):
+        size = sys.getrecursionlimit() * 20
+        # build the right-leaning chain bottom-up, since inserting
+        # sorted values one by one would take quadratic time
+        node = None
+        for value in range(size - 1, -1, -1):
+            parent = BinarySearchTree(value)
+            parent.right = node
+            parent.size = size - value
+            node = parent
+        self.bst = node
+        self.bst.insert(size)
+        self.assertEqual(len(self.bst), size + 1)
+        self.assertEqual(self.bst.select(size), size)
+        self.assertTrue(self.bst.contains(size))
+        self.assertFalse(self.bst.contains(-1))
+        self.assertEqual(self.bst.get_max(), size)
+        arr = []
+        self.bst.for_each(arr.append)
+        self.assertEqual(len(arr), size + 1)
+        self.assertEqual(sum(1 for _ in self.bst.in_order()), size + 1)
+        self.assertEqual(next(self.bst.post_order()), size)
+        self.assertEqual(sum(1 for _ in self.bst.bfs()), size + 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+"""
+Builds a BPlusTree file of N random keys, closes it, and then
+times:
+
+* reopen: opening the file again, which only reads the header.
+* get (cold): random lookups right after reopening, which decode
+  pages through the LRU page cache as they are first touched.
+* get (warm): the same lookups again.
+* range: `--ranges` range scans of about 100 keys each.
+
+Building the file is timed too, for comparison with the start-up
+cost it replaces.
+
+    python bench_bplus_tree.py --keys 1000000 --cache-pages 4096
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from bplus_tree import BPlusTree
+
+
+def timed(name, count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = f"{count / elapsed:>12,.0f} ops/sec" if count else ''
+    print(f"{name:<14} {elapsed:>10.4f}s {rate}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--keys', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=100000)
+    parser.add_argument('--ranges', type=int, default=1000)
+    parser.add_argument('--cache-pages', type=int, default=4096)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = rng.sample(range(2 * args.keys), args.keys)
+    probes = [rng.randrange(2 * args.keys) for _ in range(args.lookups)]
+    starts = [rng.randrange(2 * args.keys) for _ in range(args.ranges)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.db')
+        tree = BPlusTree(path, cache_pages=args.cache_pages)
+
+        def build():
+            for key in keys:
+                tree.insert(key, key.to_bytes(8, 'little'))
+            tree.close()
+
+        print(f"keys = {args.keys:,}")
+        timed("build", args.keys, build)
+        print(f"{'file size':<14} {os.path.getsize(path):>10,} bytes")
+
+        opened = []
+        timed("reopen", 0, lambda: opened.append(
+            BPlusTree(path, cache_pages=args.cache_pages)))
+        tree = opened[0]
+
+        def lookups():
+            get = tree.get
+            for key in probes:
+                get(key)
+
+        def ranges():
+            for lo in starts:
+                for _ in tree.range(lo, lo + 200):
+                    pass
+
+        timed("get (cold)", args.lookups, lookups)
+        timed("get (warm)", args.lookups, lookups)
+        timed("range", args.ranges, ranges)
+        tree.close()
+
+
+if __name__ == '__main__':
+    main()
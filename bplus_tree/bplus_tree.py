@@ -0,0 +1,363 @@
+"""
+A disk-backed ordered map: a B+tree stored in fixed-size pages of a
+file that is opened with `mmap`.
+
+Keys are signed 64-bit integers. Values are byte strings of at most
+`value_size` bytes. Page 0 is a header that records the page size,
+the value size, the root page, the number of pages and the number
+of entries. Every other page is one of two kinds:
+
+* A leaf page holds up to `leaf_capacity` sorted keys, the
+  lengths of their values, the values (each padded to
+  `value_size` bytes), and the number of the next leaf. Each part
+  is a packed array, so a page is decoded with a few slices. The
+  chained leaves let `range` walk the keys in order without going
+  back up the tree.
+* An internal page holds up to `internal_capacity` separator keys
+  and one more child page number than keys. Child i holds the keys
+  below keys[i], and child i + 1 holds the keys from keys[i] up.
+
+Opening a file reads the header and nothing else, so start-up takes
+the same time whatever the tree's size. Pages are decoded on first
+use into Page objects, which are kept in an LRUCache of
+`cache_pages` pages. Only the pages a lookup actually touches are
+ever read. Changes are written through to the mapped file as soon
+as they are made, so evicting a page from the cache just drops the
+decoded copy. `flush` asks the OS to write the mapped pages to
+disk.
+
+`insert` splits full pages on the way back up, as in any B+tree.
+`delete` removes the entry from its leaf but never merges pages
+that become sparse. That keeps deletes to a single page write, at
+the cost of space when most keys are deleted.
+"""
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+from lru_cache import LRUCache
+
+MAGIC = b'BPT1'
+# magic, page size, value size, root page, page count, entry count
+HEADER = struct.Struct('<4sIIIIQ')
+# page kind, key count, next leaf (unused by internal pages)
+PAGE_HEADER = struct.Struct('<BHI')
+PAGE_HEADER_SIZE = 8
+INTERNAL, LEAF = 0, 1
+NO_PAGE = 0
+MIN_KEY, MAX_KEY = -(1 << 63), (1 << 63) - 1
+
+
+"""
+The decoded contents of one page. Leaves use `values` and `next`;
+internal pages use `children`.
+"""
+class Page:
+    __slots__ = ('number', 'leaf', 'keys', 'values', 'children', 'next')
+
+    def __init__(self, number, leaf, keys, values=None, children=None,
+                 next=NO_PAGE):
+        self.number = number
+        self.leaf = leaf
+        self.keys = keys
+        self.values = values
+        self.children = children
+        self.next = next
+
+
+class BPlusTree:
+    def __init__(self, path, page_size=4096, value_size=32, cache_pages=256):
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if new:
+            self._configure(page_size, value_size)
+        self.file = open(path, 'w+b' if new else 'r+b')
+        if new:
+            self.file.truncate(2 * page_size)
+            self.map = mmap.mmap(self.file.fileno(), 2 * page_size)
+            self.root = 1
+            self.page_count = 2
+            self.size = 0
+            self._write(Page(1, True, [], values=[]))
+            self._write_header()
+        else:
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            magic, page_size, value_size, self.root, self.page_count, \
+                self.size = HEADER.unpack_from(self.map, 0)
+            if magic != MAGIC:
+                self.close()
+                raise ValueError(f"{path} is not a B+tree file")
+            self._configure(page_size, value_size)
+        self.cache = LRUCache(limit=cache_pages)
+
+    def _configure(self, page_size, value_size):
+        if not 0 < value_size <= 0xFFFF:
+            # value lengths are stored as unsigned 16-bit integers
+            raise ValueError("value_size must be between 1 and 65535")
+        self.page_size = page_size
+        self.value_size = value_size
+        self.leaf_capacity = (page_size - PAGE_HEADER_SIZE) // (10 + value_size)
+        self.internal_capacity = (page_size - PAGE_HEADER_SIZE - 4) // 12
+        if self.leaf_capacity < 3 or self.internal_capacity < 3:
+            raise ValueError("page_size is too small for value_size")
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __iter__(self):
+        for key, _ in self.items():
+            yield key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Pages ------------------------------
+
+    def _page(self, number):
+        page = self.cache.get(number)
+        if page is None:
+            page = self._read(number)
+            self.cache.set(number, page)
+        return page
+
+    def _read(self, number):
+        view = self.map
+        base = number * self.page_size
+        kind, count, next_leaf = PAGE_HEADER.unpack_from(view, base)
+        start = base + PAGE_HEADER_SIZE
+        keys = array('q', view[start:start + 8 * count]).tolist()
+        if kind == LEAF:
+            start += 8 * self.leaf_capacity
+            lengths = array('H', view[start:start + 2 * count])
+            start += 2 * self.leaf_capacity
+            size = self.value_size
+            blob = view[start:start + size * count]
+            values = [blob[offset:offset + length] for offset, length
+                      in zip(range(0, size * count, size), lengths)]
+            return Page(number, True, keys, values=values, next=next_leaf)
+        start += 8 * self.internal_capacity
+        children = array('I', view[start:start + 4 * (count + 1)]).tolist()
+        return Page(number, False, keys, children=children)
+
+    """
+    Encodes the page into the file. For a leaf, only the entries
+    from index `first` up to `last` are rewritten, since an insert
+    or delete only moves the entries after it.
+    """
+    def _write(self, page, first=0, last=None):
+        base = page.number * self.page_size
+        count = len(page.keys)
+        self.map[base:base + PAGE_HEADER_SIZE] = PAGE_HEADER.pack(
+            LEAF if page.leaf else INTERNAL, count, page.next).ljust(
+                PAGE_HEADER_SIZE, b'\0')
+        start = base + PAGE_HEADER_SIZE
+        if not page.leaf:
+            self.map[start:start + 8 * count] = array('q', page.keys).tobytes()
+            start += 8 * self.internal_capacity
+            children = array('I', page.children).tobytes()
+            self.map[start:start + len(children)] = children
+            return
+        if last is None:
+            last = count
+        keys = array('q', page.keys[first:last]).tobytes()
+        offset = start + 8 * first
+        self.map[offset:offset + len(keys)] = keys
+        start += 8 * self.leaf_capacity
+        values = page.values[first:last]
+        lengths = array('H', map(len, values)).tobytes()
+        offset = start + 2 * first
+        self.map[offset:offset + len(lengths)] = lengths
+        start += 2 * self.leaf_capacity
+        size = self.value_size
+        slots = b''.join([value.ljust(size, b'\0') for value in values])
+        offset = start + size * first
+        self.map[offset:offset + len(slots)] = slots
+
+    def _write_header(self):
+        self.map[:HEADER.size] = HEADER.pack(
+            MAGIC, self.page_size, self.value_size, self.root,
+            self.page_count, self.size)
+
+    """Returns a new page number, growing the file if needed."""
+    def _allocate(self):
+        number = self.page_count
+        self.page_count += 1
+        needed = self.page_count * self.page_size
+        if needed > len(self.map):
+            length = max(needed, 2 * len(self.map))
+            self.map.close()
+            self.file.truncate(length)
+            self.map = mmap.mmap(self.file.fileno(), length)
+        return number
+
+    """Returns the leaf that would hold the key and the internal
+    pages above it, root first."""
+    def _find_leaf(self, key):
+        path = []
+        page = self._page(self.root)
+        while not page.leaf:
+            path.append(page)
+            page = self._page(page.children[bisect_right(page.keys, key)])
+        return page, path
+
+    # Map operations ---------------------
+
+    """
+    Stores the value under the key, replacing any value already
+    there.
+    """
+    def insert(self, key, value):
+        # check everything before the cached page changes, so a bad
+        # key or value cannot leave it out of step with the file
+        if not isinstance(key, int):
+            raise TypeError(f"keys must be int, not {type(key).__name__}")
+        if not MIN_KEY <= key <= MAX_KEY:
+            raise OverflowError("keys must fit in a signed 64-bit integer")
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"values must be bytes-like, not {type(value).__name__}")
+        value = bytes(value)
+        if len(value) > self.value_size:
+            raise ValueError(f"values are limited to {self.value_size} bytes")
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.values[index] = value
+            self._write(leaf, index, index + 1)
+            return
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, value)
+        self.size += 1
+        if len(leaf.keys) <= self.leaf_capacity:
+            self._write(leaf, index)
+        else:
+            self._split_leaf(leaf, path)
+        self._write_header()
+
+    def _split_leaf(self, leaf, path):
+        half = len(leaf.keys) // 2
+        right = Page(self._allocate(), True, leaf.keys[half:],
+                     values=leaf.values[half:], next=leaf.next)
+        del leaf.keys[half:]
+        del leaf.values[half:]
+        leaf.next = right.number
+        self._write(right)
+        self._write(leaf)
+        self.cache.set(right.number, right)
+        self._insert_separator(path, leaf, right.keys[0], right)
+
+    """Adds the separator and right sibling of a page that split to
+    its parent, splitting parents in turn as they fill up."""
+    def _insert_separator(self, path, left, separator, right):
+        while path:
+            parent = path.pop()
+            index = bisect_right(parent.keys, separator)
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right.number)
+            if len(parent.keys) <= self.internal_capacity:
+                self._write(parent)
+                return
+            half = len(parent.keys) // 2
+            separator = parent.keys[half]
+            sibling = Page(self._allocate(), False, parent.keys[half + 1:],
+                           children=parent.children[half + 1:])
+            del parent.keys[half:]
+            del parent.children[half + 1:]
+            self._write(sibling)
+            self._write(parent)
+            self.cache.set(sibling.number, sibling)
+            left, right = parent, sibling
+        root = Page(self._allocate(), False, [separator],
+                    children=[left.number, right.number])
+        self._write(root)
+        self.cache.set(root.number, root)
+        self.root = root.number
+
+    """Removes the key and its value, raising KeyError if the key is
+    missing."""
+    def delete(self, key):
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            raise KeyError(key)
+        del leaf.keys[index]
+        del leaf.values[index]
+        self._write(leaf, index)
+        self.size -= 1
+        self._write_header()
+
+    def get(self, key, default=None):
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return default
+
+    def contains(self, key):
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+
+    """Returns the largest key, or None if the map is empty."""
+    def get_max(self):
+        # right to left, since deletes can leave leaves empty
+        stack = [self.root]
+        while stack:
+            page = self._page(stack.pop())
+            if not page.leaf:
+                stack.extend(page.children)
+            elif page.keys:
+                return page.keys[-1]
+        return None
+
+    """
+    Yields the (key, value) pairs with lo <= key < hi in ascending
+    key order, reading only the leaves that hold them.
+    """
+    def range(self, lo, hi):
+        leaf, _ = self._find_leaf(lo)
+        index = bisect_left(leaf.keys, lo)
+        while True:
+            keys = leaf.keys
+            values = leaf.values
+            while index < len(keys):
+                if not keys[index] < hi:
+                    return
+                yield keys[index], values[index]
+                index += 1
+            if leaf.next == NO_PAGE:
+                return
+            leaf = self._page(leaf.next)
+            index = 0
+
+    """Yields every (key, value) pair in ascending key order."""
+    def items(self):
+        page = self._page(self.root)
+        while not page.leaf:
+            page = self._page(page.children[0])
+        while True:
+            yield from zip(page.keys, page.values)
+            if page.next == NO_PAGE:
+                return
+            page = self._page(page.next)
+
+    # Call the function `fn` on each key and its value, in order
+    def for_each(self, fn):
+        for key, value in self.items():
+            fn(key, value)
+
+    def flush(self):
+        self.map.flush()
+
+    def close(self):
+        if not self.map.closed:
+            self.map.flush()
+            self.map.close()
+        self.file.close()
@@ -0,0 +1,106 @@
+import os
+import random
+import tempfile
+import unittest
+from bplus_tree import BPlusTree
+
+
+class BPlusTreeTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'index.db')
+        # small pages and cache so splits and evictions happen early
+        self.tree = BPlusTree(self.path, page_size=128, value_size=8,
+                              cache_pages=4)
+        self.addCleanup(lambda: self.tree.close())
+
+    def test_insert_get_and_replace(self):
+        self.assertIsNone(self.tree.get(1))
+        self.assertIsNone(self.tree.get_max())
+        self.tree.insert(5, b'five')
+        self.tree.insert(-3, b'minus')
+        self.tree.insert(5, b'FIVE')
+        self.assertEqual(self.tree.get(5), b'FIVE')
+        self.assertEqual(self.tree.get(-3), b'minus')
+        self.assertEqual(self.tree.get(4, b''), b'')
+        self.assertTrue(self.tree.contains(-3))
+        self.assertNotIn(4, self.tree)
+        self.assertEqual(len(self.tree), 2)
+        self.assertEqual(self.tree.get_max(), 5)
+        with self.assertRaises(ValueError):
+            self.tree.insert(1, b'far too long')
+
+    def test_rejected_keys_leave_the_tree_unchanged(self):
+        self.tree.insert(1, b'one')
+        with self.assertRaises(OverflowError):
+            self.tree.insert(2 ** 70, b'big')
+        with self.assertRaises(TypeError):
+            self.tree.insert('2', b'two')
+        with self.assertRaises(TypeError):
+            self.tree.insert(3, 5)
+        with self.assertRaises(TypeError):
+            self.tree.insert(4, [1, 2])
+        self.tree.insert(5, bytearray(b'five'))
+        self.tree.insert(2 ** 63 - 1, b'max')
+        self.assertEqual(len(self.tree), 3)
+        self.assertNotIn(2 ** 70, self.tree)
+        self.assertNotIn(3, self.tree)
+        self.tree.close()
+        self.tree = BPlusTree(self.path)
+        self.assertEqual(list(self.tree.items()),
+                         [(1, b'one'), (5, b'five'), (2 ** 63 - 1, b'max')])
+        with self.assertRaises(ValueError):
+            BPlusTree(self.path + '.wide', page_size=1 << 20,
+                      value_size=70000)
+
+    def test_matches_dict_under_random_operations(self):
+        rng = random.Random(0)
+        contents = {}
+        for _ in range(3000):
+            key = rng.randrange(-500, 500)
+            if rng.random() < 0.7:
+                value = str(rng.randrange(10 ** 6)).encode()
+                self.tree.insert(key, value)
+                contents[key] = value
+            elif key in contents:
+                self.tree.delete(key)
+                del contents[key]
+            else:
+                with self.assertRaises(KeyError):
+                    self.tree.delete(key)
+            self.assertEqual(self.tree.get(key), contents.get(key))
+        self.assertEqual(len(self.tree), len(contents))
+        self.assertEqual(list(self.tree.items()), sorted(contents.items()))
+        self.assertEqual(self.tree.get_max(), max(contents))
+        lo, hi = -100, 250
+        self.assertEqual(list(self.tree.range(lo, hi)),
+                         sorted((k, v) for k, v in contents.items()
+                                if lo <= k < hi))
+        pairs = []
+        self.tree.for_each(lambda k, v: pairs.append((k, v)))
+        self.assertEqual(pairs, sorted(contents.items()))
+
+    def test_reopen_reads_existing_tree(self):
+        for key in range(1000):
+            self.tree.insert(key, str(key).encode())
+        self.tree.close()
+        self.tree = BPlusTree(self.path, cache_pages=2)
+        self.assertEqual(self.tree.page_size, 128)
+        self.assertEqual(len(self.tree), 1000)
+        self.assertEqual(self.tree.get(777), b'777')
+        self.assertEqual(list(self.tree.range(10, 13)),
+                         [(10, b'10'), (11, b'11'), (12, b'12')])
+        self.tree.insert(1000, b'new')
+        self.assertEqual(self.tree.get_max(), 1000)
+
+    def test_rejects_other_files(self):
+        other = self.path + '.txt'
+        with open(other, 'wb') as f:
+            f.write(b'not a tree' * 10)
+        with self.assertRaises(ValueError):
+            BPlusTree(other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+A doubly-linked list that stores its nodes in parallel,
+preallocated arrays instead of one ListNode object per value.
+
+Slot `i` of the list is made up of `values[i]`, `prevs[i]` and
+`nexts[i]`, where the links are slot indexes (NIL marks the end of
+the list). Slots that are not in use are chained together through
+`nexts` into a free list. Removing a value pushes its slot onto
+the free list and adding a value pops one from it, so a list whose
+length stays steady never allocates. When the free list runs out,
+every array doubles in size.
+
+The methods that add values return the slot index of the new
+value. That index plays the role of a node reference: it is what
+`move_to_front`, `move_to_end` and `delete` take, and it stays
+valid until the value is removed.
+"""
+from array import array
+
+NIL = -1
+
+
+class ArrayDoublyLinkedList:
+    def __init__(self, capacity=16):
+        capacity = max(1, capacity)
+        self.values = [None] * capacity
+        self.prevs = array('i', [NIL]) * capacity
+        self.nexts = array('i', range(1, capacity + 1))
+        self.nexts[capacity - 1] = NIL
+        self.free = 0
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    """Yields the values from head to tail."""
+    def __iter__(self):
+        values = self.values
+        nexts = self.nexts
+        index = self.head
+        while index != NIL:
+            yield values[index]
+            index = nexts[index]
+
+    """Returns the value stored in the given slot."""
+    def value_at(self, index):
+        return self.values[index]
+
+    """Takes a slot from the free list, doubling the arrays
+    if there are none left, and stores the value in it."""
+    def _allocate(self, value):
+        index = self.free
+        if index == NIL:
+            capacity = len(self.values)
+            self.values.extend([None] * capacity)
+            self.prevs.extend(array('i', [NIL]) * capacity)
+            self.nexts.extend(range(capacity + 1, 2 * capacity + 1))
+            self.nexts[-1] = NIL
+            index = capacity
+        self.free = self.nexts[index]
+        self.values[index] = value
+        return index
+
+    """Detaches the slot from its neighbours, updating head
+    and tail, without releasing it."""
+    def _unlink(self, index):
+        prev = self.prevs[index]
+        next = self.nexts[index]
+        if prev == NIL:
+            self.head = next
+        else:
+            self.nexts[prev] = next
+        if next == NIL:
+            self.tail = prev
+        else:
+            self.prevs[next] = prev
+
+    def _link_head(self, index):
+        self.prevs[index] = NIL
+        self.nexts[index] = self.head
+        if self.head == NIL:
+            self.tail = index
+        else:
+            self.prevs[self.head] = index
+        self.head = index
+
+    def _link_tail(self, index):
+        self.nexts[index] = NIL
+        self.prevs[index] = self.tail
+        if self.tail == NIL:
+            self.head = index
+        else:
+            self.nexts[self.tail] = index
+        self.tail = index
+
+    """Inserts the value as the new head of the list and
+    returns its slot index."""
+    def add_to_head(self, value):
+        index = self._allocate(value)
+        self._link_head(index)
+        self.length += 1
+        return index
+
+    """Inserts the value as the new tail of the list and
+    returns its slot index."""
+    def add_to_tail(self, value):
+        index = self._allocate(value)
+        self._link_tail(index)
+        self.length += 1
+        return index
+
+    """Removes the head of the list and returns its value,
+    or None if the list is empty."""
+    def remove_from_head(self):
+        if self.head == NIL:
+            return None
+        return self.delete(self.head)
+
+    """Removes the tail of the list and returns its value,
+    or None if the list is empty."""
+    def remove_from_tail(self):
+        if self.tail == NIL:
+            return None
+        return self.delete(self.tail)
+
+    """Moves the value in the given slot to the front of
+    the list."""
+    def move_to_front(self, index):
+        if index == self.head:
+            return
+        self._unlink(index)
+        self._link_head(index)
+
+    """Moves the value in the given slot to the end of the
+    list."""
+    def move_to_end(self, index):
+        if index == self.tail:
+            return
+        self._unlink(index)
+        self._link_tail(index)
+
+    """Removes the value in the given slot from the list,
+    returns it and puts the slot back on the free list."""
+    def delete(self, index):
+        self._unlink(index)
+        value = self.values[index]
+        self.values[index] = None
+        self.prevs[index] = NIL
+        self.nexts[index] = self.free
+        self.free = index
+        self.length -= 1
+        return value
+
+    """Returns the highest value currently in the list"""
+    def get_max(self):
+        if self.head == NIL:
+            return None
+        return max(self)
@@ -0,0 +1,75 @@
+"""
+Compares the memory footprint and throughput of the object-per-node
+DoublyLinkedList against the array-backed ArrayDoublyLinkedList.
+
+For each list the benchmark adds N values to the tail, moves N
+random nodes to the front, deletes and re-adds N random nodes, and
+finally empties the list from the tail. Memory is the tracemalloc
+size of the fully built list.
+
+    python bench_array_doubly_linked_list.py 1000000
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from array_doubly_linked_list import ArrayDoublyLinkedList
+from doubly_linked_list import DoublyLinkedList
+
+
+def measure_memory(make, n):
+    tracemalloc.start()
+    dll = make()
+    for i in range(n):
+        dll.add_to_tail(i)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def run(name, make, n, seed=0):
+    rng = random.Random(seed)
+    timings = {}
+    memory = measure_memory(make, n)
+
+    dll = make()
+    handles = []
+    start = time.perf_counter()
+    for i in range(n):
+        dll.add_to_tail(i)
+        handles.append(dll.tail)
+    timings['add_to_tail'] = time.perf_counter() - start
+
+    picks = [rng.randrange(n) for _ in range(n)]
+    start = time.perf_counter()
+    for i in picks:
+        dll.move_to_front(handles[i])
+    timings['move_to_front'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in picks:
+        dll.delete(handles[i])
+        dll.add_to_head(i)
+        handles[i] = dll.head
+    timings['delete+add_to_head'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while len(dll):
+        dll.remove_from_tail()
+    timings['remove_from_tail'] = time.perf_counter() - start
+
+    print(f"{name}: {memory / n:.1f} bytes/node")
+    for operation, seconds in timings.items():
+        print(f"  {operation:<20} {n / seconds:>14,.0f} ops/sec")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"n = {n:,}")
+    run('DoublyLinkedList', DoublyLinkedList, n)
+    run('ArrayDoublyLinkedList', lambda: ArrayDoublyLinkedList(n), n)
+
+
+if __name__ == '__main__':
+    main()
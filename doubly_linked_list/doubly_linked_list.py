@@ -1,3 +1,6 @@
+import heapq
+
+
 """Each ListNode holds a reference to its previous node
 as well as its next node in the List."""
 class ListNode:
@@ -5,6 +8,8 @@ class ListNode:
         self.value = value
         self.prev = prev
         self.next = next
+        # the node's entry in its List's max index, if it has one
+        self.max_entry = None
 
     """Wrap the given value in a ListNode and insert it
     after this node. Note that this node could already
@@ -33,6 +38,20 @@ class ListNode:
             self.next.prev = self.prev
 
 
+"""Wraps a value so that heapq's min-heap puts the largest
+value on top. `dead` is set once the value's node leaves the
+List."""
+class _MaxEntry:
+    __slots__ = ('value', 'dead')
+
+    def __init__(self, value):
+        self.value = value
+        self.dead = False
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 """Our doubly-linked list class. It holds references to
 the list's head and tail nodes."""
 class DoublyLinkedList:
@@ -40,49 +59,261 @@ class DoublyLinkedList:
         self.head = node
         self.tail = node
         self.length = 1 if node is not None else 0
+        # max-heap of the nodes' entries, including those of
+        # deleted nodes until they reach the top; only kept once
+        # track_max is called
+        self.max_index = None
 
     def __len__(self):
         return self.length
 
+    """Yields the values in the list from head to tail."""
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    """Yields the values in the list from tail to head."""
+    def __reversed__(self):
+        current = self.tail
+        while current is not None:
+            yield current.value
+            current = current.prev
+
+    """Builds a new List holding the values of the iterable
+    in order."""
+    @classmethod
+    def from_iterable(cls, iterable):
+        dll = cls()
+        dll.extend(iterable)
+        return dll
+
+    """Appends every value of the iterable to the tail of the
+    List. The new nodes are linked into a chain of their own
+    and attached in one step once the iterable is exhausted, so
+    an iterable that raises leaves the List unchanged, and
+    extending a List by itself copies it once."""
+    def extend(self, iterable):
+        first = last = None
+        count = 0
+        for value in iterable:
+            node = ListNode(value, last)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.length += count
+        if self.max_index is not None:
+            node = first
+            while node is not None:
+                self._index_add(node)
+                node = node.next
+
+    """Moves every node of the other List to the tail of this
+    List in constant time, leaving the other List empty. If
+    this List tracks its max, the other List's values are
+    pushed onto its index, which takes O(m log n) instead."""
+    def splice(self, other):
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.head is None:
+            return
+        if self.max_index is not None:
+            node = other.head
+            while node is not None:
+                self._index_add(node)
+                node = node.next
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        if other.max_index is not None:
+            other.max_index = []
+
+    """Rotates the List `steps` places to the right, so the
+    last `steps` values become the first ones; a negative
+    number rotates to the left. Only the head and tail links
+    change, after walking to the new head from whichever end
+    of the List is closer."""
+    def rotate(self, steps=1):
+        if self.length < 2:
+            return
+        steps %= self.length
+        if steps == 0:
+            return
+        new_head_position = self.length - steps
+        if new_head_position <= self.length // 2:
+            new_head = self.head
+            for _ in range(new_head_position):
+                new_head = new_head.next
+        else:
+            new_head = self.tail
+            for _ in range(steps - 1):
+                new_head = new_head.prev
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.tail = new_head.prev
+        self.head = new_head
+        self.tail.next = None
+        self.head.prev = None
+
     """Wraps the given value in a ListNode and inserts it 
     as the new head of the list. Don't forget to handle 
     the old head node's previous pointer accordingly."""
     def add_to_head(self, value):
-        pass
+        new_node = ListNode(value, None, self.head)
+        if self.head is None:
+            self.tail = new_node
+        else:
+            self.head.prev = new_node
+        self.head = new_node
+        self.length += 1
+        if self.max_index is not None:
+            self._index_add(new_node)
 
     """Removes the List's current head node, making the
     current head's next node the new head of the List.
     Returns the value of the removed Node."""
     def remove_from_head(self):
-        pass
+        if self.head is None:
+            return None
+        value = self.head.value
+        self.delete(self.head)
+        return value
 
     """Wraps the given value in a ListNode and inserts it 
     as the new tail of the list. Don't forget to handle 
     the old tail node's next pointer accordingly."""
     def add_to_tail(self, value):
-        pass
+        new_node = ListNode(value, self.tail, None)
+        if self.tail is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+        if self.max_index is not None:
+            self._index_add(new_node)
 
     """Removes the List's current tail node, making the 
     current tail's previous node the new tail of the List.
     Returns the value of the removed Node."""
     def remove_from_tail(self):
-        pass
+        if self.tail is None:
+            return None
+        value = self.tail.value
+        self.delete(self.tail)
+        return value
 
     """Removes the input node from its current spot in the 
     List and inserts it as the new head node of the List."""
     def move_to_front(self, node):
-        pass
+        if node is self.head:
+            return
+        self._unlink(node)
+        node.prev = None
+        node.next = self.head
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
 
     """Removes the input node from its current spot in the 
     List and inserts it as the new tail node of the List."""
     def move_to_end(self, node):
-        pass
+        if node is self.tail:
+            return
+        self._unlink(node)
+        node.next = None
+        node.prev = self.tail
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
 
     """Removes a node from the list and handles cases where
     the node was the head or the tail"""
     def delete(self, node):
-        pass
-        
+        self._unlink(node)
+        node.prev = None
+        node.next = None
+        self.length -= 1
+        if self.max_index is not None:
+            self._index_remove(node)
+
     """Returns the highest value currently in the list"""
     def get_max(self):
-        pass
+        if self.max_index is not None:
+            heap = self.max_index
+            # drop the deleted nodes' entries that have reached the top
+            while heap and heap[0].dead:
+                heapq.heappop(heap)
+            return heap[0].value if heap else None
+        if self.head is None:
+            return None
+        max_value = self.head.value
+        current = self.head.next
+        while current is not None:
+            if current.value > max_value:
+                max_value = current.value
+            current = current.next
+        return max_value
+
+    """Makes get_max run in amortized O(log n) by keeping a
+    max-heap of the list's values from now on. Adding a value
+    pushes an entry for its node onto the heap. Deleting a node
+    only marks its entry dead, and get_max pops dead entries
+    when they reach the top. Moving nodes costs nothing extra,
+    and lists that never call this pay nothing. Values must not
+    be changed in place (through `node.value`) while the index
+    is kept."""
+    def track_max(self):
+        heap = []
+        node = self.head
+        while node is not None:
+            node.max_entry = _MaxEntry(node.value)
+            heap.append(node.max_entry)
+            node = node.next
+        heapq.heapify(heap)
+        self.max_index = heap
+
+    def _index_add(self, node):
+        node.max_entry = _MaxEntry(node.value)
+        heapq.heappush(self.max_index, node.max_entry)
+
+    def _index_remove(self, node):
+        node.max_entry.dead = True
+        node.max_entry = None
+        # rebuild once dead entries make up most of the heap, so
+        # it never grows beyond a constant factor of the list
+        if len(self.max_index) > 2 * self.length + 16:
+            self.track_max()
+
+    """Detaches the node from its neighbours, updating the
+    List's head and tail references without touching the
+    List's length."""
+    def _unlink(self, node):
+        if node is self.head:
+            self.head = node.next
+        if node is self.tail:
+            self.tail = node.prev
+        node.delete()
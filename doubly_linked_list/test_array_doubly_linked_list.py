@@ -0,0 +1,62 @@
+import unittest
+from array_doubly_linked_list import ArrayDoublyLinkedList, NIL
+
+
+class ArrayDoublyLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.dll = ArrayDoublyLinkedList(capacity=2)
+
+    def test_add_and_remove_from_both_ends(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_head(1)
+        self.dll.add_to_tail(3)
+        self.assertEqual(list(self.dll), [1, 2, 3])
+        self.assertEqual(len(self.dll), 3)
+
+        self.assertEqual(self.dll.remove_from_head(), 1)
+        self.assertEqual(self.dll.remove_from_tail(), 3)
+        self.assertEqual(self.dll.remove_from_tail(), 2)
+        self.assertIsNone(self.dll.remove_from_tail())
+        self.assertIsNone(self.dll.remove_from_head())
+        self.assertEqual(self.dll.head, NIL)
+        self.assertEqual(self.dll.tail, NIL)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_move_to_front_and_end(self):
+        first = self.dll.add_to_tail(1)
+        second = self.dll.add_to_tail(2)
+        third = self.dll.add_to_tail(3)
+
+        self.dll.move_to_front(third)
+        self.assertEqual(list(self.dll), [3, 1, 2])
+        self.dll.move_to_end(first)
+        self.assertEqual(list(self.dll), [3, 2, 1])
+        self.dll.move_to_front(second)
+        self.assertEqual(list(self.dll), [2, 3, 1])
+        self.assertEqual(self.dll.value_at(self.dll.tail), 1)
+
+    def test_delete_recycles_slots(self):
+        handles = [self.dll.add_to_tail(i) for i in range(4)]
+        capacity = len(self.dll.values)
+
+        self.assertEqual(self.dll.delete(handles[1]), 1)
+        self.assertEqual(self.dll.delete(handles[0]), 0)
+        self.assertEqual(list(self.dll), [2, 3])
+
+        reused = self.dll.add_to_head(9)
+        self.assertEqual(reused, handles[0])
+        self.dll.add_to_head(8)
+        self.assertEqual(len(self.dll.values), capacity)
+        self.assertEqual(list(self.dll), [8, 9, 2, 3])
+
+    def test_get_max(self):
+        self.assertIsNone(self.dll.get_max())
+        self.dll.add_to_tail(100)
+        self.dll.add_to_tail(55)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_head(101)
+        self.assertEqual(self.dll.get_max(), 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from doubly_linked_list import ListNode
 from doubly_linked_list import DoublyLinkedList
@@ -150,6 +151,131 @@ class DoublyLinkedListTests(unittest.TestCase):
         self.dll.add_to_tail(101)
         self.assertEqual(self.dll.get_max(), 101)
 
+    def test_tracked_get_max(self):
+        self.dll.add_to_tail(100)
+        self.dll.track_max()
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_head(150)
+        self.dll.add_to_tail(150)
+        self.assertEqual(self.dll.get_max(), 150)
+
+        self.dll.move_to_end(self.dll.head)
+        self.dll.move_to_front(self.dll.tail.prev)
+        self.assertEqual(self.dll.get_max(), 150)
+
+        self.assertEqual(self.dll.remove_from_tail(), 150)
+        self.assertEqual(self.dll.get_max(), 150)
+        self.dll.delete(self.dll.head)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.assertEqual(self.dll.remove_from_tail(), 100)
+        self.assertEqual(self.dll.get_max(), 1)
+        self.dll.remove_from_head()
+        self.assertIsNone(self.dll.get_max())
+
+    def test_tracked_get_max_under_random_operations(self):
+        rng = random.Random(0)
+        self.dll.track_max()
+        for _ in range(3000):
+            if rng.random() < 0.5 or self.dll.length == 0:
+                self.dll.add_to_tail(rng.randrange(50))
+            else:
+                self.dll.remove_from_head()
+            expected = max(self.dll) if self.dll.length else None
+            self.assertEqual(self.dll.get_max(), expected)
+        self.assertLessEqual(len(self.dll.max_index),
+                             2 * self.dll.length + 16)
+
+    def test_tracked_get_max_with_strings(self):
+        words = DoublyLinkedList.from_iterable(['pear', 'fig', 'apple'])
+        words.track_max()
+        self.assertEqual(words.get_max(), 'pear')
+        words.remove_from_head()
+        self.assertEqual(words.get_max(), 'fig')
+
+    def test_tracked_get_max_with_unhashable_values(self):
+        lists = DoublyLinkedList.from_iterable([[1], [3], [2]])
+        lists.track_max()
+        self.assertEqual(lists.get_max(), [3])
+        lists.delete(lists.head.next)
+        self.assertEqual(len(lists), 2)
+        self.assertEqual(lists.get_max(), [2])
+        lists.add_to_head([0])
+        lists.remove_from_tail()
+        self.assertEqual(lists.get_max(), [1])
+
+    def test_iteration(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.assertEqual(list(self.dll), [1, 2, 3])
+        self.assertEqual(list(reversed(self.dll)), [3, 2, 1])
+
+    def test_extend_and_from_iterable(self):
+        self.dll.extend(x for x in range(2, 5))
+        self.assertEqual(list(self.dll), [1, 2, 3, 4])
+        self.assertEqual(self.dll.tail.prev.value, 3)
+        self.assertEqual(len(self.dll), 4)
+
+        dll = DoublyLinkedList.from_iterable([5, 6])
+        self.assertEqual(list(reversed(dll)), [6, 5])
+        self.assertEqual(len(dll), 2)
+        self.assertEqual(len(DoublyLinkedList.from_iterable([])), 0)
+
+    def test_failed_extend_leaves_list_unchanged(self):
+        def values():
+            yield 2
+            yield 3
+            raise RuntimeError('iterable failed')
+
+        with self.assertRaises(RuntimeError):
+            self.dll.extend(values())
+        self.assertEqual(list(self.dll), [1])
+        self.assertEqual(len(self.dll), 1)
+        self.dll.add_to_tail(9)
+        self.assertEqual(list(reversed(self.dll)), [9, 1])
+
+    def test_extend_by_itself(self):
+        self.dll.add_to_tail(2)
+        self.dll.extend(self.dll)
+        self.assertEqual(list(self.dll), [1, 2, 1, 2])
+        self.assertEqual(list(reversed(self.dll)), [2, 1, 2, 1])
+        self.assertEqual(len(self.dll), 4)
+
+    def test_splice(self):
+        other = DoublyLinkedList.from_iterable([2, 3])
+        self.dll.splice(other)
+        self.assertEqual(list(self.dll), [1, 2, 3])
+        self.assertEqual(list(reversed(self.dll)), [3, 2, 1])
+        self.assertEqual(len(self.dll), 3)
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        empty = DoublyLinkedList()
+        empty.splice(self.dll)
+        self.assertEqual(list(empty), [1, 2, 3])
+        self.assertEqual(empty.tail.value, 3)
+
+    def test_splice_keeps_tracked_max(self):
+        self.dll.track_max()
+        other = DoublyLinkedList.from_iterable([7, 3])
+        self.dll.splice(other)
+        self.assertEqual(self.dll.get_max(), 7)
+        self.dll.extend([9, 2])
+        self.assertEqual(self.dll.get_max(), 9)
+
+    def test_rotate(self):
+        self.dll.extend(range(2, 6))
+        self.dll.rotate(2)
+        self.assertEqual(list(self.dll), [4, 5, 1, 2, 3])
+        self.dll.rotate(-3)
+        self.assertEqual(list(self.dll), [2, 3, 4, 5, 1])
+        self.dll.rotate(4)
+        self.assertEqual(list(self.dll), [3, 4, 5, 1, 2])
+        self.assertEqual(list(reversed(self.dll)), [2, 1, 5, 4, 3])
+        self.dll.rotate(5)
+        self.assertEqual(list(self.dll), [3, 4, 5, 1, 2])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIsNone(self.dll.tail.next)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Compares generic_heap.Heap in comparator mode against key mode.
+
+Both heaps order the same random values smallest first: the
+comparator heap with `lambda x, y: x < y`, the key heap with
+`key=lambda x: x`. The benchmark inserts N values and then deletes
+them all, and reports the throughput of each phase.
+
+    python bench_generic_heap.py 1000000
+"""
+import random
+import sys
+import time
+
+from generic_heap import Heap
+
+
+def run(name, heap, values):
+    start = time.perf_counter()
+    for value in values:
+        heap.insert(value)
+    inserted = time.perf_counter()
+    while heap.get_size():
+        heap.delete()
+    deleted = time.perf_counter()
+    n = len(values)
+    print(f"{name:<12} insert {n / (inserted - start):>12,.0f} ops/sec   "
+          f"delete {n / (deleted - inserted):>12,.0f} ops/sec   "
+          f"total {deleted - start:.3f}s")
+    return deleted - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(n)]
+    print(f"n = {n:,}")
+    comparator = run('comparator', Heap(lambda x, y: x < y), values)
+    key = run('key', Heap(key=lambda x: x), values)
+    print(f"key mode speedup: {comparator / key:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares the binary generic_heap.Heap with DaryHeap (d = 4 and 8)
+and PairingHeap on three traces:
+
+* insert-heavy: 90% inserts and 10% deletes.
+* delete-heavy: N inserts followed by N deletes.
+* mixed: N / 2 inserts, then N random operations split evenly
+  between inserts and deletes.
+
+It also times merging two heaps of N / 2 values each. All heaps
+order random floats smallest first with the same comparator.
+
+    python bench_heap_variants.py 1000000
+"""
+import random
+import sys
+import time
+
+from dary_heap import DaryHeap
+from generic_heap import Heap
+from pairing_heap import PairingHeap
+
+
+def less(x, y):
+    return x < y
+
+
+HEAPS = {
+    'binary': lambda: Heap(less),
+    '4-ary': lambda: DaryHeap(less, d=4),
+    '8-ary': lambda: DaryHeap(less, d=8),
+    'pairing': lambda: PairingHeap(less),
+}
+
+
+"""
+Returns a list of operations: a float to insert, or None for a
+delete.
+"""
+def make_trace(name, n, rng):
+    if name == 'insert-heavy':
+        return [None if rng.random() < 0.1 else rng.random()
+                for _ in range(n)]
+    if name == 'delete-heavy':
+        return [rng.random() for _ in range(n)] + [None] * n
+    trace = [rng.random() for _ in range(n // 2)]
+    trace += [None if rng.random() < 0.5 else rng.random()
+              for _ in range(n)]
+    return trace
+
+
+def replay(heap, trace):
+    insert = heap.insert
+    delete = heap.delete
+    start = time.perf_counter()
+    for value in trace:
+        if value is None:
+            delete()
+        else:
+            insert(value)
+    return time.perf_counter() - start
+
+
+def time_merge(make, values):
+    first = make()
+    second = make()
+    half = len(values) // 2
+    for value in values[:half]:
+        first.insert(value)
+    for value in values[half:]:
+        second.insert(value)
+    start = time.perf_counter()
+    first.merge(second)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+    traces = {name: make_trace(name, n, rng)
+              for name in ('insert-heavy', 'delete-heavy', 'mixed')}
+    values = [rng.random() for _ in range(n)]
+
+    print(f"n = {n:,}   (ops/sec; merge in ms)")
+    print(f"{'heap':<10}" + ''.join(f"{name:>15}" for name in traces) +
+          f"{'merge':>12}")
+    for heap_name, make in HEAPS.items():
+        row = f"{heap_name:<10}"
+        for trace in traces.values():
+            row += f"{len(trace) / replay(make(), trace):>15,.0f}"
+        row += f"{time_merge(make, values) * 1000:>12.2f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
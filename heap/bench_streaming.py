@@ -0,0 +1,61 @@
+"""
+Measures the throughput of streaming.top_k and
+streaming.merge_sorted on synthetic streams of N values, next to
+heapq.nlargest and heapq.merge as a baseline.
+
+The streams are built from C iterators (random floats for top_k,
+running sums of random floats for the sorted shards of
+merge_sorted), so they are generated on the fly and never stored.
+Memory use stays flat whatever N is. N defaults to 10^6 and is
+the first argument; at 10^8 each row takes a few minutes:
+
+    python bench_streaming.py 100000000
+"""
+import heapq
+import itertools
+import random
+import sys
+import time
+
+from streaming import merge_sorted, top_k
+
+
+def random_stream(n, seed):
+    rng = random.Random(seed)
+    return itertools.starmap(rng.random, itertools.repeat((), n))
+
+
+def sorted_shards(n, m, seed):
+    return [itertools.accumulate(random_stream(n // m, seed + shard))
+            for shard in range(m)]
+
+
+def report(name, n, run):
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {n / elapsed:>14,.0f} values/sec   {elapsed:.2f}s")
+
+
+def drain(iterator):
+    for _ in iterator:
+        pass
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"n = {n:,}")
+    for k in [10, 1000]:
+        report(f"top_k k={k}", n,
+               lambda: drain(top_k(random_stream(n, 0), k)))
+        report(f"heapq.nlargest k={k}", n,
+               lambda: heapq.nlargest(k, random_stream(n, 0)))
+    for m in [8, 64]:
+        report(f"merge_sorted m={m}", n,
+               lambda: drain(merge_sorted(*sorted_shards(n, m, 0))))
+        report(f"heapq.merge m={m}", n,
+               lambda: drain(heapq.merge(*sorted_shards(n, m, 0))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+A d-ary heap: the same array-backed heap as generic_heap.Heap, but
+every parent has `d` children instead of two.
+
+The tree is only log_d(n) levels deep, so `insert` (which bubbles
+up one comparison per level) gets cheaper as `d` grows, and the
+children of a node sit next to each other in `storage`. `delete`
+has fewer levels to sift through but compares against up to `d`
+children on each, so d = 4 is usually the sweet spot for
+insert-heavy workloads.
+
+The comparator has the same meaning as in generic_heap.Heap.
+"""
+
+
+class DaryHeap:
+    def __init__(self, comparator=lambda x, y: x > y, d=4):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.storage = []
+        self.comparator = comparator
+        self.d = d
+
+    def insert(self, value):
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
+
+    def delete(self):
+        if not self.storage:
+            return None
+        last = self.storage.pop()
+        if not self.storage:
+            return last
+        top = self.storage[0]
+        self.storage[0] = last
+        self._sift_down(0)
+        return top
+
+    def get_priority(self):
+        return self.storage[0] if self.storage else None
+
+    def get_size(self):
+        return len(self.storage)
+
+    """
+    Moves every value of the other heap into this one in
+    O(n + m) by rebuilding the heap bottom-up, leaving the other
+    heap empty. Both heaps must use the same ordering.
+    """
+    def merge(self, other):
+        if other is self:
+            return
+        self.storage.extend(other.storage)
+        other.storage = []
+        for index in range((len(self.storage) - 2) // self.d, -1, -1):
+            self._sift_down(index)
+
+    def _bubble_up(self, index):
+        storage = self.storage
+        comparator = self.comparator
+        d = self.d
+        value = storage[index]
+        while index > 0:
+            parent = (index - 1) // d
+            if not comparator(value, storage[parent]):
+                break
+            storage[index] = storage[parent]
+            index = parent
+        storage[index] = value
+
+    def _sift_down(self, index):
+        storage = self.storage
+        comparator = self.comparator
+        d = self.d
+        size = len(storage)
+        value = storage[index]
+        first = d * index + 1
+        while first < size:
+            best = first
+            for child in range(first + 1, min(first + d, size)):
+                if comparator(storage[child], storage[best]):
+                    best = child
+            if not comparator(storage[best], value):
+                break
+            storage[index] = storage[best]
+            index = best
+            first = d * index + 1
+        storage[index] = value
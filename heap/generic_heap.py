@@ -1,22 +1,185 @@
+"""
+A heap whose ordering is supplied by the user.
+
+In comparator mode, `comparator(a, b)` returns True when `a` should
+sit above `b` in the heap; the default, `lambda x, y: x > y`, makes
+a max heap. The comparator is a Python call made on every
+comparison, and that call usually costs more than the heap
+operations themselves.
+
+In key mode, `key(value)` is called once per value, at insert
+time, and the heap stores `(key, sequence number, value)` tuples.
+Entries then compare with the built-in tuple comparison and the
+sifting is done by the C `heapq` functions. The smallest key has
+the highest priority, and values with equal keys come out in
+insertion order because of the sequence number. Values themselves
+are never compared.
+
+`reverse=True` flips the order in either mode: in key mode the
+largest key comes first (equal keys still in insertion order), and
+in comparator mode the comparator's arguments are swapped, so the
+default comparator gives a min heap. Reversed keys are wrapped in
+an object whose `__lt__` is a Python call, so a reversed key heap
+gives up some of key mode's speed; negating a numeric key is
+faster where it works.
+"""
+import heapq
+import itertools
+import operator
+
+
+"""Wraps a key so that larger keys compare as smaller."""
+class _Reversed:
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
 class Heap:
-    def __init__(self, comparator):
+    def __init__(self, comparator=lambda x, y: x > y, key=None,
+                 reverse=False):
         self.storage = []
+        self.reverse = reverse
+        if key is not None:
+            if reverse:
+                key = (lambda key: lambda value: _Reversed(key(value)))(key)
+            # entries are (key, seq, value) tuples compared natively
+            comparator = operator.lt
+            self.counter = itertools.count()
+        elif reverse:
+            comparator = (lambda before: lambda x, y: before(y, x))(comparator)
+        self.key = key
         self.comparator = comparator
 
     def insert(self, value):
-        pass
+        if self.key is not None:
+            heapq.heappush(self.storage,
+                           (self.key(value), next(self.counter), value))
+            return
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
 
     def delete(self):
-        pass
+        if not self.storage:
+            return None
+        if self.key is not None:
+            return heapq.heappop(self.storage)[2]
+        last = self.storage.pop()
+        if not self.storage:
+            return last
+        top = self.storage[0]
+        self.storage[0] = last
+        self._sift_down(0)
+        return top
 
     def get_priority(self):
-        pass
+        if not self.storage:
+            return None
+        if self.key is not None:
+            return self.storage[0][2]
+        return self.storage[0]
 
     def get_size(self):
-        pass
+        return len(self.storage)
+
+    """
+    Deletes and returns the top value and then inserts the value,
+    with a single sift. Returns None if the heap was empty.
+    """
+    def replace(self, value):
+        if not self.storage:
+            self.insert(value)
+            return None
+        if self.key is not None:
+            entry = (self.key(value), next(self.counter), value)
+            return heapq.heapreplace(self.storage, entry)[2]
+        top = self.storage[0]
+        self.storage[0] = value
+        self._sift_down(0)
+        return top
+
+    """
+    Inserts the value and then deletes and returns the top value,
+    with at most one sift. If the value would be on top it is
+    returned straight away and the heap is left unchanged.
+    """
+    def pushpop(self, value):
+        storage = self.storage
+        if self.key is not None:
+            key = self.key(value)
+            # an equal key goes below the top, which came first
+            if not storage or key < storage[0][0]:
+                return value
+            entry = (key, next(self.counter), value)
+            return heapq.heapreplace(storage, entry)[2]
+        if not storage or self.comparator(value, storage[0]):
+            return value
+        top = storage[0]
+        storage[0] = value
+        self._sift_down(0)
+        return top
+
+    """
+    Moves every value of the other heap into this one by
+    rebuilding the heap bottom-up in O(n + m), leaving the other
+    heap empty. In key mode the other heap's entries are first put
+    back in insertion order, which adds O(m log m). Both heaps must
+    use the same mode and ordering.
+    """
+    def merge(self, other):
+        if (self.key is None) != (other.key is None):
+            raise ValueError("cannot merge a key heap with a comparator heap")
+        if self.key is not None and self.reverse != other.reverse:
+            raise ValueError("cannot merge key heaps with opposite orders")
+        if other is self:
+            return
+        if self.key is not None:
+            # renumber in the other heap's insertion order, so equal
+            # keys still come out first in, first out and values are
+            # never compared
+            self.storage.extend((key, next(self.counter), value)
+                                for key, _, value in
+                                sorted(other.storage,
+                                       key=operator.itemgetter(1)))
+            heapq.heapify(self.storage)
+        else:
+            self.storage.extend(other.storage)
+            for index in range(len(self.storage) // 2 - 1, -1, -1):
+                self._sift_down(index)
+        other.storage = []
 
     def _bubble_up(self, index):
-        pass
+        storage = self.storage
+        comparator = self.comparator
+        value = storage[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not comparator(value, storage[parent]):
+                break
+            storage[index] = storage[parent]
+            index = parent
+        storage[index] = value
 
     def _sift_down(self, index):
-        pass
+        storage = self.storage
+        comparator = self.comparator
+        size = len(storage)
+        value = storage[index]
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and comparator(storage[child + 1],
+                                               storage[child]):
+                child += 1
+            if not comparator(storage[child], value):
+                break
+            storage[index] = storage[child]
+            index = child
+            child = 2 * index + 1
+        storage[index] = value
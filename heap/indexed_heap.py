@@ -0,0 +1,179 @@
+"""
+An addressable priority queue built on generic_heap.Heap.
+
+`insert` returns a HeapHandle for the value it stored. The handle
+records where its entry currently sits in `storage`: every sift
+that moves an entry also updates its handle's index, so the
+handles act as a position map from values to heap slots. With
+that, `update(handle, priority)` can re-sift a single entry after
+its priority changes, and `remove(handle)` can delete an entry
+from the middle of the heap, both in O(log n). That avoids the
+lazy-deletion-and-reinsertion workaround, whose stale entries make
+heaps in Dijkstra's algorithm or timer wheels grow without bound.
+
+Each entry has a value and a separate priority (the value itself
+unless one is given). The comparator has the same meaning as in
+generic_heap.Heap but is applied to priorities:
+`comparator(a, b)` is True when priority `a` belongs above `b`.
+"""
+from generic_heap import Heap
+
+
+class HeapHandle:
+    def __init__(self, value, priority, index):
+        self.value = value
+        self.priority = priority
+        # None once the entry has left the heap
+        self.index = index
+
+
+class IndexedHeap(Heap):
+    def __init__(self, comparator=lambda x, y: x > y):
+        super().__init__(lambda a, b: comparator(a.priority, b.priority))
+        self.priority_comparator = comparator
+
+    def __contains__(self, handle):
+        index = handle.index
+        return (index is not None and index < len(self.storage) and
+                self.storage[index] is handle)
+
+    """
+    Adds the value with the given priority (the value itself if
+    omitted) and returns its handle.
+    """
+    def insert(self, value, priority=None):
+        if priority is None:
+            priority = value
+        handle = HeapHandle(value, priority, len(self.storage))
+        self.storage.append(handle)
+        self._bubble_up(handle.index)
+        return handle
+
+    def delete(self):
+        if not self.storage:
+            return None
+        return self.remove(self.storage[0])
+
+    def get_priority(self):
+        return self.storage[0].value if self.storage else None
+
+    """
+    Removes the top entry and inserts the value with the given
+    priority in its place, with a single sift. Returns the removed
+    value, or None if the heap was empty. Use `remove` and `insert`
+    instead when the new entry's handle is needed.
+    """
+    def replace(self, value, priority=None):
+        if not self.storage:
+            self.insert(value, priority)
+            return None
+        if priority is None:
+            priority = value
+        top = self.storage[0]
+        top.index = None
+        handle = HeapHandle(value, priority, 0)
+        self.storage[0] = handle
+        self._sift_down(0)
+        return top.value
+
+    """
+    Inserts the value with the given priority and then deletes and
+    returns the top value. If the new entry would be on top, its
+    value is returned straight away and the heap is unchanged.
+    """
+    def pushpop(self, value, priority=None):
+        if priority is None:
+            priority = value
+        if not self.storage or self.priority_comparator(
+                priority, self.storage[0].priority):
+            return value
+        return self.replace(value, priority)
+
+    """Returns the handle at the top of the heap without removing it."""
+    def peek_handle(self):
+        return self.storage[0] if self.storage else None
+
+    """
+    Changes the priority of the handle's entry and moves the entry
+    up or down to restore the heap order.
+    """
+    def update(self, handle, priority):
+        self._check(handle)
+        handle.priority = priority
+        index = handle.index
+        self._bubble_up(index)
+        if handle.index == index:
+            self._sift_down(index)
+
+    """
+    Removes the handle's entry from wherever it is in the heap and
+    returns its value.
+    """
+    def remove(self, handle):
+        self._check(handle)
+        index = handle.index
+        last = self.storage.pop()
+        if last is not handle:
+            self.storage[index] = last
+            last.index = index
+            self._bubble_up(index)
+            if last.index == index:
+                self._sift_down(index)
+        handle.index = None
+        return handle.value
+
+    """
+    Moves every entry of the other IndexedHeap into this one in
+    O(n + m), leaving the other heap empty. The other heap's
+    handles stay valid and now refer to this heap.
+    """
+    def merge(self, other):
+        if other is self:
+            return
+        for handle in other.storage:
+            handle.index = len(self.storage)
+            self.storage.append(handle)
+        other.storage = []
+        for index in range(len(self.storage) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def _check(self, handle):
+        if handle not in self:
+            raise ValueError("handle is not in this heap")
+
+    def _bubble_up(self, index):
+        storage = self.storage
+        comparator = self.priority_comparator
+        handle = storage[index]
+        priority = handle.priority
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_handle = storage[parent]
+            if not comparator(priority, parent_handle.priority):
+                break
+            storage[index] = parent_handle
+            parent_handle.index = index
+            index = parent
+        storage[index] = handle
+        handle.index = index
+
+    def _sift_down(self, index):
+        storage = self.storage
+        comparator = self.priority_comparator
+        size = len(storage)
+        handle = storage[index]
+        priority = handle.priority
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and comparator(storage[child + 1].priority,
+                                               storage[child].priority):
+                child += 1
+            child_handle = storage[child]
+            if not comparator(child_handle.priority, priority):
+                break
+            storage[index] = child_handle
+            child_handle.index = index
+            index = child
+            child = 2 * index + 1
+        storage[index] = handle
+        handle.index = index
@@ -1,21 +1,101 @@
 class Heap:
-    def __init__(self):
+    def __init__(self, values=None):
         self.storage = []
+        if values is not None:
+            self.heapify(values)
 
     def insert(self, value):
-        pass
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
 
     def delete(self):
-        pass
+        if not self.storage:
+            return None
+        last = self.storage.pop()
+        if not self.storage:
+            return last
+        top = self.storage[0]
+        self.storage[0] = last
+        self._sift_down(0)
+        return top
 
     def get_max(self):
-        pass
+        return self.storage[0] if self.storage else None
 
     def get_size(self):
-        pass
+        return len(self.storage)
+
+    """
+    Replaces the heap's contents with the given values in O(n)
+    by sifting down every parent, starting from the last one,
+    instead of inserting the values one at a time in O(n log n).
+    """
+    def heapify(self, values):
+        self.storage = list(values)
+        for index in range(len(self.storage) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    """
+    Inserts every value of the iterable. When the new values are
+    numerous compared to the heap, rebuilding the whole heap with
+    heapify is cheaper than bubbling each one up.
+    """
+    def insert_many(self, values):
+        values = list(values)
+        total = len(self.storage) + len(values)
+        if len(values) * total.bit_length() > total:
+            self.heapify(self.storage + values)
+        else:
+            for value in values:
+                self.insert(value)
+
+    """
+    Inserts the value and then deletes and returns the max, with a
+    single sift. If the value is at least as large as the current
+    max it is returned straight away and the heap is unchanged.
+    """
+    def pushpop(self, value):
+        if self.storage and self.storage[0] > value:
+            value, self.storage[0] = self.storage[0], value
+            self._sift_down(0)
+        return value
+
+    """
+    Deletes and returns the max and then inserts the value, with a
+    single sift. Unlike pushpop, the returned value can be smaller
+    than the inserted one. Returns None if the heap was empty.
+    """
+    def replace(self, value):
+        if not self.storage:
+            self.storage.append(value)
+            return None
+        top = self.storage[0]
+        self.storage[0] = value
+        self._sift_down(0)
+        return top
 
     def _bubble_up(self, index):
-        pass
+        storage = self.storage
+        value = storage[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not value > storage[parent]:
+                break
+            storage[index] = storage[parent]
+            index = parent
+        storage[index] = value
 
     def _sift_down(self, index):
-        pass
+        storage = self.storage
+        size = len(storage)
+        value = storage[index]
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and storage[child + 1] > storage[child]:
+                child += 1
+            if not storage[child] > value:
+                break
+            storage[index] = storage[child]
+            index = child
+            child = 2 * index + 1
+        storage[index] = value
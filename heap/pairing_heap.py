@@ -0,0 +1,92 @@
+"""
+A pairing heap: a heap-ordered tree in which a node may have any
+number of children.
+
+`insert` and `merge` only link two roots together, which takes
+O(1). `delete` removes the root and then rebuilds a single tree
+from its children with the two-pass pairing scheme (link the
+children in pairs from left to right, then link the results from
+right to left), which is O(log n) amortized.
+
+The comparator has the same meaning as in generic_heap.Heap.
+"""
+
+
+"""
+Each PairingNode points to its first child and to its next
+sibling, so every node has a fixed number of references however
+many children it has.
+"""
+class PairingNode:
+    def __init__(self, value):
+        self.value = value
+        self.child = None
+        self.sibling = None
+
+
+class PairingHeap:
+    def __init__(self, comparator=lambda x, y: x > y):
+        self.root = None
+        self.size = 0
+        self.comparator = comparator
+
+    def insert(self, value):
+        self.root = self._link(self.root, PairingNode(value))
+        self.size += 1
+
+    def delete(self):
+        root = self.root
+        if root is None:
+            return None
+        self.root = self._pair(root.child)
+        self.size -= 1
+        return root.value
+
+    def get_priority(self):
+        return self.root.value if self.root is not None else None
+
+    def get_size(self):
+        return self.size
+
+    """
+    Moves every value of the other heap into this one in O(1),
+    leaving the other heap empty. Both heaps must use the same
+    ordering.
+    """
+    def merge(self, other):
+        if other is self:
+            return
+        self.root = self._link(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    """Makes the lower-priority root the first child of the
+    other and returns the surviving root."""
+    def _link(self, first, second):
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if self.comparator(second.value, first.value):
+            first, second = second, first
+        second.sibling = first.child
+        first.child = second
+        return first
+
+    """Combines a list of siblings into one tree with two-pass
+    pairing and returns its root."""
+    def _pair(self, node):
+        pairs = []
+        while node is not None:
+            first = node
+            second = node.sibling
+            node = second.sibling if second is not None else None
+            first.sibling = None
+            if second is not None:
+                second.sibling = None
+            pairs.append(self._link(first, second))
+        root = None
+        for tree in reversed(pairs):
+            root = self._link(tree, root)
+        return root
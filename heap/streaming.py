@@ -0,0 +1,97 @@
+"""
+Heap-based helpers for streams too large to hold in memory.
+
+`top_k(stream, k, key)` keeps the k largest values of a stream in a
+key-mode generic_heap.Heap of at most k entries, with the smallest
+of them on top. A new value only touches the heap, through
+`pushpop`, when its key beats that smallest key, which for a long
+stream in random order happens for roughly k * log(n / k) of the n
+values. When the stream ends it yields the k values from largest to
+smallest.
+
+`merge_sorted(*iterators, key)` lazily merges iterators that are
+each sorted by `key`, smallest first, holding one value per
+iterator in a heap. Every value it yields costs one `replace` on
+the heap, so merging m iterators takes O(log m) per value and O(m)
+memory.
+
+Both consume their inputs one value at a time and never build a
+list of them. Values with equal keys keep their input order: in
+`top_k` the earlier value wins a tie, as in `heapq.nlargest`, and
+`merge_sorted` yields values from earlier iterators first.
+"""
+from generic_heap import Heap
+
+_exhausted = object()
+
+
+def _identity(value):
+    return value
+
+
+"""
+Yields the k values of `stream` with the largest keys, largest
+first.
+"""
+def top_k(stream, k, key=None):
+    if k <= 0:
+        return
+    if key is None:
+        key = _identity
+    # entries are (key, -position, value) and are their own heap
+    # keys: among tied keys the latest value is on top, so it is
+    # the one evicted, and values are never compared
+    heap = Heap(key=_identity)
+    stream = iter(stream)
+    for position, value in enumerate(stream):
+        heap.insert((key(value), -position, value))
+        if heap.get_size() == k:
+            break
+    if heap.get_size() == k:
+        floor = heap.get_priority()[0]
+        pushpop = heap.pushpop
+        get_priority = heap.get_priority
+        for position, value in enumerate(stream, k):
+            value_key = key(value)
+            if floor < value_key:
+                pushpop((value_key, -position, value))
+                floor = get_priority()[0]
+    # the heap gives ascending keys with later values first among
+    # ties, the exact reverse of the order to yield
+    result = [heap.delete()[2] for _ in range(heap.get_size())]
+    result.reverse()
+    yield from result
+
+
+"""
+Yields the values of all the iterators in ascending key order.
+Each iterator must already be sorted by `key`.
+"""
+def merge_sorted(*iterators, key=None):
+    if key is None:
+        key = _identity
+    # entries are (key, iterator index, value, iterator) and are
+    # their own heap keys; the index is unique, so it breaks ties in
+    # iterator order and values are never compared
+    heap = Heap(key=_identity)
+    for index, iterator in enumerate(iterators):
+        iterator = iter(iterator)
+        for value in iterator:
+            heap.insert((key(value), index, value, iterator))
+            break
+    replace = heap.replace
+    get_priority = heap.get_priority
+    live = heap.get_size()
+    while live > 1:
+        _, index, value, iterator = get_priority()
+        yield value
+        value = next(iterator, _exhausted)
+        if value is _exhausted:
+            heap.delete()
+            live -= 1
+        else:
+            replace((key(value), index, value, iterator))
+    if live:
+        _, _, value, iterator = heap.delete()
+        yield value
+        yield from iterator
@@ -0,0 +1,50 @@
+import random
+import unittest
+from dary_heap import DaryHeap
+
+
+class DaryHeapTests(unittest.TestCase):
+    def setUp(self):
+        self.heap = DaryHeap()
+
+    def test_default_delete_elements_in_order(self):
+        for value in [6, 7, 5, 8, 10, 1, 2, 5]:
+            self.heap.insert(value)
+        self.assertEqual(self.heap.get_size(), 8)
+        self.assertEqual(self.heap.get_priority(), 10)
+
+        descending_order = []
+        while self.heap.get_size() > 0:
+            descending_order.append(self.heap.delete())
+
+        self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
+        self.assertIsNone(self.heap.delete())
+        self.assertIsNone(self.heap.get_priority())
+
+    def test_custom_comparator_and_arity(self):
+        rng = random.Random(0)
+        values = [rng.randrange(1000) for _ in range(300)]
+        for d in (2, 3, 4, 8):
+            heap = DaryHeap(lambda x, y: x < y, d=d)
+            for value in values:
+                heap.insert(value)
+            self.assertEqual([heap.delete() for _ in values], sorted(values))
+
+    def test_merge(self):
+        other = DaryHeap(d=4)
+        for value in range(0, 20, 2):
+            self.heap.insert(value)
+        for value in range(1, 20, 2):
+            other.insert(value)
+        self.heap.merge(other)
+        self.assertEqual(other.get_size(), 0)
+        self.assertEqual([self.heap.delete() for _ in range(20)],
+                         list(range(19, -1, -1)))
+
+    def test_rejects_small_arity(self):
+        with self.assertRaises(ValueError):
+            DaryHeap(d=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -135,6 +135,117 @@ class HeapTests(unittest.TestCase):
 
         self.assertEqual(ascending_order, [1, 2, 5, 5, 6, 7, 8, 10])
 
+    def test_key_heap_delete_elements_in_order(self):
+        self.heap = Heap(key=lambda x: x)
+
+        for value in [6, 7, 5, 8, 10, 1, 2, 5]:
+            self.heap.insert(value)
+
+        self.assertEqual(self.heap.get_size(), 8)
+        self.assertEqual(self.heap.get_priority(), 1)
+
+        ascending_order = []
+
+        while self.heap.get_size() > 0:
+            ascending_order.append(self.heap.delete())
+
+        self.assertEqual(ascending_order, [1, 2, 5, 5, 6, 7, 8, 10])
+        self.assertIsNone(self.heap.delete())
+        self.assertIsNone(self.heap.get_priority())
+
+    def test_key_heap_is_stable_and_never_compares_values(self):
+        self.heap = Heap(key=lambda task: -task['priority'])
+
+        tasks = [{'name': name, 'priority': priority} for name, priority in
+                 [('a', 1), ('b', 3), ('c', 1), ('d', 3), ('e', 2)]]
+        for task in tasks:
+            self.heap.insert(task)
+
+        names = [self.heap.delete()['name'] for _ in range(5)]
+        self.assertEqual(names, ['b', 'd', 'e', 'a', 'c'])
+
+    def test_reverse_flips_either_mode(self):
+        self.heap = Heap(key=len, reverse=True)
+        for word in ['bb', 'a', 'ccc', 'dd', 'e']:
+            self.heap.insert(word)
+        other = Heap(key=len, reverse=True)
+        other.insert('ff')
+        self.heap.merge(other)
+        self.assertEqual(self.heap.replace('gggg'), 'ccc')
+        self.assertEqual([self.heap.delete() for _ in range(6)],
+                         ['gggg', 'bb', 'dd', 'ff', 'a', 'e'])
+        with self.assertRaises(ValueError):
+            self.heap.merge(Heap(key=len))
+
+        self.heap = Heap(reverse=True)
+        for value in ['m', 'z', 'a']:
+            self.heap.insert(value)
+        self.assertEqual([self.heap.delete() for _ in range(3)],
+                         ['a', 'm', 'z'])
+
+    def test_merge(self):
+        other = Heap()
+        for value in [6, 8, 10]:
+            self.heap.insert(value)
+        for value in [9, 1, 12]:
+            other.insert(value)
+        self.heap.merge(other)
+        self.assertEqual(other.get_size(), 0)
+        self.assertEqual([self.heap.delete() for _ in range(6)],
+                         [12, 10, 9, 8, 6, 1])
+
+    def test_key_heap_merge(self):
+        self.heap = Heap(key=len)
+        other = Heap(key=len)
+        self.heap.insert('ccc')
+        self.heap.insert({'a': 1})
+        other.insert({'b': 2})
+        other.insert('dd')
+        self.heap.merge(other)
+        self.assertEqual([self.heap.delete() for _ in range(4)],
+                         [{'a': 1}, {'b': 2}, 'dd', 'ccc'])
+        with self.assertRaises(ValueError):
+            self.heap.merge(Heap())
+
+    def test_replace(self):
+        self.assertIsNone(self.heap.replace(4))
+        self.heap.insert(9)
+        self.assertEqual(self.heap.replace(1), 9)
+        self.assertEqual([self.heap.delete() for _ in range(2)], [4, 1])
+
+        self.heap = Heap(key=lambda x: x)
+        for value in [5, 3, 8]:
+            self.heap.insert(value)
+        self.assertEqual(self.heap.replace(6), 3)
+        self.assertEqual([self.heap.delete() for _ in range(3)], [5, 6, 8])
+
+    def test_pushpop(self):
+        self.assertEqual(self.heap.pushpop(4), 4)
+        self.assertEqual(self.heap.get_size(), 0)
+        for value in [3, 9]:
+            self.heap.insert(value)
+        self.assertEqual(self.heap.pushpop(10), 10)
+        self.assertEqual(self.heap.pushpop(1), 9)
+        self.assertEqual([self.heap.delete() for _ in range(2)], [3, 1])
+
+        self.heap = Heap(key=lambda pair: pair[0])
+        for pair in [(5, 'a'), (3, 'b'), (8, 'c')]:
+            self.heap.insert(pair)
+        self.assertEqual(self.heap.pushpop((1, 'd')), (1, 'd'))
+        self.assertEqual(self.heap.pushpop((3, 'e')), (3, 'b'))
+        self.assertEqual([self.heap.delete() for _ in range(3)],
+                         [(3, 'e'), (5, 'a'), (8, 'c')])
+
+    def test_key_heap_merge_keeps_fifo_order_after_delete(self):
+        other = Heap(key=lambda pair: pair[0])
+        for letter in 'abcdefg':
+            other.insert((1, letter))
+        self.assertEqual(other.delete(), (1, 'a'))
+        self.heap = Heap(key=lambda pair: pair[0])
+        self.heap.merge(other)
+        self.assertEqual([self.heap.delete()[1] for _ in range(6)],
+                         list('bcdefg'))
+
     def test_bubble_up_was_called(self):
         self.heap._bubble_up = MagicMock()
         self.heap.insert(5)
@@ -0,0 +1,116 @@
+import random
+import unittest
+from indexed_heap import IndexedHeap
+
+
+class IndexedHeapTests(unittest.TestCase):
+    def setUp(self):
+        self.heap = IndexedHeap(lambda x, y: x < y)
+
+    def assertHeapOrdered(self):
+        storage = self.heap.storage
+        for index, handle in enumerate(storage):
+            self.assertEqual(handle.index, index)
+            if index:
+                parent = storage[(index - 1) // 2]
+                self.assertFalse(handle.priority < parent.priority)
+
+    def test_default_heap_is_a_max_heap(self):
+        heap = IndexedHeap()
+        for value in [6, 8, 10, 9, 1]:
+            heap.insert(value)
+        self.assertEqual([heap.delete() for _ in range(5)], [10, 9, 8, 6, 1])
+        self.assertIsNone(heap.delete())
+
+    def test_values_ordered_by_priority(self):
+        self.heap.insert('low', 5)
+        self.heap.insert('high', 1)
+        self.heap.insert('mid', 3)
+        self.assertEqual(self.heap.get_priority(), 'high')
+        self.assertEqual(self.heap.peek_handle().priority, 1)
+        self.assertEqual([self.heap.delete() for _ in range(3)],
+                         ['high', 'mid', 'low'])
+
+    def test_update_moves_entries_both_ways(self):
+        handles = {name: self.heap.insert(name, priority) for name, priority in
+                   [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)]}
+        self.heap.update(handles['e'], 0)
+        self.assertEqual(self.heap.get_priority(), 'e')
+        self.heap.update(handles['e'], 10)
+        self.heap.update(handles['a'], 6)
+        self.assertHeapOrdered()
+        self.assertEqual([self.heap.delete() for _ in range(5)],
+                         ['b', 'c', 'd', 'a', 'e'])
+
+    def test_remove_by_handle(self):
+        handles = [self.heap.insert(value) for value in range(10)]
+        self.assertEqual(self.heap.remove(handles[4]), 4)
+        self.assertEqual(self.heap.remove(handles[0]), 0)
+        self.assertEqual(self.heap.remove(handles[9]), 9)
+        self.assertNotIn(handles[4], self.heap)
+        self.assertIn(handles[5], self.heap)
+        self.assertHeapOrdered()
+        self.assertEqual(self.heap.get_size(), 7)
+        with self.assertRaises(ValueError):
+            self.heap.remove(handles[4])
+        with self.assertRaises(ValueError):
+            self.heap.update(handles[0], 3)
+
+    def test_replace_swaps_in_a_new_handle(self):
+        heap = IndexedHeap()
+        self.assertIsNone(heap.replace(5))
+        top = heap.peek_handle()
+        heap.insert(1)
+        heap.insert(3)
+        self.assertEqual(heap.replace(2), 5)
+        self.assertNotIn(top, heap)
+        self.assertEqual(heap.replace('x', 0), 3)
+        self.assertEqual([heap.delete() for _ in range(3)], [2, 1, 'x'])
+
+    def test_pushpop(self):
+        heap = IndexedHeap()
+        self.assertEqual(heap.pushpop(5), 5)
+        heap.insert(1)
+        top = heap.insert(3)
+        self.assertEqual(heap.pushpop('x', 4), 'x')
+        self.assertIn(top, heap)
+        self.assertEqual(heap.pushpop(2), 3)
+        self.assertNotIn(top, heap)
+        self.assertEqual([heap.delete() for _ in range(2)], [2, 1])
+
+    def test_merge_keeps_handles_valid(self):
+        other = IndexedHeap(lambda x, y: x < y)
+        mine = [self.heap.insert(value) for value in (5, 1, 9)]
+        theirs = [other.insert(value) for value in (4, 8, 0, 7)]
+        self.heap.merge(other)
+        self.assertEqual(other.get_size(), 0)
+        self.assertHeapOrdered()
+        self.heap.update(theirs[1], -1)
+        self.assertEqual(self.heap.remove(mine[0]), 5)
+        self.assertEqual([self.heap.delete() for _ in range(6)],
+                         [8, 0, 1, 4, 7, 9])
+
+    def test_random_operations_match_sorted_order(self):
+        rng = random.Random(0)
+        live = {}
+        for step in range(500):
+            action = rng.random()
+            if action < 0.5 or not live:
+                live[step] = self.heap.insert(step, rng.randrange(100))
+            elif action < 0.8:
+                key = rng.choice(list(live))
+                self.heap.update(live[key], rng.randrange(100))
+            else:
+                key = rng.choice(list(live))
+                self.heap.remove(live.pop(key))
+            self.assertEqual(self.heap.get_size(), len(live))
+        self.assertHeapOrdered()
+        priorities = []
+        while self.heap.get_size():
+            priorities.append(self.heap.peek_handle().priority)
+            self.heap.delete()
+        self.assertEqual(priorities, sorted(priorities))
+
+
+if __name__ == '__main__':
+    unittest.main()
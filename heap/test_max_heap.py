@@ -67,6 +67,45 @@ class HeapTests(unittest.TestCase):
 
         self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
 
+    def test_heapify(self):
+        values = [6, 8, 10, 9, 1, 9, 9, 5]
+        self.heap = Heap(values)
+        self.assertEqual(self.heap.get_size(), 8)
+        self.assertEqual(self.heap.get_max(), 10)
+        descending_order = []
+        while self.heap.get_size() > 0:
+            descending_order.append(self.heap.delete())
+        self.assertEqual(descending_order, sorted(values, reverse=True))
+
+    def test_insert_many(self):
+        self.heap.insert_many([3, 1])
+        self.heap.insert_many(range(10))
+        self.heap.insert_many([20])
+        self.assertEqual(self.heap.get_size(), 13)
+        descending_order = [self.heap.delete() for _ in range(13)]
+        self.assertEqual(descending_order,
+                         sorted([3, 1, 20] + list(range(10)), reverse=True))
+
+    def test_pushpop(self):
+        self.assertEqual(self.heap.pushpop(5), 5)
+        self.assertEqual(self.heap.get_size(), 0)
+        self.heap.insert_many([4, 7, 2])
+        self.assertEqual(self.heap.pushpop(9), 9)
+        self.assertEqual(self.heap.pushpop(3), 7)
+        self.assertEqual(self.heap.get_max(), 4)
+        self.assertEqual(self.heap.get_size(), 3)
+
+    def test_replace(self):
+        self.assertIsNone(self.heap.replace(5))
+        self.assertEqual(self.heap.get_max(), 5)
+        self.heap.insert(2)
+        self.assertEqual(self.heap.replace(9), 5)
+        self.assertEqual(self.heap.get_max(), 9)
+        self.assertEqual(self.heap.replace(1), 9)
+        self.assertEqual(self.heap.delete(), 2)
+        self.assertEqual(self.heap.delete(), 1)
+        self.assertIsNone(self.heap.delete())
+
     def test_bubble_up_was_called(self):
         self.heap._bubble_up = MagicMock()
         self.heap.insert(5)
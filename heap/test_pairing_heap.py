@@ -0,0 +1,53 @@
+import random
+import unittest
+from pairing_heap import PairingHeap
+
+
+class PairingHeapTests(unittest.TestCase):
+    def setUp(self):
+        self.heap = PairingHeap()
+
+    def test_default_delete_elements_in_order(self):
+        for value in [6, 7, 5, 8, 10, 1, 2, 5]:
+            self.heap.insert(value)
+        self.assertEqual(self.heap.get_size(), 8)
+        self.assertEqual(self.heap.get_priority(), 10)
+
+        descending_order = []
+        while self.heap.get_size() > 0:
+            descending_order.append(self.heap.delete())
+
+        self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
+        self.assertIsNone(self.heap.delete())
+        self.assertIsNone(self.heap.get_priority())
+
+    def test_custom_comparator_with_interleaved_operations(self):
+        rng = random.Random(0)
+        heap = PairingHeap(lambda x, y: x < y)
+        contents = []
+        for _ in range(2000):
+            if rng.random() < 0.6 or not contents:
+                value = rng.randrange(1000)
+                heap.insert(value)
+                contents.append(value)
+            else:
+                contents.sort()
+                self.assertEqual(heap.delete(), contents.pop(0))
+            self.assertEqual(heap.get_size(), len(contents))
+
+    def test_merge(self):
+        other = PairingHeap()
+        for value in [3, 9]:
+            self.heap.insert(value)
+        for value in [4, 11, 1]:
+            other.insert(value)
+        self.heap.merge(other)
+        self.heap.merge(PairingHeap())
+        self.assertEqual(other.get_size(), 0)
+        self.assertIsNone(other.get_priority())
+        self.assertEqual([self.heap.delete() for _ in range(5)],
+                         [11, 9, 4, 3, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
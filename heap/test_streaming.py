@@ -0,0 +1,85 @@
+import heapq
+import random
+import unittest
+from streaming import merge_sorted, top_k
+
+
+class TopKTests(unittest.TestCase):
+    def test_matches_nlargest(self):
+        rng = random.Random(0)
+        values = [rng.randrange(1000) for _ in range(5000)]
+        for k in [0, 1, 7, 100, 5000, 6000]:
+            self.assertEqual(list(top_k(iter(values), k)),
+                             heapq.nlargest(k, values))
+
+    def test_key_and_ties_keep_input_order(self):
+        words = ['bb', 'a', 'cc', 'ddd', 'ee', 'f']
+        self.assertEqual(list(top_k(words, 3, key=len)), ['ddd', 'bb', 'cc'])
+        self.assertEqual(list(top_k(words, 2, key=lambda w: -len(w))),
+                         ['a', 'f'])
+
+    def test_key_called_once_per_value(self):
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return value
+
+        values = list(range(100))
+        self.assertEqual(list(top_k(values, 5, key=key)), [99, 98, 97, 96, 95])
+        self.assertEqual(len(calls), 100)
+
+    def test_later_ties_are_evicted_first(self):
+        pairs = [('a', 5), ('b', 5), ('c', 6)]
+        self.assertEqual(list(top_k(pairs, 2, key=lambda p: p[1])),
+                         heapq.nlargest(2, pairs, key=lambda p: p[1]))
+        rng = random.Random(1)
+        pairs = [(index, rng.randrange(5)) for index in range(300)]
+        for k in [1, 3, 10]:
+            self.assertEqual(list(top_k(pairs, k, key=lambda p: p[1])),
+                             heapq.nlargest(k, pairs, key=lambda p: p[1]))
+
+    def test_reads_stream_only_when_iterated(self):
+        read = []
+
+        def stream():
+            for value in range(10):
+                read.append(value)
+                yield value
+
+        result = top_k(stream(), 2)
+        self.assertEqual(read, [])
+        self.assertEqual(list(result), [9, 8])
+        self.assertEqual(len(read), 10)
+
+
+class MergeSortedTests(unittest.TestCase):
+    def test_matches_heapq_merge(self):
+        rng = random.Random(0)
+        shards = [sorted(rng.randrange(100) for _ in range(rng.randrange(50)))
+                  for _ in range(20)]
+        self.assertEqual(list(merge_sorted(*map(iter, shards))),
+                         list(heapq.merge(*shards)))
+
+    def test_key_and_ties_keep_iterator_order(self):
+        first = [(1, 'a'), (2, 'a'), (2, 'b')]
+        second = [(0, 'c'), (2, 'c')]
+        merged = list(merge_sorted(first, [], second, key=lambda p: p[0]))
+        self.assertEqual(merged, [(0, 'c'), (1, 'a'), (2, 'a'), (2, 'b'),
+                                  (2, 'c')])
+
+    def test_is_lazy(self):
+        def endless(start):
+            while True:
+                yield start
+                start += 2
+
+        merged = merge_sorted(endless(0), endless(1))
+        self.assertEqual([next(merged) for _ in range(6)], [0, 1, 2, 3, 4, 5])
+
+    def test_no_iterators(self):
+        self.assertEqual(list(merge_sorted()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import asyncio
+import random
+import unittest
+from timer_wheel import AsyncTimerDriver, HierarchicalTimerWheel
+
+
+class TimerWheelTests(unittest.TestCase):
+    def setUp(self):
+        self.wheel = HierarchicalTimerWheel(resolution=1, slot_bits=2, levels=2)
+
+    def test_fires_in_deadline_order(self):
+        for deadline in [5, 1, 3, 2]:
+            self.wheel.schedule(deadline, deadline)
+        self.assertEqual(len(self.wheel), 4)
+        self.assertEqual(list(self.wheel.advance(2)), [1, 2])
+        self.assertEqual(list(self.wheel.advance(2)), [])
+        self.assertEqual(list(self.wheel.advance(10)), [3, 5])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_cancel(self):
+        first = self.wheel.schedule(3, 'first')
+        second = self.wheel.schedule(7, 'second')
+        far = self.wheel.schedule(100, 'far')
+        self.wheel.cancel(first)
+        far.cancel()
+        self.wheel.cancel(first)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(list(self.wheel.advance(200)), ['second'])
+        second.cancel()
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_past_deadline_fires_on_next_tick(self):
+        list(self.wheel.advance(10))
+        self.wheel.schedule(4, 'late')
+        self.assertEqual(list(self.wheel.advance(11)), ['late'])
+
+    def test_far_future_deadlines_skip_idle_ticks(self):
+        wheel = HierarchicalTimerWheel(resolution=0.001)
+        wheel.schedule(10 ** 6, 'far')
+        wheel.schedule(1000.5, 'near')
+        self.assertEqual(list(wheel.advance(1000)), [])
+        self.assertEqual(list(wheel.advance(10 ** 6)), ['near', 'far'])
+
+    def test_fire_calls_callbacks(self):
+        fired = []
+        self.wheel.schedule(2, lambda: fired.append('a'))
+        self.wheel.schedule(40, lambda: fired.append('b'))
+        self.assertEqual(self.wheel.fire(39), 1)
+        self.assertEqual(fired, ['a'])
+        self.assertEqual(self.wheel.fire(40), 1)
+        self.assertEqual(fired, ['a', 'b'])
+
+    def test_failing_callback_leaves_later_timers_due(self):
+        fired = []
+
+        def fail():
+            raise RuntimeError('callback failed')
+
+        self.wheel.schedule(4.5, fail)
+        second = self.wheel.schedule(5, lambda: fired.append('second'))
+        with self.assertRaises(RuntimeError):
+            self.wheel.fire(5)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertFalse(second.cancelled)
+        self.assertEqual(self.wheel.fire(5), 1)
+        self.assertEqual(fired, ['second'])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_stopping_early_keeps_due_timers(self):
+        for deadline in [1, 2, 3]:
+            self.wheel.schedule(deadline, deadline)
+        cancelled = self.wheel.schedule(3, 'cancelled')
+        advance = self.wheel.advance(3)
+        self.assertEqual(next(advance), 1)
+        advance.close()
+        cancelled.cancel()
+        self.assertEqual(len(self.wheel), 2)
+        self.assertEqual(list(self.wheel.advance(3)), [2, 3])
+
+    def test_next_tick(self):
+        self.assertIsNone(self.wheel.next_tick())
+        self.wheel.schedule(100, 'far')
+        self.assertEqual(self.wheel.next_tick(), 100 - self.wheel.span + 1)
+        self.wheel.schedule(9, 'level 1')
+        self.assertEqual(self.wheel.next_tick(), 4)
+        self.wheel.schedule(3, 'level 0')
+        self.assertEqual(self.wheel.next_tick(), 3)
+        for tick in range(1, 101):
+            next_tick = self.wheel.next_tick()
+            fired = list(self.wheel.advance(tick))
+            if fired:
+                self.assertLessEqual(next_tick, tick)
+
+    def test_matches_sorted_deadlines_across_levels_and_overflow(self):
+        rng = random.Random(0)
+        pending = {}
+        now = 0
+        fired = []
+        for _ in range(300):
+            for _ in range(rng.randrange(5)):
+                deadline = now + rng.choice([1, 3, 20, 70, 500]) * rng.random()
+                pending[self.wheel.schedule(deadline, deadline)] = deadline
+            if pending and rng.random() < 0.3:
+                timer = rng.choice(list(pending))
+                self.wheel.cancel(timer)
+                del pending[timer]
+            now += rng.randrange(4)
+            for deadline in self.wheel.advance(now):
+                self.assertLessEqual(deadline, now)
+                fired.append(deadline)
+            for timer, deadline in list(pending.items()):
+                if deadline <= now:
+                    del pending[timer]
+                    self.assertIn(deadline, fired)
+            self.assertEqual(len(self.wheel), len(pending))
+        self.assertEqual(fired, sorted(fired))
+
+    def test_async_driver(self):
+        async def scenario():
+            driver = AsyncTimerDriver(resolution=0.001)
+            runner = asyncio.create_task(driver.run())
+            fired = []
+            driver.call_later(0.02, lambda: fired.append('second'))
+            driver.call_later(0.01, lambda: fired.append('first'))
+            cancelled = driver.call_later(0.015, lambda: fired.append('never'))
+            cancelled.cancel()
+            await asyncio.sleep(0.1)
+            driver.stop()
+            await runner
+            return fired
+
+        self.assertEqual(asyncio.run(scenario()), ['first', 'second'])
+
+    def test_async_driver_sleeps_until_the_next_timer(self):
+        async def scenario():
+            driver = AsyncTimerDriver(resolution=0.001)
+            fires = []
+            fire = driver.wheel.fire
+            driver.wheel.fire = lambda now: fires.append(now) or fire(now)
+            runner = asyncio.create_task(driver.run())
+            fired = []
+            driver.call_later(0.1, lambda: fired.append('late'))
+            await asyncio.sleep(0.15)
+            driver.stop()
+            await runner
+            return fired, len(fires)
+
+        fired, wakeups = asyncio.run(scenario())
+        self.assertEqual(fired, ['late'])
+        self.assertLess(wakeups, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,306 @@
+"""
+A hierarchical timing wheel for scheduling large numbers of
+timeouts, most of which are cancelled before they fire.
+
+Time is counted in ticks of `resolution` seconds from `start`.
+Level 0 of the wheel has one slot per tick for the next
+2 ** slot_bits ticks. Each higher level has the same number of
+slots, but each slot covers as many ticks as a whole turn of the
+level below. A timer goes into the slot of the lowest level whose
+range reaches its deadline. Every time a level below completes a
+turn, the next slot of the level above is emptied and its timers
+are placed again, one level lower ("cascading"), until they reach
+level 0 and fire.
+
+Deadlines beyond the top level go into an IndexedHeap (from
+generic_heap.Heap) ordered by deadline, and move into the wheel
+once they come within its range.
+
+* `schedule` picks a slot from the bit length of the distance to
+  the deadline: O(1).
+* `cancel` removes the timer from its slot's set: O(1), with no
+  cancelled entries left behind. Cancelling one of the rare
+  far-future timers in the overflow heap takes O(log n).
+* `advance(now)` steps the wheel tick by tick up to `now` and
+  yields the callbacks of the timers that expired, in deadline
+  order per tick. Stretches where the lower levels are empty are
+  skipped a whole turn of those levels at a time, so idle periods
+  cost little. Expired timers wait in a `due` set until their
+  callback is yielded, so if the caller stops iterating early the
+  rest are yielded first by the next `advance`.
+* `next_tick()` returns the earliest tick at which `advance` can
+  have something to do, so a driver can sleep until then.
+
+`fire(now)` calls the expired callbacks directly (synchronous
+mode), and AsyncTimerDriver runs the wheel from an asyncio event
+loop.
+"""
+import asyncio
+import math
+
+from indexed_heap import IndexedHeap
+
+
+"""
+A scheduled callback. `cancel` on the wheel (or on the timer
+itself) stops it from firing.
+"""
+class Timer:
+    def __init__(self, wheel, deadline, tick, callback):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        # the wheel level and slot, the wheel's due set (with level
+        # None), or the overflow heap handle, holding the timer
+        self.level = None
+        self.slot = None
+        self.handle = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.wheel.cancel(self)
+
+
+class HierarchicalTimerWheel:
+    def __init__(self, resolution=0.001, slot_bits=6, levels=4, start=0.0):
+        self.resolution = resolution
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        self.levels = [[set() for _ in range(1 << slot_bits)]
+                       for _ in range(levels)]
+        # deadlines at least this many ticks away overflow
+        self.span = 1 << (slot_bits * levels)
+        self.overflow = IndexedHeap(lambda x, y: x < y)
+        self.start = start
+        self.current_tick = 0
+        # number of timers on each level
+        self.counts = [0] * levels
+        # expired timers whose callbacks have not been yielded yet
+        self.due = set()
+
+    def __len__(self):
+        return (sum(self.counts) + self.overflow.get_size() +
+                len(self.due))
+
+    def _tick_for(self, time):
+        return math.ceil((time - self.start) / self.resolution)
+
+    """
+    Schedules `callback` to be returned by the first `advance` whose
+    time is at or after `deadline`, and returns its Timer.
+    """
+    def schedule(self, deadline, callback):
+        tick = max(self._tick_for(deadline), self.current_tick + 1)
+        timer = Timer(self, deadline, tick, callback)
+        self._place(timer)
+        return timer
+
+    """
+    Stops the timer from firing. Cancelling a timer that already
+    fired or was cancelled does nothing.
+    """
+    def cancel(self, timer):
+        if timer.cancelled:
+            return
+        timer.cancelled = True
+        if timer.slot is not None:
+            timer.slot.discard(timer)
+            timer.slot = None
+            if timer.level is not None:
+                self.counts[timer.level] -= 1
+        elif timer.handle is not None:
+            self.overflow.remove(timer.handle)
+            timer.handle = None
+
+    def _place(self, timer):
+        delta = timer.tick - self.current_tick
+        if delta >= self.span:
+            timer.handle = self.overflow.insert(timer, timer.tick)
+            return
+        level = max(0, (delta.bit_length() - 1) // self.slot_bits)
+        slot = self.levels[level][
+            (timer.tick >> (level * self.slot_bits)) & self.slot_mask]
+        slot.add(timer)
+        timer.level = level
+        timer.slot = slot
+        self.counts[level] += 1
+
+    """Moves overflow timers that are now within the wheel's
+    range into the wheel."""
+    def _migrate(self):
+        overflow = self.overflow
+        while overflow.get_size():
+            handle = overflow.peek_handle()
+            if handle.priority - self.current_tick >= self.span:
+                break
+            timer = overflow.delete()
+            timer.handle = None
+            self._place(timer)
+
+    """Empties a slot and returns its timers, detaching them."""
+    def _take(self, level, index):
+        slot = self.levels[level][index]
+        self.levels[level][index] = set()
+        self.counts[level] -= len(slot)
+        for timer in slot:
+            timer.slot = None
+        return slot
+
+    """
+    Moves the wheel forward to `now`, yielding the callbacks of the
+    timers whose deadlines have passed.
+    """
+    def advance(self, now):
+        target = math.floor((now - self.start) / self.resolution)
+        bits = self.slot_bits
+        mask = self.slot_mask
+        due = self.due
+        while True:
+            yield from self._drain()
+            if self.current_tick >= target:
+                return
+            self._skip(target)
+            self.current_tick += 1
+            tick = self.current_tick
+            self._migrate()
+            for level in range(len(self.levels) - 1, 0, -1):
+                if tick & ((1 << (level * bits)) - 1) == 0:
+                    for timer in self._take(level, (tick >> (level * bits)) & mask):
+                        self._place(timer)
+            for timer in self._take(0, tick & mask):
+                if timer.tick <= tick:
+                    timer.level = None
+                    timer.slot = due
+                    due.add(timer)
+                else:
+                    self._place(timer)
+
+    """
+    Yields the callbacks of the due timers in deadline order. Each
+    timer counts as fired only once its callback has been yielded,
+    and a timer cancelled by an earlier callback is skipped.
+    """
+    def _drain(self):
+        due = self.due
+        if not due:
+            return
+        for timer in sorted(due, key=lambda timer: timer.deadline):
+            if timer.slot is not due:
+                continue
+            due.discard(timer)
+            timer.slot = None
+            timer.cancelled = True
+            yield timer.callback
+
+    """
+    Returns the earliest tick at which a pending timer can fire or
+    needs to move within the wheel, or None if there are no timers.
+    Higher levels only give the tick at which their next slot is
+    emptied, so the answer can be early but never late.
+    """
+    def next_tick(self):
+        if self.due:
+            return self.current_tick
+        ticks = []
+        if self.counts[0]:
+            level = self.levels[0]
+            for tick in range(self.current_tick + 1,
+                              self.current_tick + 1 + len(level)):
+                if level[tick & self.slot_mask]:
+                    ticks.append(tick)
+                    break
+        for level in range(1, len(self.counts)):
+            if self.counts[level]:
+                period = 1 << (level * self.slot_bits)
+                ticks.append((self.current_tick // period + 1) * period)
+                break
+        if self.overflow.get_size():
+            ticks.append(max(self.current_tick + 1,
+                             self.overflow.peek_handle().priority -
+                             self.span + 1))
+        return min(ticks) if ticks else None
+
+    """
+    When the lowest levels hold no timers, nothing can happen
+    before the next tick at which they are refilled, so moves
+    `current_tick` to just before that tick (or `target`, or the
+    tick at which the next overflow timer enters the wheel).
+    """
+    def _skip(self, target):
+        level = 0
+        while level < len(self.counts) and self.counts[level] == 0:
+            level += 1
+        if level == 0:
+            return
+        if level < len(self.counts):
+            period = 1 << (level * self.slot_bits)
+            next_tick = (self.current_tick // period + 1) * period
+        else:
+            next_tick = target
+        next_tick = min(next_tick, target)
+        if self.overflow.get_size():
+            next_tick = min(
+                next_tick, self.overflow.peek_handle().priority - self.span + 1)
+        if next_tick > self.current_tick + 1:
+            self.current_tick = next_tick - 1
+
+    """
+    Advances the wheel to `now` and calls every expired callback.
+    Returns the number of callbacks called. An exception from a
+    callback propagates; the timers still due after it stay in the
+    wheel and fire on the next call.
+    """
+    def fire(self, now):
+        count = 0
+        for callback in self.advance(now):
+            callback()
+            count += 1
+        return count
+
+
+"""
+Drives a HierarchicalTimerWheel from an asyncio event loop, using
+the loop's clock. `call_later` and `call_at` schedule callbacks
+and return their Timer; `run` sleeps until the wheel's next tick
+with anything to do (or until a new timer is scheduled) and then
+fires the expired timers, so idle timers cost no wake-ups.
+"""
+class AsyncTimerDriver:
+    def __init__(self, wheel=None, resolution=0.001):
+        self.loop = asyncio.get_running_loop()
+        if wheel is None:
+            wheel = HierarchicalTimerWheel(resolution, start=self.loop.time())
+        self.wheel = wheel
+        self.wakeup = asyncio.Event()
+        self.stopped = False
+
+    def call_at(self, when, callback):
+        timer = self.wheel.schedule(when, callback)
+        self.wakeup.set()
+        return timer
+
+    def call_later(self, delay, callback):
+        return self.call_at(self.loop.time() + delay, callback)
+
+    def stop(self):
+        self.stopped = True
+        self.wakeup.set()
+
+    async def run(self):
+        wheel = self.wheel
+        while not self.stopped:
+            self.wakeup.clear()
+            tick = wheel.next_tick()
+            if tick is None:
+                await self.wakeup.wait()
+                continue
+            delay = wheel.start + tick * wheel.resolution - self.loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(0)
+            wheel.fire(self.loop.time())
@@ -0,0 +1,87 @@
+"""
+Replays key traces against every cache policy in cache_policies
+and reports the hit ratio and throughput of each one.
+
+A trace file holds one key per line. Every key is looked up with
+`get`, and on a miss it is stored with `set`, the way a
+read-through cache would behave. Without trace files a synthetic
+trace is generated: Zipf-distributed lookups over a hot key space
+interrupted by long sequential scans of keys that are never seen
+again.
+
+    python bench_cache_policies.py --limit 1000 trace1.txt trace2.txt
+    python bench_cache_policies.py --limit 1000 --synthetic 200000
+"""
+import argparse
+import bisect
+import itertools
+import random
+import time
+
+from cache_policies import POLICIES, make_cache
+
+
+def read_trace(path):
+    with open(path) as trace_file:
+        return [line.strip() for line in trace_file if line.strip()]
+
+
+def synthetic_trace(length, key_space=10000, scan_every=20000,
+                    scan_length=5000, skew=1.0, seed=0):
+    rng = random.Random(seed)
+    weights = list(itertools.accumulate(
+        1 / (rank ** skew) for rank in range(1, key_space + 1)))
+    total = weights[-1]
+    scan_keys = itertools.count(key_space)
+    trace = []
+    while len(trace) < length:
+        for _ in range(scan_every):
+            trace.append(bisect.bisect_left(weights, rng.random() * total))
+        trace.extend(next(scan_keys) for _ in range(scan_length))
+    return trace[:length]
+
+
+"""
+Replays the trace against a new cache of the given policy and
+returns (hit ratio, operations per second).
+"""
+def replay(policy, limit, trace):
+    cache = make_cache(policy, limit)
+    get = cache.get
+    set_ = cache.set
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if get(key) is None:
+            set_(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('traces', nargs='*', help='files with one key per line')
+    parser.add_argument('--limit', type=int, default=1000)
+    parser.add_argument('--policies', nargs='+', default=list(POLICIES),
+                        choices=list(POLICIES))
+    parser.add_argument('--synthetic', type=int, default=200000,
+                        help='length of the synthetic trace used when '
+                             'no trace files are given')
+    args = parser.parse_args()
+
+    if args.traces:
+        traces = [(path, read_trace(path)) for path in args.traces]
+    else:
+        traces = [('synthetic', synthetic_trace(args.synthetic))]
+
+    print(f"{'trace':<20} {'policy':<8} {'hit ratio':>10} {'ops/sec':>12}")
+    for name, trace in traces:
+        for policy in args.policies:
+            hit_ratio, ops = replay(policy, args.limit, trace)
+            print(f"{name:<20} {policy:<8} {hit_ratio:>10.4f} {ops:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,401 @@
+"""
+Scan-resistant alternatives to the plain LRUCache. A single pass
+over more keys than an LRUCache can hold evicts every entry it
+was holding, even the ones that are used all the time. The caches
+in this module share LRUCache's `get`/`set` interface but decide
+what to keep (eviction) and what to let in (admission) using more
+than recency alone:
+
+* TwoQueueCache (2Q) only promotes keys into its main LRU list
+  once they have been seen again after leaving a FIFO probation
+  queue.
+* ARCCache (Adaptive Replacement Cache) balances a recency list
+  against a frequency list, using ghost entries of recently
+  evicted keys to learn how to split the space between them.
+* TinyLFUCache (W-TinyLFU) keeps a small LRU window in front of a
+  segmented LRU main area, and only admits a key into the main
+  area if a CountMinSketch estimates it is used more often than
+  the entry it would replace.
+
+`POLICIES` maps a short name to each cache class, including the
+plain LRUCache, and `make_cache` builds one by name.
+"""
+from doubly_linked_list import DoublyLinkedList
+from lru_cache import LRUCache
+
+
+"""
+A recency-ordered collection of key-value pairs built from the
+same pieces as LRUCache: a DoublyLinkedList whose head is the
+least-recently used entry and a dict from keys to list nodes.
+"""
+class RecencyList:
+    def __init__(self):
+        self.order = DoublyLinkedList()
+        self.storage = {}
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __contains__(self, key):
+        return key in self.storage
+
+    """
+    Returns the value stored for the key, or None if it is not
+    in the list. Does not change the order.
+    """
+    def peek(self, key):
+        node = self.storage.get(key)
+        return None if node is None else node.value[1]
+
+    """
+    Adds the pair as the most-recently used entry, replacing any
+    previous entry for the key.
+    """
+    def push(self, key, value=None):
+        node = self.storage.get(key)
+        if node is not None:
+            node.value[1] = value
+            self.order.move_to_end(node)
+            return
+        self.order.add_to_tail([key, value])
+        self.storage[key] = self.order.tail
+
+    """
+    Marks the key as the most-recently used entry.
+    """
+    def touch(self, key):
+        self.order.move_to_end(self.storage[key])
+
+    """
+    Overwrites the value stored for the key without changing the
+    order.
+    """
+    def update(self, key, value):
+        self.storage[key].value[1] = value
+
+    """
+    Removes the key and returns its value.
+    """
+    def remove(self, key):
+        node = self.storage.pop(key)
+        self.order.delete(node)
+        return node.value[1]
+
+    """
+    Returns the least-recently used key without removing it.
+    """
+    def oldest(self):
+        return self.order.head.value[0]
+
+    """
+    Removes the least-recently used entry and returns it as a
+    (key, value) tuple.
+    """
+    def pop_oldest(self):
+        key, value = self.order.remove_from_head()
+        del self.storage[key]
+        return key, value
+
+
+"""
+The 2Q policy (Johnson & Shasha). New keys enter `a1_in`, a FIFO
+queue holding about a quarter of the cache. Keys falling out of
+`a1_in` are remembered, without their values, in the `a1_out`
+ghost queue. Only a key that is set again while it is remembered
+in `a1_out` is admitted into `am`, the LRU list holding the hot
+entries, so a one-time scan only ever churns `a1_in`.
+"""
+class TwoQueueCache:
+    def __init__(self, limit=10, in_ratio=0.25, out_ratio=0.5):
+        self.limit = limit
+        self.in_limit = max(1, int(limit * in_ratio))
+        self.out_limit = max(1, int(limit * out_ratio))
+        self.a1_in = RecencyList()
+        self.a1_out = RecencyList()
+        self.am = RecencyList()
+
+    def __len__(self):
+        return len(self.a1_in) + len(self.am)
+
+    """
+    Retrieves the value associated with the given key, or None if
+    it is not cached. Hits in `am` move the key to the
+    most-recently used end; hits in `a1_in` leave the FIFO order
+    alone.
+    """
+    def get(self, key):
+        if key in self.am:
+            self.am.touch(key)
+            return self.am.peek(key)
+        if key in self.a1_in:
+            return self.a1_in.peek(key)
+        return None
+
+    """
+    Adds or overwrites the given key-value pair, evicting an entry
+    first if the cache is full.
+    """
+    def set(self, key, value):
+        if key in self.am:
+            self.am.push(key, value)
+        elif key in self.a1_in:
+            self.a1_in.update(key, value)
+        elif key in self.a1_out:
+            self.a1_out.remove(key)
+            self._reclaim()
+            self.am.push(key, value)
+        elif self.limit > 0:
+            self._reclaim()
+            self.a1_in.push(key, value)
+
+    def _reclaim(self):
+        if len(self) < self.limit:
+            return
+        if len(self.a1_in) > self.in_limit or len(self.am) == 0:
+            key, _ = self.a1_in.pop_oldest()
+            self.a1_out.push(key)
+            if len(self.a1_out) > self.out_limit:
+                self.a1_out.pop_oldest()
+        else:
+            self.am.pop_oldest()
+
+
+"""
+The Adaptive Replacement Cache (Megiddo & Modha). `t1` holds keys
+seen once recently and `t2` keys seen at least twice. `b1` and
+`b2` remember the keys recently evicted from each of them. A set
+that hits a ghost in `b1` means `t1` was too small, so the target
+size `p` of `t1` grows, and a ghost hit in `b2` shrinks it.
+"""
+class ARCCache:
+    def __init__(self, limit=10):
+        self.limit = limit
+        self.p = 0
+        self.t1 = RecencyList()
+        self.t2 = RecencyList()
+        self.b1 = RecencyList()
+        self.b2 = RecencyList()
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+    """
+    Retrieves the value associated with the given key, or None if
+    it is not cached. Any hit moves the key to the most-recently
+    used end of `t2`.
+    """
+    def get(self, key):
+        if key in self.t1:
+            value = self.t1.remove(key)
+            self.t2.push(key, value)
+            return value
+        if key in self.t2:
+            self.t2.touch(key)
+            return self.t2.peek(key)
+        return None
+
+    """
+    Adds or overwrites the given key-value pair, adapting `p` when
+    the key is remembered in one of the ghost lists.
+    """
+    def set(self, key, value):
+        limit = self.limit
+        if key in self.t1:
+            self.t1.remove(key)
+            self.t2.push(key, value)
+        elif key in self.t2:
+            self.t2.push(key, value)
+        elif key in self.b1:
+            self.p = min(limit, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(key)
+            self.b1.remove(key)
+            self.t2.push(key, value)
+        elif key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(key)
+            self.b2.remove(key)
+            self.t2.push(key, value)
+        elif limit > 0:
+            l1 = len(self.t1) + len(self.b1)
+            total = l1 + len(self.t2) + len(self.b2)
+            if l1 >= limit:
+                if len(self.t1) < limit:
+                    self.b1.pop_oldest()
+                    self._replace(key)
+                else:
+                    self.t1.pop_oldest()
+            elif total >= limit:
+                if total >= 2 * limit:
+                    self.b2.pop_oldest()
+                self._replace(key)
+            self.t1.push(key, value)
+
+    def _replace(self, key):
+        if len(self) < self.limit:
+            return
+        if len(self.t1) > 0 and (
+                len(self.t1) > self.p or
+                (key in self.b2 and len(self.t1) == self.p)):
+            old_key, _ = self.t1.pop_oldest()
+            self.b1.push(old_key)
+        else:
+            old_key, _ = self.t2.pop_oldest()
+            self.b2.push(old_key)
+
+
+"""
+A count-min sketch estimating how often each key has been seen,
+in a fixed amount of memory. Each of the `depth` rows hashes the
+key to one of `width` counters; the estimate is the smallest of
+the key's counters, which can overestimate but never
+underestimate. Once `sample_size` increments have been recorded
+every counter is halved, so the estimates favour recent history.
+"""
+class CountMinSketch:
+    _MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F,
+                    0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+
+    def __init__(self, width=1024, depth=4, sample_size=None):
+        if depth > len(self._MULTIPLIERS):
+            raise ValueError(
+                f"depth must be at most {len(self._MULTIPLIERS)}")
+        # round the width up to a power of two for cheap indexing
+        self.bits = max(1, (width - 1).bit_length())
+        self.width = 1 << self.bits
+        self.depth = depth
+        self.rows = [[0] * self.width for _ in range(depth)]
+        self.sample_size = sample_size or 10 * self.width
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = hash(key)
+        shift = 64 - self.bits
+        mask = 0xFFFFFFFFFFFFFFFF
+        return [((h * multiplier) & mask) >> shift
+                for multiplier in self._MULTIPLIERS[:self.depth]]
+
+    """
+    Records one more occurrence of the key.
+    """
+    def increment(self, key):
+        for row, index in zip(self.rows, self._indexes(key)):
+            row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    """
+    Returns the estimated number of occurrences of the key.
+    """
+    def estimate(self, key):
+        return min(row[index]
+                   for row, index in zip(self.rows, self._indexes(key)))
+
+    """
+    Halves every counter so that old popularity fades out.
+    """
+    def reset(self):
+        for row in self.rows:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self.additions >>= 1
+
+
+"""
+The W-TinyLFU policy (Einziger, Friedman & Manes). New keys land
+in a small LRU `window`. When the window overflows, its oldest
+key becomes a candidate for the main area, a segmented LRU made of
+a `probation` and a `protected` list. The candidate is admitted
+only if the sketch says it is used more often than the entry
+probation would evict for it. Keys hit while on probation are
+promoted to the protected list.
+"""
+class TinyLFUCache:
+    def __init__(self, limit=10, window_ratio=0.01, protected_ratio=0.8,
+                 sketch=None):
+        self.limit = limit
+        self.window_limit = max(1, int(limit * window_ratio))
+        self.main_limit = max(0, limit - self.window_limit)
+        self.protected_limit = int(self.main_limit * protected_ratio)
+        self.window = RecencyList()
+        self.probation = RecencyList()
+        self.protected = RecencyList()
+        self.sketch = sketch or CountMinSketch(width=max(16, limit))
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    """
+    Retrieves the value associated with the given key, or None if
+    it is not cached, recording the access in the sketch.
+    """
+    def get(self, key):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.touch(key)
+            return self.window.peek(key)
+        if key in self.protected:
+            self.protected.touch(key)
+            return self.protected.peek(key)
+        if key in self.probation:
+            value = self.probation.remove(key)
+            self._protect(key, value)
+            return value
+        return None
+
+    """
+    Adds or overwrites the given key-value pair. A new key always
+    enters the window; whatever the window pushes out has to win
+    the admission check to stay in the cache.
+    """
+    def set(self, key, value):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.push(key, value)
+        elif key in self.protected:
+            self.protected.push(key, value)
+        elif key in self.probation:
+            self.probation.remove(key)
+            self._protect(key, value)
+        elif self.limit > 0:
+            self.window.push(key, value)
+            if len(self.window) > self.window_limit:
+                self._admit(*self.window.pop_oldest())
+
+    def _protect(self, key, value):
+        self.protected.push(key, value)
+        if len(self.protected) > self.protected_limit:
+            self.probation.push(*self.protected.pop_oldest())
+
+    def _admit(self, key, value):
+        if len(self.probation) + len(self.protected) < self.main_limit:
+            self.probation.push(key, value)
+            return
+        victims = self.probation if len(self.probation) else self.protected
+        if len(victims) == 0:
+            return
+        victim = victims.oldest()
+        if self.sketch.estimate(key) > self.sketch.estimate(victim):
+            victims.remove(victim)
+            self.probation.push(key, value)
+
+
+POLICIES = {
+    'lru': LRUCache,
+    '2q': TwoQueueCache,
+    'arc': ARCCache,
+    'tinylfu': TinyLFUCache,
+}
+
+
+"""
+Builds a cache holding at most `limit` entries using the named
+policy, one of the keys of POLICIES.
+"""
+def make_cache(policy, limit=10):
+    try:
+        cache_class = POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"unknown cache policy: {policy!r}") from None
+    return cache_class(limit)
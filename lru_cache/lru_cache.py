@@ -1,3 +1,8 @@
+import time
+
+from doubly_linked_list import DoublyLinkedList
+
+
 class LRUCache:
     """
     Our LRUCache class keeps track of the max number of nodes it
@@ -5,19 +10,49 @@ class LRUCache:
     linked list that holds the key-value entries in the correct
     order, as well as a storage dict that provides fast access
     to every node stored in the cache.
+
+    Entries can optionally expire: `ttl` sets a default time-to-
+    live in seconds for every entry, which `set` can override per
+    entry. The cache can also be bounded by the total cost of its
+    entries through `max_cost`. The cost of an entry is passed to
+    `set`, computed by the `sizeof` function (for example a byte
+    size) or defaults to 1. Expired entries are dropped lazily
+    when they are looked up, and by a sweep that only examines
+    `sweep_batch` entries per call so it never walks the whole
+    cache at once.
     """
-    def __init__(self, limit=10):
-        pass
+    def __init__(self, limit=10, max_cost=None, ttl=None, sizeof=None,
+                 clock=time.monotonic, sweep_batch=8):
+        self.limit = limit
+        self.size = 0
+        self.order = DoublyLinkedList()
+        self.storage = {}
+        self.max_cost = max_cost
+        self.total_cost = 0
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.sweep_batch = sweep_batch
+        # the next node the incremental sweep will examine
+        self._sweep_cursor = None
 
     """
     Retrieves the value associated with the given key. Also
     needs to move the key-value pair to the end of the order
     such that the pair is considered most-recently used.
-    Returns the value associated with the key or None if the
-    key-value pair doesn't exist in the cache.
+    Returns the value associated with the key or `default` if
+    the key-value pair doesn't exist in the cache or has expired.
     """
-    def get(self, key):
-        pass
+    def get(self, key, default=None):
+        node = self.storage.get(key)
+        if node is None:
+            return default
+        expires_at = node.value[2]
+        if expires_at is not None and expires_at <= self.clock():
+            self._remove(node)
+            return default
+        self.order.move_to_end(node)
+        return node.value[1]
 
     """
     Adds the given key-value pair to the cache. The newly-
@@ -28,6 +63,69 @@ class LRUCache:
     case that the key already exists in the cache, we simply
     want to overwrite the old value associated with the key with
     the newly-specified value.
+
+    `ttl` overrides the cache's default time-to-live for this
+    entry and `cost` overrides the cost computed by `sizeof`.
+    An entry whose cost alone exceeds `max_cost` is not stored.
+    """
+    def set(self, key, value, ttl=None, cost=None):
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+        if cost is None:
+            cost = 1 if self.sizeof is None else self.sizeof(value)
+
+        node = self.storage.get(key)
+        if node is not None:
+            self._remove(node)
+        if self.limit <= 0:
+            return
+        if self.max_cost is not None and cost > self.max_cost:
+            return
+
+        while self.size >= self.limit or (
+                self.max_cost is not None and
+                self.total_cost + cost > self.max_cost):
+            self._remove(self.order.head)
+        self.order.add_to_tail([key, value, expires_at, cost])
+        self.storage[key] = self.order.tail
+        self.size += 1
+        self.total_cost += cost
+
+        self.sweep(self.sweep_batch)
+
+    """
+    Examines at most `budget` entries, continuing from where the
+    previous sweep stopped, and removes the ones that have
+    expired. Returns the number of entries removed. Called with
+    a small budget on every `set`; it can also be called
+    periodically to reclaim memory from an otherwise idle cache.
+    """
+    def sweep(self, budget=None):
+        if budget is None:
+            budget = self.sweep_batch
+        now = self.clock()
+        removed = 0
+        for _ in range(min(budget, self.size)):
+            node = self._sweep_cursor
+            if node is None:
+                node = self.order.head
+            self._sweep_cursor = node.next
+            expires_at = node.value[2]
+            if expires_at is not None and expires_at <= now:
+                self._remove(node)
+                removed += 1
+        return removed
+
+    """
+    Removes the given entry node from the order and the storage
+    dict, keeping the sweep cursor pointed at a live node.
     """
-    def set(self, key, value):
-        pass
+    def _remove(self, node):
+        if node is self._sweep_cursor:
+            self._sweep_cursor = node.next
+        key, _, _, cost = node.value
+        self.order.delete(node)
+        del self.storage[key]
+        self.size -= 1
+        self.total_cost -= cost
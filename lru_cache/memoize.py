@@ -0,0 +1,180 @@
+"""
+A memoization decorator that stores results in an LRUCache.
+
+    @memoize(limit=256)
+    def load_profile(user_id):
+        ...
+
+    @memoize(limit=256, ttl=60)
+    async def fetch_rates(currency):
+        ...
+
+Arguments are turned into a hashable key the same way
+functools.lru_cache does it, so every argument must be hashable.
+Calls are single-flight: when several callers miss on the same key
+at the same time, only the first one runs the function and the
+others wait for its result instead of computing it again. If that
+call raises, the exception is passed to every caller that was
+waiting on it and nothing is cached. If an async call that is
+computing a value is cancelled, the callers waiting on it are not:
+they retry, and one of them runs the function instead.
+
+The decorated function gains `cache_info()`, which returns the
+hit and miss counts together with the cache's limit and current
+size, and `cache_clear()`, which empties the cache and resets the
+counts. Callers that waited on another caller's computation count
+as hits, so `misses` is the number of times the function ran.
+"""
+import asyncio
+import functools
+import threading
+from collections import namedtuple
+
+from lru_cache import LRUCache
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_MISSING = object()
+# tells the callers waiting on a cancelled computation to retry
+_RETRY = object()
+_KWARGS_MARK = object()
+
+
+def _make_key(args, kwargs, typed):
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,)
+        for item in kwargs.items():
+            key += item
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    if len(key) == 1 and type(key[0]) in (int, str):
+        return key[0]
+    return key
+
+
+"""
+Holds the outcome of a computation that other threads are
+waiting on.
+"""
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def memoize(limit=128, typed=False, ttl=None):
+    def decorator(fn):
+        lock = threading.Lock()
+        in_flight = {}
+        state = {'cache': LRUCache(limit, ttl=ttl), 'hits': 0, 'misses': 0}
+
+        def lookup(key):
+            value = state['cache'].get(key, _MISSING)
+            if value is not _MISSING:
+                state['hits'] += 1
+            return value
+
+        def store(key, value):
+            state['cache'].set(key, value)
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs, typed)
+                while True:
+                    with lock:
+                        value = lookup(key)
+                        if value is not _MISSING:
+                            return value
+                        future = in_flight.get(key)
+                        leader = future is None
+                        if leader:
+                            state['misses'] += 1
+                            future = in_flight[key] = \
+                                asyncio.get_running_loop().create_future()
+                        else:
+                            state['hits'] += 1
+                    if leader:
+                        break
+                    value = await asyncio.shield(future)
+                    if value is not _RETRY:
+                        return value
+                    # the leader was cancelled: try again, and maybe lead
+                    with lock:
+                        state['hits'] -= 1
+                try:
+                    value = await fn(*args, **kwargs)
+                except asyncio.CancelledError:
+                    with lock:
+                        del in_flight[key]
+                    # only the leader was cancelled; its waiters retry
+                    future.set_result(_RETRY)
+                    raise
+                except BaseException as error:
+                    with lock:
+                        del in_flight[key]
+                    future.set_exception(error)
+                    # mark the exception as retrieved when nobody waited
+                    future.exception()
+                    raise
+                with lock:
+                    store(key, value)
+                    del in_flight[key]
+                future.set_result(value)
+                return value
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs, typed)
+                with lock:
+                    value = lookup(key)
+                    if value is not _MISSING:
+                        return value
+                    call = in_flight.get(key)
+                    leader = call is None
+                    if leader:
+                        state['misses'] += 1
+                        call = in_flight[key] = _Call()
+                    else:
+                        state['hits'] += 1
+                if not leader:
+                    call.event.wait()
+                    if call.error is not None:
+                        raise call.error
+                    return call.result
+                try:
+                    value = fn(*args, **kwargs)
+                except BaseException as error:
+                    call.error = error
+                    with lock:
+                        del in_flight[key]
+                    call.event.set()
+                    raise
+                call.result = value
+                with lock:
+                    store(key, value)
+                    del in_flight[key]
+                call.event.set()
+                return value
+
+        def cache_info():
+            with lock:
+                return CacheInfo(state['hits'], state['misses'], limit,
+                                 state['cache'].size)
+
+        def cache_clear():
+            with lock:
+                state['cache'] = LRUCache(limit, ttl=ttl)
+                state['hits'] = 0
+                state['misses'] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
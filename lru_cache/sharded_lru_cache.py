@@ -0,0 +1,114 @@
+import threading
+
+from lru_cache import LRUCache
+
+
+_MISSING = object()
+
+
+def _shares(total, parts):
+    share, extra = divmod(total, parts)
+    return [share + (1 if i < extra else 0) for i in range(parts)]
+
+"""
+Each LRUCacheShard owns an independent LRUCache along with the
+lock that guards it and the hit/miss counters for the keys that
+hash into it. Keeping the counters per shard means that bumping
+them never requires a lock shared with the other shards.
+"""
+class LRUCacheShard:
+    def __init__(self, limit, **options):
+        self.cache = LRUCache(limit, **options)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+"""
+A thread-safe LRU cache that splits its keys across a number of
+independently locked shards. A key always lives in the shard
+picked by its hash, so two threads only contend with each other
+when their keys land in the same shard. Each shard keeps its own
+recency order and evicts its own least-recently used entry once
+it reaches its share of the overall limit, which makes eviction
+approximately (not strictly) LRU across the whole cache.
+
+`limit` is split across the shards so that their limits add up
+to it exactly: every shard gets `limit // shards` entries and the
+first `limit % shards` shards one more. A shard whose share is 0
+stores nothing, so `limit` should be at least `shards`.
+`max_cost` is split the same way; the remaining keyword arguments
+(`ttl`, `sizeof`, `clock`, `sweep_batch`) are passed to every
+shard's LRUCache.
+"""
+class ShardedLRUCache:
+    def __init__(self, limit=10, shards=8, max_cost=None, **options):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.limit = limit
+        self.max_cost = max_cost
+        limits = _shares(limit, shards)
+        costs = [None] * shards
+        if max_cost is not None:
+            costs = _shares(max_cost, shards)
+        self.shards = [LRUCacheShard(shard_limit, max_cost=shard_cost,
+                                     **options)
+                       for shard_limit, shard_cost in zip(limits, costs)]
+
+    def __len__(self):
+        return sum(shard.cache.size for shard in self.shards)
+
+    """
+    Returns the shard responsible for the given key.
+    """
+    def shard_for(self, key):
+        return self.shards[hash(key) % len(self.shards)]
+
+    """
+    Retrieves the value associated with the given key, marking
+    it as the most-recently used entry of its shard. Returns None
+    if the key is not in the cache.
+    """
+    def get(self, key):
+        shard = self.shard_for(key)
+        with shard.lock:
+            value = shard.cache.get(key, _MISSING)
+            if value is _MISSING:
+                shard.misses += 1
+                return None
+            shard.hits += 1
+            return value
+
+    """
+    Adds or overwrites the given key-value pair in the key's
+    shard, evicting that shard's least-recently used entry if
+    the shard is already full. `ttl` and `cost` are passed on
+    to the shard's LRUCache.
+    """
+    def set(self, key, value, ttl=None, cost=None):
+        shard = self.shard_for(key)
+        with shard.lock:
+            shard.cache.set(key, value, ttl, cost)
+
+    @property
+    def hits(self):
+        return sum(shard.hits for shard in self.shards)
+
+    @property
+    def misses(self):
+        return sum(shard.misses for shard in self.shards)
+
+    """
+    Returns a dict with the cache-wide hit and miss counts as well
+    as the number of entries currently stored.
+    """
+    def stats(self):
+        hits = self.hits
+        misses = self.misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / total if total else 0.0,
+            'size': len(self),
+        }
@@ -0,0 +1,90 @@
+import unittest
+from cache_policies import (ARCCache, CountMinSketch, TinyLFUCache,
+                            TwoQueueCache, make_cache, POLICIES)
+
+
+class PolicyTestsMixin:
+    cache_class = None
+
+    def setUp(self):
+        self.cache = self.cache_class(100)
+
+    def test_cache_insertion_and_retrieval(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.assertIsNone(self.cache.get('nonexistent'))
+
+    def test_cache_overwrite_appropriately(self):
+        self.cache.set('item1', 'a')
+        self.cache.get('item1')
+        self.cache.set('item1', 'z')
+        self.assertEqual(self.cache.get('item1'), 'z')
+        self.assertEqual(len(self.cache), 1)
+
+    def test_cache_never_exceeds_limit(self):
+        for i in range(1000):
+            self.cache.set(i % 350, i)
+            self.cache.get(i % 7)
+            self.assertLessEqual(len(self.cache), 100)
+
+    def test_hot_keys_survive_a_scan(self):
+        hot = [f'hot{i}' for i in range(20)]
+        cold = iter(range(10 ** 6, 2 * 10 ** 6))
+        for _ in range(10):
+            for key in hot:
+                if self.cache.get(key) is None:
+                    self.cache.set(key, key)
+            for _ in range(50):
+                key = next(cold)
+                self.cache.set(key, key)
+        for i in range(1000):
+            if self.cache.get(i) is None:
+                self.cache.set(i, i)
+        survivors = sum(self.cache.get(key) is not None for key in hot)
+        self.assertGreaterEqual(survivors, 15)
+
+
+class TwoQueueCacheTests(PolicyTestsMixin, unittest.TestCase):
+    cache_class = TwoQueueCache
+
+
+class ARCCacheTests(PolicyTestsMixin, unittest.TestCase):
+    cache_class = ARCCache
+
+
+class TinyLFUCacheTests(PolicyTestsMixin, unittest.TestCase):
+    cache_class = TinyLFUCache
+
+
+class CountMinSketchTests(unittest.TestCase):
+    def test_estimates_never_undercount(self):
+        sketch = CountMinSketch(width=64, sample_size=10 ** 6)
+        for i in range(200):
+            for _ in range(i % 5):
+                sketch.increment(i)
+        for i in range(200):
+            self.assertGreaterEqual(sketch.estimate(i), i % 5)
+
+    def test_reset_halves_counters(self):
+        sketch = CountMinSketch(width=64, sample_size=8)
+        for _ in range(7):
+            sketch.increment('key')
+        self.assertEqual(sketch.estimate('key'), 7)
+        sketch.increment('key')
+        self.assertEqual(sketch.estimate('key'), 4)
+
+
+class MakeCacheTests(unittest.TestCase):
+    def test_builds_every_policy(self):
+        for name, cache_class in POLICIES.items():
+            self.assertIsInstance(make_cache(name, 5), cache_class)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            make_cache('mru')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,14 @@ import unittest
 from lru_cache import LRUCache
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
 class CacheTests(unittest.TestCase):
     def setUp(self):
         self.cache = LRUCache(3)
@@ -32,6 +40,54 @@ class CacheTests(unittest.TestCase):
     def test_cache_nonexistent_retrieval(self):
         self.assertIsNone(self.cache.get('nonexistent'))
 
+    def test_cache_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        self.cache = LRUCache(3, ttl=10, clock=clock)
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b', ttl=20)
+
+        clock.now = 10
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.assertEqual(self.cache.size, 1)
+
+        clock.now = 20
+        self.assertEqual(self.cache.get('item2', 'gone'), 'gone')
+        self.assertEqual(self.cache.size, 0)
+
+    def test_sweep_removes_expired_entries_incrementally(self):
+        clock = FakeClock()
+        self.cache = LRUCache(10, clock=clock, sweep_batch=0)
+        for i in range(6):
+            self.cache.set(i, i, ttl=5)
+        self.cache.set('keep', 'k')
+
+        clock.now = 5
+        self.assertEqual(self.cache.sweep(4), 4)
+        self.assertEqual(self.cache.size, 3)
+        self.assertEqual(self.cache.sweep(4), 2)
+        self.assertEqual(self.cache.size, 1)
+        self.assertEqual(self.cache.get('keep'), 'k')
+
+    def test_cache_evicts_by_cost(self):
+        self.cache = LRUCache(10, max_cost=10, sizeof=len)
+        self.cache.set('item1', 'aaaa')
+        self.cache.set('item2', 'bbbb')
+        self.cache.get('item1')
+        self.cache.set('item3', 'cccc')
+
+        self.assertIsNone(self.cache.get('item2'))
+        self.assertEqual(self.cache.get('item1'), 'aaaa')
+        self.assertEqual(self.cache.get('item3'), 'cccc')
+        self.assertEqual(self.cache.total_cost, 8)
+
+        self.cache.set('item4', 'x', cost=11)
+        self.assertIsNone(self.cache.get('item4'))
+        self.assertEqual(self.cache.total_cost, 8)
+
+        self.cache.set('item1', 'a')
+        self.assertEqual(self.cache.total_cost, 5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+import unittest
+from memoize import memoize
+
+
+class MemoizeTests(unittest.TestCase):
+    def test_results_are_cached(self):
+        calls = []
+
+        @memoize(limit=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(x=3), 9)
+        self.assertEqual(calls, [3, 3])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertEqual((info.maxsize, info.currsize), (2, 2))
+
+        square(4)
+        square(5)
+        self.assertEqual(square.cache_info().currsize, 2)
+
+        square.cache_clear()
+        self.assertEqual(square.cache_info(), (0, 0, 2, 0))
+
+    def test_typed_keys(self):
+        @memoize(typed=True)
+        def identity(x):
+            return x
+
+        self.assertIs(type(identity(1)), int)
+        self.assertIs(type(identity(1.0)), float)
+
+    def test_exceptions_are_not_cached(self):
+        attempts = []
+
+        @memoize()
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise RuntimeError('boom')
+            return x
+
+        with self.assertRaises(RuntimeError):
+            flaky(1)
+        self.assertEqual(flaky(1), 1)
+        self.assertEqual(len(attempts), 2)
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        release = threading.Event()
+
+        @memoize()
+        def slow(x):
+            calls.append(x)
+            release.wait()
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow(21)))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, [21])
+        self.assertEqual(results, [42] * 10)
+        self.assertEqual(slow.cache_info().misses, 1)
+
+    def test_async_functions(self):
+        calls = []
+
+        @memoize()
+        async def fetch(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x + 1
+
+        async def main():
+            return await asyncio.gather(*(fetch(1) for _ in range(10)))
+
+        self.assertEqual(asyncio.run(main()), [2] * 10)
+        self.assertEqual(calls, [1])
+        self.assertEqual(asyncio.run(fetch(1)), 2)
+        self.assertEqual(fetch.cache_info().misses, 1)
+
+    def test_async_errors_reach_every_waiter(self):
+        @memoize()
+        async def broken(x):
+            await asyncio.sleep(0.01)
+            raise ValueError(x)
+
+        async def main():
+            return await asyncio.gather(*(broken(1) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    def test_cancelled_async_leader_does_not_cancel_waiters(self):
+        calls = []
+
+        @memoize()
+        async def fetch(x):
+            calls.append(x)
+            await asyncio.sleep(1 if len(calls) == 1 else 0.01)
+            return x + 1
+
+        async def main():
+            leader = asyncio.create_task(fetch(1))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(fetch(1)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return await asyncio.gather(*followers)
+
+        self.assertEqual(asyncio.run(main()), [2, 2, 2])
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(fetch.cache_info().misses, 2)
+        self.assertEqual(fetch.cache_info().hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
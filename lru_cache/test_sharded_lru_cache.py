@@ -0,0 +1,91 @@
+import threading
+import unittest
+from sharded_lru_cache import ShardedLRUCache
+
+
+class ShardedCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = ShardedLRUCache(limit=8, shards=4)
+
+    def test_cache_insertion_and_retrieval(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.assertIsNone(self.cache.get('nonexistent'))
+
+    def test_cache_overwrite_appropriately(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item1', 'z')
+        self.assertEqual(self.cache.get('item1'), 'z')
+        self.assertEqual(len(self.cache), 1)
+
+    def test_shard_evicts_its_own_oldest_entry(self):
+        cache = ShardedLRUCache(limit=2, shards=1)
+        cache.set(1, 'a')
+        cache.set(2, 'b')
+        cache.get(1)
+        cache.set(3, 'c')
+        self.assertEqual(cache.get(1), 'a')
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), 'c')
+
+    def test_size_stays_within_shard_limits(self):
+        for i in range(100):
+            self.cache.set(i, i)
+        for shard in self.cache.shards:
+            self.assertLessEqual(shard.cache.size, 2)
+        self.assertLessEqual(len(self.cache), 8)
+
+    def test_shard_limits_add_up_to_limit(self):
+        cache = ShardedLRUCache(max_cost=20)
+        self.assertEqual([shard.cache.limit for shard in cache.shards],
+                         [2, 2, 1, 1, 1, 1, 1, 1])
+        self.assertEqual(sum(shard.cache.max_cost for shard in cache.shards),
+                         20)
+        for i in range(100):
+            cache.set(i, i)
+        self.assertLessEqual(len(cache), 10)
+
+    def test_hit_and_miss_counters(self):
+        self.cache.set('item1', None)
+        self.assertIsNone(self.cache.get('item1'))
+        self.cache.get('item2')
+        self.cache.get('item3')
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 2)
+        stats = self.cache.stats()
+        self.assertEqual(stats['size'], 1)
+        self.assertAlmostEqual(stats['hit_ratio'], 1 / 3)
+
+    def test_expired_entries_count_as_misses(self):
+        now = [0]
+        cache = ShardedLRUCache(limit=4, shards=2, ttl=5,
+                                clock=lambda: now[0])
+        cache.set('item1', 'a')
+        now[0] = 5
+        self.assertIsNone(cache.get('item1'))
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 1)
+
+    def test_concurrent_access(self):
+        cache = ShardedLRUCache(limit=1000, shards=16)
+
+        def worker(offset):
+            for i in range(500):
+                cache.set(offset + i, i)
+                cache.get(offset + i)
+
+        threads = [threading.Thread(target=worker, args=(n * 500,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.hits + cache.misses, 4000)
+        self.assertLessEqual(len(cache), 16 * 63)
+
+
+if __name__ == '__main__':
+    unittest.main()
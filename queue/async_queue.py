@@ -0,0 +1,105 @@
+"""
+An asyncio Queue for handing work between coroutines without
+polling. It mirrors BlockingQueue: `await dequeue()` suspends
+until a value is available, `await enqueue()` suspends while the
+queue holds `high_water_mark` or more values, both accept a
+`timeout` in seconds, and `close()` wakes every waiting coroutine.
+
+Each waiting coroutine parks on its own future, and a change to
+the queue resolves only the futures of the coroutines that can
+make progress. The queue belongs to the event loop that uses it
+and must not be shared between threads.
+"""
+import asyncio
+from collections import deque
+
+from blocking_queue import QueueClosed, QueueEmpty
+from ring_buffer_queue import QueueFull, RingBufferQueue
+
+
+class AsyncQueue:
+    def __init__(self, high_water_mark=None, capacity=16):
+        self.storage = RingBufferQueue(capacity)
+        self.high_water_mark = high_water_mark
+        self.closed = False
+        self.getters = deque()
+        self.putters = deque()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def _full(self):
+        return (self.high_water_mark is not None and
+                len(self.storage) >= self.high_water_mark)
+
+    @staticmethod
+    def _wake_one(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @staticmethod
+    def _deadline(timeout):
+        if timeout is None:
+            return None
+        return asyncio.get_running_loop().time() + timeout
+
+    """
+    Parks the current coroutine until it is woken from `waiters`
+    or the deadline passes. If it is cancelled or times out after
+    being woken, the wake-up is passed on to the next waiter so it
+    does not get lost.
+    """
+    async def _wait(self, waiters, deadline, error):
+        loop = asyncio.get_running_loop()
+        timeout = None
+        if deadline is not None:
+            timeout = max(0, deadline - loop.time())
+        waiter = loop.create_future()
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as exc:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiter.cancelled():
+                self._wake_one(waiters)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise error from None
+            raise
+
+    async def enqueue(self, value, timeout=None):
+        deadline = self._deadline(timeout)
+        while self._full() and not self.closed:
+            await self._wait(self.putters, deadline,
+                             QueueFull("timed out waiting for room in the queue"))
+        if self.closed:
+            raise QueueClosed("queue is closed")
+        self.storage.enqueue(value)
+        self._wake_one(self.getters)
+
+    async def dequeue(self, timeout=None):
+        deadline = self._deadline(timeout)
+        while len(self.storage) == 0 and not self.closed:
+            await self._wait(self.getters, deadline,
+                             QueueEmpty("timed out waiting for a value"))
+        if len(self.storage) == 0:
+            raise QueueClosed("queue is closed")
+        value = self.storage.dequeue()
+        self._wake_one(self.putters)
+        return value
+
+    """
+    Closes the queue and wakes every waiting producer and consumer.
+    """
+    def close(self):
+        self.closed = True
+        for waiters in (self.getters, self.putters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
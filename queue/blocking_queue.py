@@ -0,0 +1,134 @@
+"""
+A thread-safe Queue for handing work from producer threads to
+consumer threads without polling.
+
+`dequeue` sleeps until a value is available instead of returning
+None, and `enqueue` sleeps while the queue holds
+`high_water_mark` or more values, so a slow consumer pushes back
+on its producers instead of letting the queue grow without bound.
+Both take an optional `timeout` in seconds, after which they raise
+QueueEmpty or QueueFull.
+
+`close` wakes every waiting thread. Afterwards `enqueue` raises
+QueueClosed, and `dequeue` keeps returning the values that are
+still queued before raising QueueClosed too, so consumers can use
+it as their signal to stop.
+"""
+import threading
+import time
+
+from ring_buffer_queue import QueueFull, RingBufferQueue
+
+
+class QueueEmpty(Exception):
+    pass
+
+
+class QueueClosed(Exception):
+    pass
+
+
+class BlockingQueue:
+    def __init__(self, high_water_mark=None, capacity=16):
+        self.storage = RingBufferQueue(capacity)
+        self.high_water_mark = high_water_mark
+        self.closed = False
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        return len(self.storage)
+
+    def _has_room(self):
+        return (self.closed or self.high_water_mark is None or
+                len(self.storage) < self.high_water_mark)
+
+    def _has_values(self):
+        return self.closed or len(self.storage) > 0
+
+    def _wait(self, condition, predicate, deadline, error):
+        timeout = None
+        if deadline is not None:
+            timeout = max(0, deadline - time.monotonic())
+        if not condition.wait_for(predicate, timeout):
+            raise error
+
+    @staticmethod
+    def _deadline(timeout):
+        return None if timeout is None else time.monotonic() + timeout
+
+    def enqueue(self, value, timeout=None):
+        with self.not_full:
+            self._wait(self.not_full, self._has_room, self._deadline(timeout),
+                       QueueFull("timed out waiting for room in the queue"))
+            if self.closed:
+                raise QueueClosed("queue is closed")
+            self.storage.enqueue(value)
+            self.not_empty.notify()
+
+    def dequeue(self, timeout=None):
+        with self.not_empty:
+            self._wait(self.not_empty, self._has_values,
+                       self._deadline(timeout),
+                       QueueEmpty("timed out waiting for a value"))
+            if len(self.storage) == 0:
+                raise QueueClosed("queue is closed")
+            value = self.storage.dequeue()
+            self.not_full.notify()
+            return value
+
+    """
+    Adds every value of the iterable, waiting for room whenever
+    the queue reaches its high-water mark. Consumers are woken as
+    soon as each batch is added, so if the timeout runs out part
+    of the values may already be queued; the QueueFull's `added`
+    attribute says how many.
+    """
+    def enqueue_many(self, values, timeout=None):
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        deadline = self._deadline(timeout)
+        added = 0
+        with self.not_full:
+            while added < len(values):
+                try:
+                    self._wait(self.not_full, self._has_room, deadline,
+                               QueueFull("timed out waiting for room in the "
+                                         "queue"))
+                except QueueFull as error:
+                    error.added = added
+                    raise
+                if self.closed:
+                    raise QueueClosed("queue is closed")
+                room = len(values) - added
+                if self.high_water_mark is not None:
+                    room = min(room, self.high_water_mark - len(self.storage))
+                self.storage.enqueue_many(values[added:added + room])
+                added += room
+                self.not_empty.notify_all()
+
+    """
+    Waits until at least one value is available, then removes and
+    returns up to `count` values as a list (all of them if count
+    is None).
+    """
+    def dequeue_many(self, count=None, timeout=None):
+        with self.not_empty:
+            self._wait(self.not_empty, self._has_values,
+                       self._deadline(timeout),
+                       QueueEmpty("timed out waiting for a value"))
+            if len(self.storage) == 0:
+                raise QueueClosed("queue is closed")
+            values = self.storage.dequeue_many(count)
+            self.not_full.notify_all()
+            return values
+
+    """
+    Closes the queue and wakes every waiting producer and consumer.
+    """
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
@@ -13,13 +13,17 @@ return elements in First In First Out order.
 class Queue:
     def __init__(self):
         self.size = 0
-        # self.storage = ?
+        self.storage = []
     
     def __len__(self):
-        pass
+        return self.size
 
     def enqueue(self, value):
-        pass
+        self.storage.append(value)
+        self.size += 1
 
     def dequeue(self):
-        pass
\ No newline at end of file
+        if self.size == 0:
+            return None
+        self.size -= 1
+        return self.storage.pop(0)
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+A Queue backed by a circular buffer: a preallocated list of slots
+plus the index of the front element. Enqueueing writes into the
+slot after the back element and dequeueing reads the front slot
+and advances the index, wrapping around at the end of the list.
+Neither operation moves other elements or allocates, unlike
+`list.pop(0)` or a linked list node per element.
+
+What happens when the buffer is full depends on `on_full`:
+
+* 'grow' (the default) doubles the buffer.
+* 'drop' discards the new elements; `enqueue` returns False and
+  `enqueue_many` returns how many elements it kept.
+* 'raise' raises QueueFull and leaves the queue unchanged.
+* 'block' waits until another thread dequeues enough elements,
+  raising QueueFull if `timeout` seconds pass first. A batch from
+  `enqueue_many` goes in as room appears, so part of it may
+  already be queued when that happens; the exception's `added`
+  attribute says how many values were.
+"""
+import threading
+import time
+
+
+class QueueFull(Exception):
+    # how many values of a batch were enqueued before the error
+    added = 0
+
+
+ON_FULL_MODES = ('grow', 'drop', 'raise', 'block')
+
+
+class RingBufferQueue:
+    def __init__(self, capacity=16, on_full='grow'):
+        if on_full not in ON_FULL_MODES:
+            raise ValueError(f"on_full must be one of {ON_FULL_MODES}")
+        self.storage = [None] * max(1, capacity)
+        self.front = 0
+        self.size = 0
+        self.on_full = on_full
+        # only a blocking queue is shared between threads
+        self.not_full = threading.Condition() if on_full == 'block' else None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def capacity(self):
+        return len(self.storage)
+
+    def enqueue(self, value, timeout=None):
+        if self.not_full is not None:
+            with self.not_full:
+                self._wait_for_space(1, timeout)
+                self._put(value)
+            return True
+        if self.size == len(self.storage):
+            if self.on_full == 'grow':
+                self._resize(2 * len(self.storage))
+            elif self.on_full == 'drop':
+                return False
+            else:
+                raise QueueFull("queue is full")
+        self._put(value)
+        return True
+
+    def dequeue(self):
+        if self.not_full is not None:
+            with self.not_full:
+                if self.size == 0:
+                    return None
+                self.not_full.notify()
+                return self._take()
+        if self.size == 0:
+            return None
+        return self._take()
+
+    """
+    Adds every value of the iterable to the back of the queue
+    using at most two slice assignments, and returns the number
+    of values added.
+    """
+    def enqueue_many(self, values, timeout=None):
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        count = len(values)
+        if self.not_full is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            added = 0
+            with self.not_full:
+                while added < count:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = max(0, deadline - time.monotonic())
+                    try:
+                        self._wait_for_space(1, remaining)
+                    except QueueFull as error:
+                        error.added = added
+                        raise
+                    chunk = min(count - added, len(self.storage) - self.size)
+                    self._write(values, added, chunk)
+                    added += chunk
+            return added
+        free = len(self.storage) - self.size
+        if count > free:
+            if self.on_full == 'grow':
+                capacity = len(self.storage)
+                while capacity - self.size < count:
+                    capacity *= 2
+                self._resize(capacity)
+            elif self.on_full == 'drop':
+                count = free
+            else:
+                raise QueueFull(f"queue has room for {free} more values")
+        self._write(values, 0, count)
+        return count
+
+    """
+    Removes and returns up to `count` values from the front of
+    the queue as a list, or every value if count is None.
+    """
+    def dequeue_many(self, count=None):
+        if self.not_full is not None:
+            with self.not_full:
+                values = self._take_many(count)
+                if values:
+                    self.not_full.notify_all()
+                return values
+        return self._take_many(count)
+
+    def _put(self, value):
+        self.storage[(self.front + self.size) % len(self.storage)] = value
+        self.size += 1
+
+    def _take(self):
+        value = self.storage[self.front]
+        self.storage[self.front] = None
+        self.front = (self.front + 1) % len(self.storage)
+        self.size -= 1
+        return value
+
+    def _take_many(self, count):
+        if count is None or count > self.size:
+            count = self.size
+        storage = self.storage
+        capacity = len(storage)
+        front = self.front
+        first = min(count, capacity - front)
+        values = storage[front:front + first]
+        storage[front:front + first] = [None] * first
+        rest = count - first
+        if rest:
+            values += storage[:rest]
+            storage[:rest] = [None] * rest
+        self.front = (front + count) % capacity
+        self.size -= count
+        return values
+
+    """Copies values[start:start + count] to the back of the
+    buffer, which must have room for them."""
+    def _write(self, values, start, count):
+        storage = self.storage
+        capacity = len(storage)
+        back = (self.front + self.size) % capacity
+        first = min(count, capacity - back)
+        storage[back:back + first] = values[start:start + first]
+        rest = count - first
+        if rest:
+            storage[:rest] = values[start + first:start + count]
+        self.size += count
+
+    """Moves the values into a new buffer of the given capacity,
+    starting at index 0."""
+    def _resize(self, capacity):
+        values = self._take_many(None)
+        self.storage = values + [None] * (capacity - len(values))
+        self.front = 0
+        self.size = len(values)
+
+    def _wait_for_space(self, needed, timeout):
+        if not self.not_full.wait_for(
+                lambda: len(self.storage) - self.size >= needed, timeout):
+            raise QueueFull("timed out waiting for room in the queue")
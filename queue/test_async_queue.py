@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from async_queue import AsyncQueue
+from blocking_queue import QueueClosed, QueueEmpty
+from ring_buffer_queue import QueueFull
+
+
+class AsyncQueueTests(unittest.TestCase):
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_dequeue_respects_order(self):
+        async def main():
+            q = AsyncQueue()
+            for value in (100, 101, 105):
+                await q.enqueue(value)
+            self.assertEqual(len(q), 3)
+            return [await q.dequeue() for _ in range(3)]
+
+        self.assertEqual(self.run_async(main()), [100, 101, 105])
+
+    def test_timeouts(self):
+        async def main():
+            q = AsyncQueue(high_water_mark=1)
+            with self.assertRaises(QueueEmpty):
+                await q.dequeue(timeout=0.01)
+            await q.enqueue(1)
+            with self.assertRaises(QueueFull):
+                await q.enqueue(2, timeout=0.01)
+            self.assertEqual(len(q.putters), 0)
+
+        self.run_async(main())
+
+    def test_producer_consumer_with_backpressure(self):
+        async def main():
+            q = AsyncQueue(high_water_mark=3)
+            consumed = []
+
+            async def producer():
+                for value in range(20):
+                    await q.enqueue(value)
+                    self.assertLessEqual(len(q), 3)
+                q.close()
+
+            async def consumer():
+                try:
+                    while True:
+                        consumed.append(await q.dequeue())
+                        await asyncio.sleep(0)
+                except QueueClosed:
+                    pass
+
+            await asyncio.gather(producer(), consumer())
+            return consumed
+
+        self.assertEqual(self.run_async(main()), list(range(20)))
+
+    def test_close_wakes_every_waiter(self):
+        async def main():
+            q = AsyncQueue()
+            waiters = [asyncio.ensure_future(q.dequeue()) for _ in range(3)]
+            await asyncio.sleep(0)
+            q.close()
+            return await asyncio.gather(*waiters, return_exceptions=True)
+
+        results = self.run_async(main())
+        self.assertTrue(all(isinstance(r, QueueClosed) for r in results))
+
+    def test_cancelled_waiter_passes_on_wakeup(self):
+        async def main():
+            q = AsyncQueue()
+            first = asyncio.ensure_future(q.dequeue())
+            second = asyncio.ensure_future(q.dequeue())
+            await asyncio.sleep(0)
+            await q.enqueue('value')
+            first.cancel()
+            return await asyncio.wait_for(second, 1)
+
+        self.assertEqual(self.run_async(main()), 'value')
+
+    def test_timeout_is_a_deadline_across_wakeups(self):
+        async def main():
+            q = AsyncQueue(high_water_mark=1)
+
+            async def steal():
+                # wake the waiting consumer and then take the value
+                # before it runs, so it has to wait again
+                while True:
+                    await q.enqueue('value')
+                    q.storage.dequeue()
+                    await asyncio.sleep(0.01)
+
+            thief = asyncio.ensure_future(steal())
+            try:
+                with self.assertRaises(QueueEmpty):
+                    await asyncio.wait_for(q.dequeue(timeout=0.05), 1)
+            finally:
+                thief.cancel()
+
+        self.run_async(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
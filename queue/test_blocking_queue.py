@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from blocking_queue import BlockingQueue, QueueClosed, QueueEmpty
+from ring_buffer_queue import QueueFull
+
+
+class BlockingQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = BlockingQueue(high_water_mark=2)
+
+    def test_dequeue_respects_order(self):
+        self.q.enqueue(100)
+        self.q.enqueue(101)
+        self.assertEqual(len(self.q), 2)
+        self.assertEqual(self.q.dequeue(), 100)
+        self.assertEqual(self.q.dequeue(), 101)
+        self.assertEqual(len(self.q), 0)
+
+    def test_timeouts(self):
+        with self.assertRaises(QueueEmpty):
+            self.q.dequeue(timeout=0.01)
+        self.q.enqueue_many([1, 2])
+        with self.assertRaises(QueueFull):
+            self.q.enqueue(3, timeout=0.01)
+
+    def test_enqueue_many_timeout_reports_partial_batch(self):
+        self.q.enqueue(0)
+        with self.assertRaises(QueueFull) as raised:
+            self.q.enqueue_many([1, 2, 3], timeout=0.01)
+        self.assertEqual(raised.exception.added, 1)
+        self.assertEqual(self.q.dequeue_many(), [0, 1])
+
+    def test_dequeue_waits_for_producer(self):
+        timer = threading.Timer(0.02, self.q.enqueue, args=('late',))
+        timer.start()
+        self.assertEqual(self.q.dequeue(timeout=5), 'late')
+        timer.join()
+
+    def test_backpressure_between_threads(self):
+        consumed = []
+
+        def consumer():
+            try:
+                while True:
+                    consumed.extend(self.q.dequeue_many(timeout=5))
+                    self.assertLessEqual(len(self.q), 2)
+            except QueueClosed:
+                pass
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        for value in range(50):
+            self.q.enqueue(value, timeout=5)
+        self.q.enqueue_many(range(50, 100), timeout=5)
+        while len(self.q):
+            time.sleep(0.001)
+        self.q.close()
+        thread.join(5)
+        self.assertEqual(consumed, list(range(100)))
+
+    def test_close_wakes_waiters_and_drains(self):
+        errors = []
+
+        def waiter():
+            try:
+                empty.dequeue(timeout=5)
+            except QueueClosed as error:
+                errors.append(error)
+
+        empty = BlockingQueue()
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.02)
+        empty.close()
+        thread.join(5)
+        self.assertEqual(len(errors), 1)
+
+        self.q.enqueue(1)
+        self.q.close()
+        with self.assertRaises(QueueClosed):
+            self.q.enqueue(2)
+        self.assertEqual(self.q.dequeue(), 1)
+        with self.assertRaises(QueueClosed):
+            self.q.dequeue()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import unittest
+from ring_buffer_queue import QueueFull, RingBufferQueue
+
+
+class RingBufferQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = RingBufferQueue(capacity=4)
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(len(self.q), 0)
+
+    def test_dequeue_respects_order_across_wraparound(self):
+        for value in range(3):
+            self.q.enqueue(value)
+        self.assertEqual(self.q.dequeue(), 0)
+        self.assertEqual(self.q.dequeue(), 1)
+        for value in range(3, 6):
+            self.q.enqueue(value)
+        self.assertEqual(self.q.capacity, 4)
+        self.assertEqual([self.q.dequeue() for _ in range(4)], [2, 3, 4, 5])
+        self.assertIsNone(self.q.dequeue())
+
+    def test_grows_by_doubling(self):
+        self.q.dequeue()
+        self.q.enqueue_many([0, 1, 2])
+        self.q.dequeue()
+        for value in range(3, 8):
+            self.q.enqueue(value)
+        self.assertEqual(self.q.capacity, 8)
+        self.assertEqual(len(self.q), 7)
+        self.q.enqueue_many(range(8, 20))
+        self.assertEqual(self.q.capacity, 32)
+        self.assertEqual(self.q.dequeue_many(), list(range(1, 20)))
+
+    def test_batch_operations(self):
+        self.q.enqueue_many([1, 2, 3])
+        self.assertEqual(self.q.dequeue_many(2), [1, 2])
+        self.assertEqual(self.q.enqueue_many((4, 5, 6)), 3)
+        self.assertEqual(self.q.dequeue_many(10), [3, 4, 5, 6])
+        self.assertEqual(self.q.dequeue_many(), [])
+        self.assertEqual(self.q.storage, [None] * 4)
+
+    def test_drop_when_full(self):
+        q = RingBufferQueue(capacity=2, on_full='drop')
+        self.assertTrue(q.enqueue(1))
+        self.assertTrue(q.enqueue(2))
+        self.assertFalse(q.enqueue(3))
+        q.dequeue()
+        self.assertEqual(q.enqueue_many([4, 5, 6]), 1)
+        self.assertEqual(q.dequeue_many(), [2, 4])
+
+    def test_raise_when_full(self):
+        q = RingBufferQueue(capacity=2, on_full='raise')
+        q.enqueue_many([1])
+        with self.assertRaises(QueueFull):
+            q.enqueue_many([2, 3])
+        self.assertEqual(len(q), 1)
+        q.enqueue(2)
+        with self.assertRaises(QueueFull):
+            q.enqueue(3)
+
+    def test_block_when_full(self):
+        q = RingBufferQueue(capacity=2, on_full='block')
+        q.enqueue_many([1, 2])
+        with self.assertRaises(QueueFull):
+            q.enqueue(3, timeout=0.01)
+
+        consumed = []
+
+        def consumer():
+            while len(consumed) < 6:
+                value = q.dequeue()
+                if value is not None:
+                    consumed.append(value)
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        q.enqueue(3, timeout=5)
+        q.enqueue_many([4, 5, 6], timeout=5)
+        thread.join(5)
+        self.assertEqual(consumed, [1, 2, 3, 4, 5, 6])
+
+    def test_block_timeout_reports_partial_batch(self):
+        q = RingBufferQueue(capacity=3, on_full='block')
+        q.enqueue(0)
+        with self.assertRaises(QueueFull) as raised:
+            q.enqueue_many([1, 2, 3, 4], timeout=0.01)
+        self.assertEqual(raised.exception.added, 2)
+        self.assertEqual(q.dequeue_many(), [0, 1, 2])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            RingBufferQueue(on_full='overwrite')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from array import array
+from typed_queue import TypedQueue, numpy
+
+
+class TypedQueueTestsMixin:
+    backend = None
+
+    def setUp(self):
+        self.q = TypedQueue('d', backend=self.backend, capacity=2)
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(len(self.q), 0)
+
+    def test_dequeue_respects_order(self):
+        for value in (100, 101, 105):
+            self.q.enqueue(value)
+        self.assertEqual(len(self.q), 3)
+        self.assertEqual(self.q.dequeue(), 100.0)
+        self.assertEqual(len(self.q), 2)
+        self.assertEqual(self.q.dequeue(), 101.0)
+        self.assertEqual(self.q.dequeue(), 105.0)
+        self.assertIsNone(self.q.dequeue())
+
+    def test_batch_operations_and_compaction(self):
+        self.q.enqueue_many(array('d', range(10)))
+        self.assertEqual(self.q.dequeue_many(6).tolist(), list(range(6)))
+        self.q.enqueue_many([10, 11])
+        self.assertEqual(len(self.q), 6)
+        self.assertEqual(self.q.front, 0)
+        with self.q.view() as view:
+            self.assertEqual(view.tolist(), [6, 7, 8, 9, 10, 11])
+        self.assertEqual(self.q.dequeue_many(100).tolist(),
+                         [6, 7, 8, 9, 10, 11])
+        self.assertEqual(len(self.q), 0)
+
+
+class ArrayTypedQueueTests(TypedQueueTestsMixin, unittest.TestCase):
+    backend = 'array'
+
+    def test_enqueue_many_converts_mismatched_buffers(self):
+        self.q.enqueue_many(array('q', [1, 2]))
+        self.q.enqueue_many(b'')
+        self.assertEqual(self.q.dequeue_many(2).tolist(), [1.0, 2.0])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyTypedQueueTests(TypedQueueTestsMixin, unittest.TestCase):
+    backend = 'numpy'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+A Queue of plain numbers stored unboxed in a typed buffer instead
+of as Python objects, the queue counterpart of TypedStack.
+
+`dtype` is an `array` module type code such as 'i' (C int), 'q'
+(64-bit int) or 'd' (double). The 'array' backend appends to an
+`array.array` and advances a front index on dequeue. Once more
+than half of the array has been dequeued, it deletes that dead
+prefix in one block, so dequeueing is amortized O(1). The 'numpy'
+backend does the same in a preallocated NumPy array that doubles
+when it fills up, and needs NumPy to be installed.
+
+`enqueue_many` copies buffer-protocol objects with a matching item
+type in one block. `view()` returns a zero-copy memoryview of the
+queued values from front to back. With the 'array' backend the
+queue cannot be modified while a view is alive (Python raises
+BufferError), so release views before enqueueing or dequeueing.
+"""
+from array import array
+
+from typed_buffer import KINDS, matching_bytes, numpy, require_numpy
+
+
+class TypedQueue:
+    def __init__(self, dtype='d', backend='array', capacity=16):
+        if dtype not in KINDS:
+            raise ValueError(f"unsupported dtype: {dtype!r}")
+        if backend not in ('array', 'numpy'):
+            raise ValueError(f"unknown backend: {backend!r}")
+        self.dtype = dtype
+        self.backend = backend
+        self.front = 0
+        # one past the last value in storage
+        self.back = 0
+        if backend == 'numpy':
+            require_numpy()
+            self.storage = numpy.empty(max(1, capacity), dtype=dtype)
+        else:
+            self.storage = array(dtype)
+
+    def __len__(self):
+        return self.back - self.front
+
+    def enqueue(self, value):
+        if self.backend == 'numpy':
+            self._reserve(1)
+            self.storage[self.back] = value
+        else:
+            self.storage.append(value)
+        self.back += 1
+
+    def dequeue(self):
+        if self.front == self.back:
+            return None
+        value = self.storage[self.front]
+        self.front += 1
+        self._compact()
+        return value.item() if self.backend == 'numpy' else value
+
+    """
+    Adds every value of the iterable to the back of the queue,
+    copying buffers with a matching item type in one block.
+    """
+    def enqueue_many(self, values):
+        if self.backend == 'numpy':
+            values = numpy.asarray(values, dtype=self.dtype).ravel()
+            self._reserve(len(values))
+            self.storage[self.back:self.back + len(values)] = values
+            self.back += len(values)
+            return
+        block = matching_bytes(values, self.dtype)
+        if block is not None:
+            self.storage.frombytes(block)
+        else:
+            # iterating converts arrays of a different type code too
+            self.storage.extend(iter(values))
+        self.back = len(self.storage)
+
+    """
+    Removes up to `count` values from the front of the queue and
+    returns them as an array of the queue's dtype.
+    """
+    def dequeue_many(self, count):
+        count = min(count, len(self))
+        values = array(self.dtype, self.storage[self.front:self.front + count])
+        self.front += count
+        self._compact()
+        return values
+
+    """Returns a memoryview of the queued values, front to back."""
+    def view(self):
+        return memoryview(self.storage)[self.front:self.back]
+
+    """Drops the dequeued prefix once it makes up more than half
+    of the storage."""
+    def _compact(self):
+        if self.front == self.back:
+            self.front = self.back = 0
+            if self.backend == 'array':
+                del self.storage[:]
+        elif self.front > len(self.storage) // 2:
+            if self.backend == 'array':
+                del self.storage[:self.front]
+            else:
+                count = self.back - self.front
+                self.storage[:count] = self.storage[self.front:self.back]
+            self.back -= self.front
+            self.front = 0
+
+    def _reserve(self, count):
+        if self.back + count <= len(self.storage):
+            return
+        length = self.back - self.front
+        capacity = len(self.storage)
+        while capacity < length + count:
+            capacity *= 2
+        grown = numpy.empty(capacity, dtype=self.dtype)
+        grown[:length] = self.storage[self.front:self.back]
+        self.storage = grown
+        self.front = 0
+        self.back = length
@@ -0,0 +1,124 @@
+"""
+A sorted list of values stored as a list of short sorted lists
+("chunks"), in the style of the sortedcontainers package.
+
+Binary trees such as BSTNode and AVLSet follow one object reference
+per level, and in CPython each step costs an attribute lookup and a
+Python-level comparison. Here the values live in ordinary lists, so
+almost all of the work is done by C code. `bisect` over `maxes`
+(the largest value of each chunk) picks the chunk, `bisect` inside
+the chunk finds the position, and `list.insert` shifts at most
+`2 * load` references.
+
+A chunk that grows past twice the load factor is split in half, and
+an empty chunk is dropped. With the default load of 1000, a million
+values fit in about a thousand chunks, so every operation is two
+short binary searches plus a small memmove.
+
+Duplicate values are allowed, as in BSTNode.
+"""
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedList:
+    def __init__(self, iterable=(), load=1000):
+        self.load = load
+        self.chunks = []
+        # maxes[i] is the largest value in chunks[i]
+        self.maxes = []
+        values = sorted(iterable)
+        for start in range(0, len(values), load):
+            chunk = values[start:start + load]
+            self.chunks.append(chunk)
+            self.maxes.append(chunk[-1])
+        self.size = len(values)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def insert(self, value):
+        maxes = self.maxes
+        if not maxes:
+            self.chunks.append([value])
+            maxes.append(value)
+            self.size = 1
+            return
+        index = bisect_right(maxes, value)
+        if index == len(maxes):
+            # larger than everything: append to the last chunk
+            index -= 1
+            self.chunks[index].append(value)
+            maxes[index] = value
+        else:
+            insort(self.chunks[index], value)
+        self.size += 1
+        chunk = self.chunks[index]
+        if len(chunk) > 2 * self.load:
+            half = len(chunk) // 2
+            self.chunks.insert(index + 1, chunk[half:])
+            del chunk[half:]
+            maxes.insert(index, chunk[-1])
+
+    """Removes one occurrence of the value, raising ValueError if it
+    is missing."""
+    def delete(self, value):
+        maxes = self.maxes
+        index = bisect_left(maxes, value)
+        if index < len(maxes):
+            chunk = self.chunks[index]
+            position = bisect_left(chunk, value)
+            if chunk[position] == value:
+                del chunk[position]
+                self.size -= 1
+                if not chunk:
+                    del self.chunks[index]
+                    del maxes[index]
+                elif position == len(chunk):
+                    maxes[index] = chunk[-1]
+                return
+        raise ValueError(f"{value!r} is not in the list")
+
+    def contains(self, value):
+        maxes = self.maxes
+        index = bisect_left(maxes, value)
+        if index == len(maxes):
+            return False
+        chunk = self.chunks[index]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def get_max(self):
+        return self.maxes[-1] if self.maxes else None
+
+    def for_each(self, fn):
+        for chunk in self.chunks:
+            for value in chunk:
+                fn(value)
+
+    """
+    Yields the values v with lo <= v < hi, from low to high. Whole
+    chunks are yielded by slicing, so the cost is two binary
+    searches plus the values yielded.
+    """
+    def range(self, lo, hi):
+        maxes = self.maxes
+        chunks = self.chunks
+        index = bisect_left(maxes, lo)
+        if index == len(maxes):
+            return
+        start = bisect_left(chunks[index], lo)
+        while index < len(chunks):
+            chunk = chunks[index]
+            if maxes[index] < hi:
+                yield from chunk[start:]
+            else:
+                yield from chunk[start:bisect_left(chunk, hi)]
+                return
+            index += 1
+            start = 0
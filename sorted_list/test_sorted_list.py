@@ -0,0 +1,57 @@
+import random
+import unittest
+from sorted_list import SortedList
+
+
+class SortedListTests(unittest.TestCase):
+    def setUp(self):
+        self.list = SortedList(load=4)
+
+    def test_insert_contains_and_get_max(self):
+        self.assertIsNone(self.list.get_max())
+        self.assertFalse(self.list.contains(3))
+        for value in [5, 2, 8, 2, 9, 1, 7, 3, 6]:
+            self.list.insert(value)
+        self.assertEqual(list(self.list), [1, 2, 2, 3, 5, 6, 7, 8, 9])
+        self.assertEqual(len(self.list), 9)
+        self.assertTrue(self.list.contains(3))
+        self.assertFalse(self.list.contains(4))
+        self.assertNotIn(10, self.list)
+        self.assertEqual(self.list.get_max(), 9)
+        arr = []
+        self.list.for_each(arr.append)
+        self.assertEqual(arr, [1, 2, 2, 3, 5, 6, 7, 8, 9])
+
+    def test_matches_sorted_list_under_random_operations(self):
+        rng = random.Random(0)
+        contents = []
+        for _ in range(3000):
+            value = rng.randrange(200)
+            if rng.random() < 0.6:
+                self.list.insert(value)
+                contents.append(value)
+                contents.sort()
+            elif value in contents:
+                self.list.delete(value)
+                contents.remove(value)
+            else:
+                with self.assertRaises(ValueError):
+                    self.list.delete(value)
+            self.assertEqual(self.list.contains(value), value in contents)
+            lo, hi = sorted(rng.randrange(-5, 205) for _ in range(2))
+            self.assertEqual(list(self.list.range(lo, hi)),
+                             [v for v in contents if lo <= v < hi])
+        self.assertEqual(list(self.list), contents)
+        self.assertTrue(all(len(chunk) <= 8 for chunk in self.list.chunks))
+        self.assertEqual(self.list.maxes,
+                         [chunk[-1] for chunk in self.list.chunks])
+
+    def test_build_from_iterable(self):
+        values = SortedList([3, 1, 2, 5, 4], load=2)
+        self.assertEqual(list(values), [1, 2, 3, 4, 5])
+        self.assertEqual(list(values.range(2, 5)), [2, 3, 4])
+        self.assertEqual(values.get_max(), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from array import array
+from typed_stack import TypedStack, numpy
+
+
+class TypedStackTestsMixin:
+    backend = None
+
+    def setUp(self):
+        self.stack = TypedStack('q', backend=self.backend, capacity=2)
+
+    def test_empty_pop(self):
+        self.assertIsNone(self.stack.pop())
+        self.assertEqual(len(self.stack), 0)
+
+    def test_pop_respects_order(self):
+        for value in (100, 101, 105):
+            self.stack.push(value)
+        self.assertEqual(len(self.stack), 3)
+        self.assertEqual(self.stack.pop(), 105)
+        self.assertEqual(self.stack.pop(), 101)
+        self.assertEqual(self.stack.pop(), 100)
+        self.assertIsNone(self.stack.pop())
+
+    def test_push_many_from_buffers_and_iterables(self):
+        self.stack.push_many(array('q', [1, 2, 3]))
+        self.stack.push_many([4, 5])
+        self.stack.push_many(range(6, 8))
+        self.assertEqual(len(self.stack), 7)
+        self.assertEqual(self.stack.pop_many(3).tolist(), [7, 6, 5])
+        self.assertEqual(self.stack.pop(), 4)
+
+    def test_view_is_zero_copy(self):
+        self.stack.push_many([1, 2, 3])
+        with self.stack.view() as view:
+            self.assertEqual(view.tolist(), [1, 2, 3])
+            self.assertEqual(view.nbytes, 3 * view.itemsize)
+
+
+class ArrayTypedStackTests(TypedStackTestsMixin, unittest.TestCase):
+    backend = 'array'
+
+    def test_push_many_converts_mismatched_buffers(self):
+        stack = TypedStack('d')
+        stack.push_many(array('i', [1, 2]))
+        stack.push_many(array('d', [2.5]))
+        self.assertEqual(stack.pop_many(3).tolist(), [2.5, 2.0, 1.0])
+
+    def test_view_blocks_resizing(self):
+        self.stack.push(1)
+        view = self.stack.view()
+        with self.assertRaises(BufferError):
+            self.stack.push(2)
+        view.release()
+        self.stack.push(2)
+        self.assertEqual(len(self.stack), 2)
+
+    def test_rejects_unknown_dtype(self):
+        with self.assertRaises(ValueError):
+            TypedStack('x')
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyTypedStackTests(TypedStackTestsMixin, unittest.TestCase):
+    backend = 'numpy'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unrolled_stack import UnrolledStack
+
+
+class UnrolledStackTests(unittest.TestCase):
+    def setUp(self):
+        self.stack = UnrolledStack(chunk_size=3)
+
+    def test_empty_pop(self):
+        self.assertIsNone(self.stack.pop())
+        self.assertIsNone(self.stack.peek())
+        self.assertEqual(len(self.stack), 0)
+
+    def test_pop_respects_order(self):
+        for value in range(10):
+            self.stack.push(value)
+        self.assertEqual(len(self.stack), 10)
+        self.assertEqual(len(self.stack.chunks), 4)
+        self.assertEqual(self.stack.peek(), 9)
+        self.assertEqual([self.stack.pop() for _ in range(10)],
+                         list(range(9, -1, -1)))
+        self.assertEqual(self.stack.chunks, [])
+
+    def test_push_many_and_pop_many(self):
+        self.stack.push(0)
+        self.stack.push_many(range(1, 9))
+        self.assertEqual(self.stack.chunks, [[0, 1, 2], [3, 4, 5], [6, 7, 8]])
+        self.assertEqual(self.stack.pop_many(4), [8, 7, 6, 5])
+        self.assertEqual(len(self.stack), 5)
+        self.stack.push_many([9])
+        self.assertEqual(list(self.stack), [0, 1, 2, 3, 4, 9])
+        self.assertEqual(self.stack.pop_many(100), [9, 4, 3, 2, 1, 0])
+        self.assertEqual(len(self.stack), 0)
+
+    def test_snapshots_are_unaffected_by_later_changes(self):
+        self.stack.push_many(range(5))
+        first = self.stack.snapshot()
+        self.stack.pop()
+        self.stack.pop()
+        self.stack.pop()
+        self.stack.push('a')
+        second = self.stack.snapshot()
+        self.stack.push_many(['b', 'c', 'd'])
+        self.stack.pop_many(2)
+
+        self.assertEqual(list(first), [0, 1, 2, 3, 4])
+        self.assertEqual(len(first), 5)
+        self.assertEqual(first.peek(), 4)
+        self.assertEqual(list(second), [0, 1, 'a'])
+        self.assertEqual(list(self.stack), [0, 1, 'a', 'b'])
+
+    def test_snapshots_share_full_chunks(self):
+        self.stack.push_many(range(7))
+        snapshot = self.stack.snapshot()
+        self.stack.push(7)
+        self.assertIs(self.stack.chunks[0], snapshot.chunks[0])
+        self.assertIs(self.stack.chunks[1], snapshot.chunks[1])
+        self.assertIsNot(self.stack.chunks[2], snapshot.chunks[2])
+
+    def test_restore(self):
+        self.stack.push_many(range(4))
+        snapshot = self.stack.snapshot()
+        self.stack.pop_many(3)
+        self.stack.push('x')
+        self.stack.restore(snapshot)
+        self.assertEqual(len(self.stack), 4)
+        self.stack.push(4)
+        self.assertEqual(list(self.stack), [0, 1, 2, 3, 4])
+        self.assertEqual(list(snapshot), [0, 1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Helpers shared by TypedStack and TypedQueue, which store plain
+numbers in an `array.array` or a NumPy array.
+
+`KINDS` maps each supported `array` type code to its kind of
+number. `matching_bytes` decides whether a buffer-protocol object
+can be copied into such a buffer in one block, and `require_numpy`
+raises ImportError when the 'numpy' backend is asked for but NumPy
+is not installed (`numpy` is None then).
+
+stack/ and queue/ each hold an identical copy of this file.
+"""
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+KINDS = {}
+for _codes, _kind in (('bhilq', 'signed'), ('BHILQ', 'unsigned'),
+                      ('fd', 'float')):
+    for _code in _codes:
+        KINDS[_code] = _kind
+NATIVE_PREFIXES = '@=' + ('<' if sys.byteorder == 'little' else '>!')
+
+
+"""
+Returns the buffer behind `values` as a flat byte view if it holds
+items of the same kind and size as `dtype`, or None if the values
+have to be converted one at a time.
+"""
+def matching_bytes(values, dtype):
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    fmt = view.format
+    if fmt and fmt[0] in NATIVE_PREFIXES:
+        fmt = fmt[1:]
+    if (KINDS.get(fmt) != KINDS[dtype] or
+            view.itemsize != array(dtype).itemsize or
+            not view.c_contiguous):
+        return None
+    return view.cast('B')
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError("the 'numpy' backend requires NumPy to be installed")
@@ -0,0 +1,111 @@
+"""
+A Stack of plain numbers stored unboxed in a typed buffer instead
+of as a list of Python objects. A Python float in a list costs an
+8-byte pointer plus a 24-byte object; in an array('d') it costs 8
+bytes.
+
+`dtype` is an `array` module type code such as 'i' (C int), 'q'
+(64-bit int) or 'd' (double). The default 'array' backend stores
+the values in an `array.array`. The 'numpy' backend stores them in
+a preallocated NumPy array that doubles when it fills up, and is
+only available when NumPy is installed.
+
+`push_many` accepts any iterable. Objects that support the buffer
+protocol (array.array, bytes-like objects, NumPy arrays, memory
+views) whose item type matches `dtype` are copied in one block
+without creating a Python object per value.
+
+`view()` returns a zero-copy memoryview of the values from the
+bottom of the stack to the top. With the 'array' backend the stack
+cannot grow or shrink while a view is alive (Python raises
+BufferError), so release views, for example with a `with`
+statement, before modifying the stack. With the 'numpy' backend a
+view taken before the stack grows keeps pointing at the old
+buffer.
+"""
+from array import array
+
+from typed_buffer import KINDS, matching_bytes, numpy, require_numpy
+
+
+class TypedStack:
+    def __init__(self, dtype='d', backend='array', capacity=16):
+        if dtype not in KINDS:
+            raise ValueError(f"unsupported dtype: {dtype!r}")
+        if backend not in ('array', 'numpy'):
+            raise ValueError(f"unknown backend: {backend!r}")
+        self.dtype = dtype
+        self.backend = backend
+        self.size = 0
+        if backend == 'numpy':
+            require_numpy()
+            self.storage = numpy.empty(max(1, capacity), dtype=dtype)
+        else:
+            self.storage = array(dtype)
+
+    def __len__(self):
+        return self.size
+
+    def push(self, value):
+        if self.backend == 'numpy':
+            self._reserve(1)
+            self.storage[self.size] = value
+        else:
+            self.storage.append(value)
+        self.size += 1
+
+    def pop(self):
+        if self.size == 0:
+            return None
+        self.size -= 1
+        if self.backend == 'numpy':
+            return self.storage[self.size].item()
+        return self.storage.pop()
+
+    """
+    Pushes every value of the iterable in order, copying buffers
+    with a matching item type in one block.
+    """
+    def push_many(self, values):
+        if self.backend == 'numpy':
+            values = numpy.asarray(values, dtype=self.dtype).ravel()
+            self._reserve(len(values))
+            self.storage[self.size:self.size + len(values)] = values
+            self.size += len(values)
+            return
+        block = matching_bytes(values, self.dtype)
+        if block is not None:
+            self.storage.frombytes(block)
+        else:
+            # iterating converts arrays of a different type code too
+            self.storage.extend(iter(values))
+        self.size = len(self.storage)
+
+    """
+    Pops up to `count` values and returns them in pop order, top
+    of the stack first, as an array of the stack's dtype.
+    """
+    def pop_many(self, count):
+        count = min(count, self.size)
+        start = self.size - count
+        values = array(self.dtype, self.storage[start:self.size][::-1])
+        if self.backend == 'array':
+            del self.storage[start:]
+        self.size = start
+        return values
+
+    """Returns a memoryview of the values, bottom to top."""
+    def view(self):
+        if self.backend == 'numpy':
+            return memoryview(self.storage[:self.size])
+        return memoryview(self.storage)
+
+    def _reserve(self, count):
+        capacity = len(self.storage)
+        if self.size + count <= capacity:
+            return
+        while capacity < self.size + count:
+            capacity *= 2
+        grown = numpy.empty(capacity, dtype=self.dtype)
+        grown[:self.size] = self.storage[:self.size]
+        self.storage = grown
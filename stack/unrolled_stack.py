@@ -0,0 +1,149 @@
+"""
+An "unrolled" Stack that stores its values in fixed-size chunks:
+a list of Python lists that each hold at most `chunk_size` values,
+where every chunk but the last one is full.
+
+Growing the stack only ever appends a new small chunk, so it never
+has to reallocate and copy one large contiguous array, and each
+value costs a single slot in its chunk rather than a linked list
+node.
+
+Chunks also make snapshots cheap. `snapshot()` copies the list of
+chunk references (not the values) and marks every current chunk
+as shared. A shared chunk is never modified in place: the first
+push or pop that would change it makes a private copy first
+(copy-on-write). A snapshot therefore costs O(n / chunk_size) and
+later changes copy at most one chunk at a time. `restore()`
+brings a snapshot back the same way, which makes the stack a good
+fit for undo history with many checkpoints.
+"""
+
+
+"""
+A read-only view of an UnrolledStack's values at the moment the
+snapshot was taken.
+"""
+class StackSnapshot:
+    def __init__(self, chunks, size):
+        self.chunks = chunks
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    """Yields the values from the bottom of the stack to the top."""
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    """Returns the value that was on top of the stack, or None."""
+    def peek(self):
+        return self.chunks[-1][-1] if self.size else None
+
+
+class UnrolledStack:
+    def __init__(self, chunk_size=256):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.size = 0
+        self.chunks = []
+        # the first `shared` chunks may be referenced by snapshots
+        self.shared = 0
+
+    def __len__(self):
+        return self.size
+
+    """Yields the values from the bottom of the stack to the top."""
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    """Returns the last chunk, copying it first if a snapshot
+    shares it."""
+    def _writable_last_chunk(self):
+        index = len(self.chunks) - 1
+        if index < self.shared:
+            self.chunks[index] = list(self.chunks[index])
+            self.shared = index
+        return self.chunks[index]
+
+    def push(self, value):
+        if not self.chunks or len(self.chunks[-1]) == self.chunk_size:
+            self.chunks.append([value])
+        else:
+            self._writable_last_chunk().append(value)
+        self.size += 1
+
+    def pop(self):
+        if self.size == 0:
+            return None
+        chunk = self._writable_last_chunk()
+        value = chunk.pop()
+        if not chunk:
+            self.chunks.pop()
+            self.shared = min(self.shared, len(self.chunks))
+        self.size -= 1
+        return value
+
+    """Returns the value on top of the stack without removing it."""
+    def peek(self):
+        return self.chunks[-1][-1] if self.size else None
+
+    """
+    Pushes every value of the iterable, in order, filling the last
+    chunk and then adding whole chunks with slice copies.
+    """
+    def push_many(self, values):
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        count = len(values)
+        if count == 0:
+            return
+        start = 0
+        if self.chunks and len(self.chunks[-1]) < self.chunk_size:
+            chunk = self._writable_last_chunk()
+            start = min(count, self.chunk_size - len(chunk))
+            chunk.extend(values[:start])
+        for offset in range(start, count, self.chunk_size):
+            self.chunks.append(list(values[offset:offset + self.chunk_size]))
+        self.size += count
+
+    """
+    Pops up to `count` values and returns them as a list in the
+    order they would have been popped, top of the stack first.
+    Whole chunks are detached without being copied.
+    """
+    def pop_many(self, count):
+        count = min(count, self.size)
+        values = []
+        remaining = count
+        while remaining:
+            chunk = self.chunks[-1]
+            if len(chunk) <= remaining:
+                self.chunks.pop()
+                self.shared = min(self.shared, len(self.chunks))
+                values.extend(reversed(chunk))
+                remaining -= len(chunk)
+            else:
+                chunk = self._writable_last_chunk()
+                taken = chunk[-remaining:]
+                del chunk[-remaining:]
+                values.extend(reversed(taken))
+                remaining = 0
+        self.size -= count
+        return values
+
+    """
+    Returns a StackSnapshot of the current values that stays
+    unchanged however the stack is modified afterwards.
+    """
+    def snapshot(self):
+        self.shared = len(self.chunks)
+        return StackSnapshot(tuple(self.chunks), self.size)
+
+    """Replaces the stack's values with those of the snapshot."""
+    def restore(self, snapshot):
+        self.chunks = list(snapshot.chunks)
+        self.size = snapshot.size
+        self.shared = len(self.chunks)